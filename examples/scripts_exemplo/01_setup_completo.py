@@ -13,48 +13,36 @@ Execute: python 01_setup_completo.py
 
 import sys
 import os
-import subprocess
 import shutil
 from pathlib import Path
 
+# Caminhos usados pelo exemplo
+BASE_DIR = Path(__file__).resolve().parents[2]
+DADOS_DIR = BASE_DIR / "examples" / "dados_teste"
+CAMPEONATO_DIR = Path("Campeonatos/Copa-Exemplo-2025")
+
+# Subdiretórios esperados no campeonato e o arquivo principal de cada um
+SUBDIRS_ESPERADOS = (
+    ("Regras", "regras.json"),
+    ("Tabela", "tabela.json"),
+    ("Resultados", None),
+    ("Participantes", None),
+)
+
 # Adicionar src ao path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.append(str(BASE_DIR / "src"))
 
-def executar_comando(comando, descricao):
-    """Executa um comando e exibe o resultado"""
-    print(f"\n{'='*60}")
-    print(f"EXECUTANDO: {descricao}")
-    print(f"COMANDO: {' '.join(comando)}")
-    print('='*60)
-    
-    try:
-        result = subprocess.run(comando, capture_output=True, text=True, cwd=os.getcwd())
-        
-        if result.stdout:
-            print("SAÍDA:")
-            print(result.stdout)
-        
-        if result.stderr:
-            print("ERROS/AVISOS:")
-            print(result.stderr)
-            
-        if result.returncode != 0:
-            print(f"ERRO: Comando falhou com código {result.returncode}")
-            return False
-        else:
-            print("✅ SUCESSO!")
-            return True
-            
-    except Exception as e:
-        print(f"ERRO ao executar comando: {e}")
-        return False
+from scripts.criar_campeonato import main as criar_campeonato
+from scripts.gerar_regras import main as gerar_regras
+from scripts.criar_participantes import main as criar_participantes
+from scripts.importar_tabela import main as importar_tabela
+from comum import executar_comando
 
 def limpar_campeonato_anterior():
     """Remove campeonato anterior se existir"""
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    if campeonato_dir.exists():
-        print(f"\n🧹 Removendo campeonato anterior: {campeonato_dir}")
-        shutil.rmtree(campeonato_dir)
+    if CAMPEONATO_DIR.exists():
+        print(f"\n🧹 Removendo campeonato anterior: {CAMPEONATO_DIR}")
+        shutil.rmtree(CAMPEONATO_DIR)
         print("✅ Campeonato anterior removido")
 
 def main():
@@ -66,14 +54,8 @@ def main():
     # Limpar campeonato anterior
     limpar_campeonato_anterior()
     
-    # Definir caminhos
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
     # 1. Criar campeonato
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "criar_campeonato.py"),
+    sucesso = executar_comando(criar_campeonato, [
         "--nome", "Copa-Exemplo-2025",
         "--temporada", "2025",
         "--codigo", "CEX25"
@@ -84,29 +66,27 @@ def main():
         return
     
     # 2. Gerar regras
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "gerar_regras.py"),
-        "--campeonato", "Copa-Exemplo-2025"
+    sucesso = executar_comando(gerar_regras, [
+        "--campeonato", "Copa-Exemplo-2025",
+        "--sobrescrever"
     ], "Geração das regras de pontuação")
     
     if not sucesso:
         print("❌ Falha na geração das regras. Continuando...")
     
     # 3. Criar participantes (arquivo texto)
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "criar_participantes.py"),
+    sucesso = executar_comando(criar_participantes, [
         "--campeonato", "Copa-Exemplo-2025",
-        "--arquivo", str(dados_dir / "participantes.txt")
+        "--arquivo", str(DADOS_DIR / "participantes.txt")
     ], "Criação de participantes (arquivo texto)")
     
     if not sucesso:
         print("❌ Falha na criação de participantes. Continuando...")
     
     # 4. Importar tabela de jogos
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "importar_tabela.py"),
+    sucesso = executar_comando(importar_tabela, [
         "--campeonato", "Copa-Exemplo-2025",
-        "--arquivo", str(dados_dir / "tabela_jogos.txt")
+        "--arquivo", str(DADOS_DIR / "tabela_jogos.txt")
     ], "Importação da tabela de jogos")
     
     if not sucesso:
@@ -117,40 +97,38 @@ def main():
     print("VERIFICANDO ESTRUTURA CRIADA")
     print('='*60)
     
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    if campeonato_dir.exists():
-        print(f"✅ Diretório do campeonato criado: {campeonato_dir}")
+    if CAMPEONATO_DIR.exists():
+        print(f"✅ Diretório do campeonato criado: {CAMPEONATO_DIR}")
+        
+        # Uma única leitura do diretório do campeonato para todos os subdiretórios
+        with os.scandir(CAMPEONATO_DIR) as entradas:
+            presentes = {e.name: e for e in entradas if e.is_dir()}
         
-        # Verificar subdiretórios
-        subdirs = ["Regras", "Tabela", "Resultados", "Participantes"]
-        for subdir in subdirs:
-            subdir_path = campeonato_dir / subdir
-            if subdir_path.exists():
-                print(f"  ✅ {subdir}/")
-                
-                # Listar arquivos importantes
-                if subdir == "Regras":
-                    regras_file = subdir_path / "regras.json"
-                    if regras_file.exists():
-                        print(f"    ✅ regras.json ({regras_file.stat().st_size} bytes)")
-                
-                elif subdir == "Tabela":
-                    tabela_file = subdir_path / "tabela.json"
-                    if tabela_file.exists():
-                        print(f"    ✅ tabela.json ({tabela_file.stat().st_size} bytes)")
-                
-                elif subdir == "Participantes":
-                    participantes = list(subdir_path.iterdir())
-                    print(f"    ✅ {len(participantes)} participantes criados")
-                    for p in participantes[:3]:  # Mostrar apenas os primeiros 3
-                        if p.is_dir():
-                            palpites_file = p / "palpites.json"
-                            if palpites_file.exists():
-                                print(f"      ✅ {p.name}/palpites.json")
-                    if len(participantes) > 3:
-                        print(f"      ... e mais {len(participantes) - 3}")
-            else:
+        for subdir, arquivo in SUBDIRS_ESPERADOS:
+            entrada = presentes.get(subdir)
+            if entrada is None:
                 print(f"  ❌ {subdir}/ (não encontrado)")
+                continue
+            
+            print(f"  ✅ {subdir}/")
+            
+            # Listar arquivos importantes
+            if arquivo:
+                arquivo_path = Path(entrada.path) / arquivo
+                if arquivo_path.exists():
+                    print(f"    ✅ {arquivo} ({arquivo_path.stat().st_size} bytes)")
+            
+            elif subdir == "Participantes":
+                with os.scandir(entrada.path) as entradas:
+                    participantes = list(entradas)
+                print(f"    ✅ {len(participantes)} participantes criados")
+                for p in participantes[:3]:  # Mostrar apenas os primeiros 3
+                    if p.is_dir():
+                        palpites_file = Path(p.path) / "palpites.json"
+                        if palpites_file.exists():
+                            print(f"      ✅ {p.name}/palpites.json")
+                if len(participantes) > 3:
+                    print(f"      ... e mais {len(participantes) - 3}")
     
     print(f"\n{'='*60}")
     print("RESUMO DO SETUP")
@@ -12,104 +12,75 @@ Execute: python 02_importar_dados.py
 
 import sys
 import os
-import subprocess
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Caminhos usados pelo exemplo
+BASE_DIR = Path(__file__).resolve().parents[2]
+DADOS_DIR = BASE_DIR / "examples" / "dados_teste"
+CAMPEONATO_DIR = Path("Campeonatos/Copa-Exemplo-2025")
+
 # Adicionar src ao path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.append(str(BASE_DIR / "src"))
 
-def executar_comando(comando, descricao):
-    """Executa um comando e exibe o resultado"""
-    print(f"\n{'='*60}")
-    print(f"EXECUTANDO: {descricao}")
-    print(f"COMANDO: {' '.join(comando)}")
-    print('='*60)
-    
-    try:
-        result = subprocess.run(comando, capture_output=True, text=True, cwd=os.getcwd())
-        
-        if result.stdout:
-            print("SAÍDA:")
-            print(result.stdout)
-        
-        if result.stderr:
-            print("ERROS/AVISOS:")
-            print(result.stderr)
-            
-        if result.returncode != 0:
-            print(f"ERRO: Comando falhou com código {result.returncode}")
-            return False
-        else:
-            print("✅ SUCESSO!")
-            return True
-            
-    except Exception as e:
-        print(f"ERRO ao executar comando: {e}")
-        return False
+from scripts.importar_palpites import dividir_blocos_palpites, ler_arquivo_palpite, main as importar_palpites
+from utils.serializacao import iterar_itens_json
+from comum import executar_comando, exibir_arquivo
+
+# Leitura de arquivos é limitada por I/O: mais threads que CPUs
+MAX_THREADS_LEITURA = min(32, (os.cpu_count() or 1) * 4)
 
 def verificar_campeonato():
     """Verifica se o campeonato existe"""
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    if not campeonato_dir.exists():
+    if not CAMPEONATO_DIR.exists():
         print("❌ Campeonato 'Copa-Exemplo-2025' não encontrado!")
         print("Execute primeiro: python 01_setup_completo.py")
         return False
     return True
 
-def criar_palpites_individuais():
-    """Cria arquivos de palpites individuais a partir do arquivo WhatsApp"""
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    whatsapp_file = dados_dir / "palpites_whatsapp.txt"
+def importar_palpites_whatsapp():
+    """Importa palpites do formato WhatsApp"""
+    
+    print(f"\n{'='*60}")
+    print("IMPORTANDO PALPITES DO WHATSAPP")
+    print('='*60)
     
+    whatsapp_file = DADOS_DIR / "palpites_whatsapp.txt"
     if not whatsapp_file.exists():
         print(f"❌ Arquivo não encontrado: {whatsapp_file}")
         return
     
-    # Ler arquivo WhatsApp
-    with open(whatsapp_file, 'r', encoding='utf-8') as f:
-        conteudo = f.read()
+    # Importar a conversa inteira de uma vez; o script separa os palpites
+    # de cada participante pelo marcador ---
+    sucesso = executar_comando(importar_palpites, [
+        "--campeonato", "Copa-Exemplo-2025",
+        "--arquivo", str(whatsapp_file),
+        "--separador=---", "--forcar"
+    ], "Importação de palpites do WhatsApp")
     
-    # Dividir por participante (separado por ---)
-    blocos = conteudo.split('---')
-    
-    for i, bloco in enumerate(blocos):
-        bloco = bloco.strip()
-        if not bloco:
-            continue
-            
-        # Criar arquivo individual
-        arquivo_individual = dados_dir / f"palpite_individual_{i+1}.txt"
-        with open(arquivo_individual, 'w', encoding='utf-8') as f:
-            f.write(bloco)
-        
-        print(f"✅ Criado: {arquivo_individual.name}")
+    if not sucesso:
+        print("❌ Falha na importação de um ou mais palpites")
 
-def importar_palpites_whatsapp():
-    """Importa palpites do formato WhatsApp"""
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
-    print(f"\n{'='*60}")
-    print("IMPORTANDO PALPITES DO WHATSAPP")
-    print('='*60)
+def contar_palpites_participante(participante_dir):
+    """Conta rodadas e jogos do palpites.json de um participante
     
-    # Criar arquivos individuais
-    criar_palpites_individuais()
+    Retorna (rodadas, jogos, erro) ou None se o participante não tiver arquivo.
+    """
+    palpites_file = participante_dir / "palpites.json"
+    if not palpites_file.exists():
+        return None
     
-    # Importar cada arquivo individual
-    arquivos_palpites = list(dados_dir.glob("palpite_individual_*.txt"))
+    rodadas = 0
+    jogos = 0
+    try:
+        # Percorre as rodadas uma a uma, sem carregar o arquivo inteiro
+        for rodada in iterar_itens_json(palpites_file, 'palpites.item'):
+            rodadas += 1
+            jogos += len(rodada.get('jogos', []))
+    except Exception as e:
+        return rodadas, jogos, e
     
-    for arquivo in sorted(arquivos_palpites):
-        sucesso = executar_comando([
-            sys.executable, str(scripts_dir / "importar_palpites.py"),
-            "--campeonato", "Copa-Exemplo-2025",
-            "--arquivo", str(arquivo)
-        ], f"Importação de palpites: {arquivo.name}")
-        
-        if not sucesso:
-            print(f"❌ Falha na importação de {arquivo.name}")
+    return rodadas, jogos, None
 
 def verificar_dados_importados():
     """Verifica os dados que foram importados"""
@@ -117,38 +88,35 @@ def verificar_dados_importados():
     print("VERIFICANDO DADOS IMPORTADOS")
     print('='*60)
     
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    participantes_dir = campeonato_dir / "Participantes"
+    participantes_dir = CAMPEONATO_DIR / "Participantes"
     
     if not participantes_dir.exists():
         print("❌ Diretório de participantes não encontrado")
         return
     
-    # Contar participantes com palpites
+    # Ler os arquivos dos participantes em paralelo; a ordem de exibição é mantida
+    # scandir traz o tipo de cada entrada sem um stat() por participante
+    with os.scandir(participantes_dir) as entradas:
+        participantes = [Path(e.path) for e in entradas if e.is_dir()]
+    with ThreadPoolExecutor(max_workers=MAX_THREADS_LEITURA) as executor:
+        contagens = list(executor.map(contar_palpites_participante, participantes))
+    
     participantes_com_palpites = 0
     total_palpites = 0
     
-    for participante_dir in participantes_dir.iterdir():
-        if not participante_dir.is_dir():
+    for participante_dir, contagem in zip(participantes, contagens):
+        if contagem is None:
             continue
-            
-        palpites_file = participante_dir / "palpites.json"
-        if palpites_file.exists():
-            try:
-                with open(palpites_file, 'r', encoding='utf-8') as f:
-                    dados = json.load(f)
-                
-                if dados.get('palpites'):
-                    participantes_com_palpites += 1
-                    for rodada in dados['palpites']:
-                        total_palpites += len(rodada.get('jogos', []))
-                    
-                    print(f"✅ {participante_dir.name}: {len(dados['palpites'])} rodada(s)")
-                else:
-                    print(f"⚠️  {participante_dir.name}: sem palpites")
-                    
-            except Exception as e:
-                print(f"❌ Erro ao ler {participante_dir.name}: {e}")
+        
+        rodadas, jogos, erro = contagem
+        total_palpites += jogos
+        if erro is not None:
+            print(f"❌ Erro ao ler {participante_dir.name}: {erro}")
+        elif rodadas:
+            participantes_com_palpites += 1
+            print(f"✅ {participante_dir.name}: {rodadas} rodada(s)")
+        else:
+            print(f"⚠️  {participante_dir.name}: sem palpites")
     
     print(f"\n📊 RESUMO:")
     print(f"   👥 Participantes com palpites: {participantes_com_palpites}")
@@ -160,28 +128,24 @@ def demonstrar_formatos():
     print("FORMATOS DE ENTRADA DEMONSTRADOS")
     print('='*60)
     
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
     
     # Mostrar formato básico
     print("\n1. FORMATO BÁSICO (palpites_rodada1.txt):")
     print("-" * 40)
-    with open(dados_dir / "palpites_rodada1.txt", 'r', encoding='utf-8') as f:
-        print(f.read())
+    exibir_arquivo(DADOS_DIR / "palpites_rodada1.txt")
     
     # Mostrar formato com marcadores
     print("\n2. FORMATO COM MARCADORES (palpites_rodada2.txt):")
     print("-" * 40)
-    with open(dados_dir / "palpites_rodada2.txt", 'r', encoding='utf-8') as f:
-        print(f.read())
+    exibir_arquivo(DADOS_DIR / "palpites_rodada2.txt")
     
     # Mostrar formato WhatsApp (apenas primeiro bloco)
     print("\n3. FORMATO WHATSAPP (primeiro exemplo):")
     print("-" * 40)
-    with open(dados_dir / "palpites_whatsapp.txt", 'r', encoding='utf-8') as f:
-        conteudo = f.read()
-        primeiro_bloco = conteudo.split('---')[0].strip()
-        print(primeiro_bloco)
-        print("\n... (mais exemplos no arquivo palpites_whatsapp.txt)")
+    # Mesma divisão em blocos usada por importar_palpites --separador
+    blocos = dividir_blocos_palpites(ler_arquivo_palpite(DADOS_DIR / "palpites_whatsapp.txt"), '---')
+    print(blocos[0] if blocos else '')
+    print("\n... (mais exemplos no arquivo palpites_whatsapp.txt)")
 
 def main():
     print("📥 EXEMPLO 2: IMPORTAÇÃO DE DADOS")
@@ -220,12 +184,6 @@ def main():
     print()
     print("2. Ou execute o fluxo completo:")
     print("   python 04_fluxo_completo.py")
-    
-    # Limpar arquivos temporários
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    for arquivo in dados_dir.glob("palpite_individual_*.txt"):
-        arquivo.unlink()
-    print(f"\n🧹 Arquivos temporários removidos")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -13,180 +13,180 @@ Execute: python 03_processar_rodada.py
 
 import sys
 import os
-import subprocess
-import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 
+# Caminhos usados pelo exemplo
+BASE_DIR = Path(__file__).resolve().parents[2]
+CAMPEONATO_DIR = Path("Campeonatos/Copa-Exemplo-2025")
+TABELA_FILE = CAMPEONATO_DIR / "Tabela" / "tabela.json"
+
 # Adicionar src ao path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.append(str(BASE_DIR / "src"))
 
-def executar_comando(comando, descricao):
-    """Executa um comando e exibe o resultado"""
-    print(f"\n{'='*60}")
-    print(f"EXECUTANDO: {descricao}")
-    print(f"COMANDO: {' '.join(comando)}")
-    print('='*60)
-    
-    try:
-        result = subprocess.run(comando, capture_output=True, text=True, cwd=os.getcwd())
-        
-        if result.stdout:
-            print("SAÍDA:")
-            print(result.stdout)
-        
-        if result.stderr:
-            print("ERROS/AVISOS:")
-            print(result.stderr)
-            
-        if result.returncode != 0:
-            print(f"ERRO: Comando falhou com código {result.returncode}")
-            return False
-        else:
-            print("✅ SUCESSO!")
-            return True
-            
-    except Exception as e:
-        print(f"ERRO ao executar comando: {e}")
-        return False
+from scripts.processar_resultados import main as processar_resultados
+from utils.serializacao import carregar_json, iterar_itens_json, salvar_json
+from comum import executar_comando, exibir_arquivo
+
+# Leitura de arquivos é limitada por I/O: mais threads que CPUs
+MAX_THREADS_LEITURA = min(32, (os.cpu_count() or 1) * 4)
+
+# Resultados da rodada 1 (simulados), indexados por (mandante, visitante)
+RESULTADOS_RODADA1 = {
+    ("Flamengo", "Palmeiras"): (2, 1),      # Flamengo 2x1 Palmeiras
+    ("Santos", "Corinthians"): (1, 1),      # Santos 1x1 Corinthians  
+    ("São Paulo", "Grêmio"): (3, 0),        # São Paulo 3x0 Grêmio
+    ("Atlético-MG", "Botafogo"): (1, 2),    # Atlético-MG 1x2 Botafogo
+    ("Vasco", "Cruzeiro"): (0, 1),          # Vasco 0x1 Cruzeiro
+    ("Internacional", "Bahia"): (2, 1)      # Internacional 2x1 Bahia
+}
 
 def verificar_campeonato():
     """Verifica se o campeonato existe"""
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    if not campeonato_dir.exists():
+    if not CAMPEONATO_DIR.exists():
         print("❌ Campeonato 'Copa-Exemplo-2025' não encontrado!")
         print("Execute primeiro: python 01_setup_completo.py")
         return False
     return True
 
 def atualizar_resultados_rodada1():
-    """Atualiza os resultados da rodada 1 na tabela"""
+    """Atualiza os resultados da rodada 1 na tabela
+    
+    Retorna a tabela atualizada, que segue em memória para os próximos passos
+    sem reler tabela.json, ou None em caso de falha.
+    """
     print(f"\n{'='*60}")
     print("ATUALIZANDO RESULTADOS DA RODADA 1")
     print('='*60)
     
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    tabela_file = campeonato_dir / "Tabela" / "tabela.json"
-    
-    if not tabela_file.exists():
-        print(f"❌ Arquivo tabela.json não encontrado: {tabela_file}")
-        return False
+    if not TABELA_FILE.exists():
+        print(f"❌ Arquivo tabela.json não encontrado: {TABELA_FILE}")
+        return None
     
     # Ler tabela atual
-    with open(tabela_file, 'r', encoding='utf-8') as f:
-        tabela = json.load(f)
-    
-    # Resultados da rodada 1 (simulados)
-    resultados_rodada1 = {
-        "Flamengo x Palmeiras": (2, 1),      # Flamengo 2x1 Palmeiras
-        "Santos x Corinthians": (1, 1),      # Santos 1x1 Corinthians  
-        "São Paulo x Grêmio": (3, 0),        # São Paulo 3x0 Grêmio
-        "Atlético-MG x Botafogo": (1, 2),    # Atlético-MG 1x2 Botafogo
-        "Vasco x Cruzeiro": (0, 1),          # Vasco 0x1 Cruzeiro
-        "Internacional x Bahia": (2, 1)      # Internacional 2x1 Bahia
-    }
+    tabela = carregar_json(TABELA_FILE)
+    
+    # Indexar rodadas pelo número para ir direto aos jogos da rodada 1
+    rodadas = {rodada.get('numero'): rodada for rodada in tabela.get('rodadas', [])}
+    rodada1 = rodadas.get(1, {})
     
     # Atualizar jogos da rodada 1
     jogos_atualizados = 0
-    for rodada in tabela.get('rodadas', []):
-        if rodada.get('numero') == 1:
-            for jogo in rodada.get('jogos', []):
-                mandante = jogo.get('mandante')
-                visitante = jogo.get('visitante')
-                chave_jogo = f"{mandante} x {visitante}"
-                
-                if chave_jogo in resultados_rodada1:
-                    gols_mandante, gols_visitante = resultados_rodada1[chave_jogo]
-                    jogo['gols_mandante'] = gols_mandante
-                    jogo['gols_visitante'] = gols_visitante
-                    jogo['status'] = 'finalizado'
-                    jogos_atualizados += 1
-                    print(f"✅ {chave_jogo}: {gols_mandante}x{gols_visitante}")
-    
-    # Salvar tabela atualizada
-    with open(tabela_file, 'w', encoding='utf-8') as f:
-        json.dump(tabela, f, indent=2, ensure_ascii=False)
+    for jogo in rodada1.get('jogos', []):
+        resultado = RESULTADOS_RODADA1.get((jogo['mandante'], jogo['visitante']))
+        if resultado is None:
+            continue
+    
+        # Jogo já registrado com este resultado (ex: exemplo executado de novo)
+        if ((jogo.get('gols_mandante'), jogo.get('gols_visitante')) == resultado
+                and jogo.get('status') == 'finalizado'):
+            print(f"✔️  {jogo['mandante']} x {jogo['visitante']}: {resultado[0]}x{resultado[1]} (já registrado)")
+            continue
+    
+        jogo['gols_mandante'], jogo['gols_visitante'] = resultado
+        jogo['status'] = 'finalizado'
+        jogos_atualizados += 1
+        print(f"✅ {jogo['mandante']} x {jogo['visitante']}: {resultado[0]}x{resultado[1]}")
+    
+    # Salvar tabela apenas se algum jogo mudou
+    if jogos_atualizados:
+        salvar_json(TABELA_FILE, tabela)
     
     print(f"\n📊 {jogos_atualizados} jogos atualizados na tabela")
-    return True
+    return tabela
 
-def processar_modo_teste():
-    """Processa a rodada em modo teste"""
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
+def processar_modo_teste(tabela):
+    """Processa a rodada em modo teste usando a tabela já carregada"""
     
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "processar_resultados.py"),
+    sucesso = executar_comando(processar_resultados, [
         "--campeonato", "Copa-Exemplo-2025",
         "--rodada", "1",
         "--teste"
-    ], "Processamento da rodada 1 em MODO TESTE")
+    ], "Processamento da rodada 1 em MODO TESTE", tabela=tabela)
     
     return sucesso
 
-def processar_modo_final():
-    """Processa a rodada em modo final"""
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
+def processar_modo_final(tabela):
+    """Processa a rodada em modo final usando a tabela já carregada"""
     
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "processar_resultados.py"),
+    sucesso = executar_comando(processar_resultados, [
         "--campeonato", "Copa-Exemplo-2025",
         "--rodada", "1",
         "--final"
-    ], "Processamento da rodada 1 em MODO FINAL")
+    ], "Processamento da rodada 1 em MODO FINAL", tabela=tabela)
     
     return sucesso
 
-def verificar_arquivos_gerados():
+def listar_arquivos(diretorio, prefixo, sufixo):
+    """Lista as entradas de um diretório cujo nome tem o prefixo e sufixo dados
+    
+    As entradas do os.scandir guardam o resultado de stat(), então consultar
+    tamanho e data de modificação depois não gera novas chamadas ao sistema.
+    """
+    try:
+        with os.scandir(diretorio) as entradas:
+            return [
+                e for e in entradas
+                if e.name.startswith(prefixo) and e.name.endswith(sufixo) and e.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+def arquivo_mais_recente(diretorio, prefixo, sufixo):
+    """Retorna a entrada modificada mais recentemente, ou None se não houver"""
+    mais_recente = None
+    mtime_mais_recente = -1
+    for entrada in listar_arquivos(diretorio, prefixo, sufixo):
+        mtime = entrada.stat().st_mtime
+        if mtime > mtime_mais_recente:
+            mtime_mais_recente = mtime
+            mais_recente = entrada
+    return mais_recente
+
+def verificar_arquivos_gerados(tabela):
     """Verifica os arquivos gerados pelo processamento"""
     print(f"\n{'='*60}")
     print("VERIFICANDO ARQUIVOS GERADOS")
     print('='*60)
     
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    
     # Verificar backup da tabela
-    tabela_dir = campeonato_dir / "Tabela"
-    backups = list(tabela_dir.glob("tabela_*.json"))
-    if backups:
-        backup_mais_recente = max(backups, key=lambda x: x.stat().st_mtime)
+    tabela_dir = CAMPEONATO_DIR / "Tabela"
+    backup_mais_recente = arquivo_mais_recente(tabela_dir, "tabela_", ".json")
+    if backup_mais_recente is not None:
         print(f"✅ Backup criado: {backup_mais_recente.name}")
         print(f"   Tamanho: {backup_mais_recente.stat().st_size} bytes")
     else:
         print("⚠️  Nenhum backup encontrado")
     
     # Verificar relatório da rodada
-    resultados_dir = campeonato_dir / "Resultados"
-    relatorios = list(resultados_dir.glob("rodada*.txt"))
+    resultados_dir = CAMPEONATO_DIR / "Resultados"
+    relatorios = listar_arquivos(resultados_dir, "rodada", ".txt")
     if relatorios:
         for relatorio in relatorios:
             print(f"✅ Relatório: {relatorio.name}")
             print(f"   Tamanho: {relatorio.stat().st_size} bytes")
             
-            # Mostrar início do relatório
-            with open(relatorio, 'r', encoding='utf-8') as f:
-                linhas = f.readlines()
-                print(f"   Linhas: {len(linhas)}")
-                if linhas:
-                    print("   Início do relatório:")
-                    for linha in linhas[:5]:
-                        print(f"     {linha.rstrip()}")
-                    if len(linhas) > 5:
-                        print("     ...")
+            # Mostrar início do relatório sem carregar todas as linhas
+            with open(relatorio.path, 'r', encoding='utf-8', buffering=131072) as f:
+                inicio = list(islice(f, 5))
+                restantes = sum(1 for _ in f)
+            
+            print(f"   Linhas: {len(inicio) + restantes}")
+            if inicio:
+                print("   Início do relatório:")
+                for linha in inicio:
+                    print(f"     {linha.rstrip()}")
+                if restantes:
+                    print("     ...")
     else:
         print("⚠️  Nenhum relatório encontrado")
     
-    # Verificar atualização da rodada atual
-    tabela_file = campeonato_dir / "Tabela" / "tabela.json"
-    if tabela_file.exists():
-        with open(tabela_file, 'r', encoding='utf-8') as f:
-            tabela = json.load(f)
-        
-        rodada_atual = tabela.get('rodada_atual', 0)
-        print(f"✅ Rodada atual atualizada: {rodada_atual}")
-    else:
-        print("❌ Arquivo tabela.json não encontrado")
+    # Verificar atualização da rodada atual (o modo final atualiza a tabela em memória)
+    rodada_atual = tabela.get('rodada_atual', 0)
+    print(f"✅ Rodada atual atualizada: {rodada_atual}")
 
 def mostrar_classificacao():
     """Mostra a classificação atual"""
@@ -194,23 +194,28 @@ def mostrar_classificacao():
     print("CLASSIFICAÇÃO ATUAL")
     print('='*60)
     
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    resultados_dir = campeonato_dir / "Resultados"
+    resultados_dir = CAMPEONATO_DIR / "Resultados"
     
     # Procurar relatório mais recente
-    relatorios = list(resultados_dir.glob("rodada*.txt"))
-    if not relatorios:
+    relatorio_mais_recente = arquivo_mais_recente(resultados_dir, "rodada", ".txt")
+    if relatorio_mais_recente is None:
         print("❌ Nenhum relatório encontrado")
         return
     
-    relatorio_mais_recente = max(relatorios, key=lambda x: x.stat().st_mtime)
-    
     print(f"📊 Relatório: {relatorio_mais_recente.name}")
     print("-" * 60)
     
-    with open(relatorio_mais_recente, 'r', encoding='utf-8') as f:
-        conteudo = f.read()
-        print(conteudo)
+    exibir_arquivo(relatorio_mais_recente.path)
+
+def participante_tem_palpites(participante_dir):
+    """Verifica se o palpites.json de um participante tem ao menos uma rodada"""
+    palpites_file = participante_dir / "palpites.json"
+    if not palpites_file.exists():
+        return False
+    
+    # Basta encontrar a primeira rodada com palpites
+    with closing(iterar_itens_json(palpites_file, 'palpites.item')) as rodadas:
+        return next(rodadas, None) is not None
 
 def main():
     print("⚽ EXEMPLO 3: PROCESSAMENTO DE RODADA")
@@ -222,20 +227,15 @@ def main():
         return
     
     # Verificar se há palpites
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    participantes_dir = campeonato_dir / "Participantes"
+    participantes_dir = CAMPEONATO_DIR / "Participantes"
     
     tem_palpites = False
     if participantes_dir.exists():
-        for participante_dir in participantes_dir.iterdir():
-            if participante_dir.is_dir():
-                palpites_file = participante_dir / "palpites.json"
-                if palpites_file.exists():
-                    with open(palpites_file, 'r', encoding='utf-8') as f:
-                        dados = json.load(f)
-                    if dados.get('palpites'):
-                        tem_palpites = True
-                        break
+        # scandir traz o tipo de cada entrada sem um stat() por participante
+        with os.scandir(participantes_dir) as entradas:
+            participantes = [Path(e.path) for e in entradas if e.is_dir()]
+        with ThreadPoolExecutor(max_workers=MAX_THREADS_LEITURA) as executor:
+            tem_palpites = any(executor.map(participante_tem_palpites, participantes))
     
     if not tem_palpites:
         print("⚠️  Nenhum palpite encontrado!")
@@ -243,7 +243,8 @@ def main():
         return
     
     # 1. Atualizar resultados
-    if not atualizar_resultados_rodada1():
+    tabela = atualizar_resultados_rodada1()
+    if tabela is None:
         print("❌ Falha ao atualizar resultados. Abortando.")
         return
     
@@ -253,7 +254,7 @@ def main():
     print('='*60)
     print("O modo teste permite verificar os cálculos sem modificar arquivos.")
     
-    if not processar_modo_teste():
+    if not processar_modo_teste(tabela):
         print("❌ Falha no processamento em modo teste")
         return
     
@@ -263,12 +264,12 @@ def main():
     print('='*60)
     print("O modo final cria backup e atualiza os arquivos oficialmente.")
     
-    if not processar_modo_final():
+    if not processar_modo_final(tabela):
         print("❌ Falha no processamento em modo final")
         return
     
     # 4. Verificar arquivos gerados
-    verificar_arquivos_gerados()
+    verificar_arquivos_gerados(tabela)
     
     # 5. Mostrar classificação
     mostrar_classificacao()
@@ -13,38 +13,155 @@ Este script demonstra um fluxo completo de 2 rodadas:
 Execute: python 04_fluxo_completo.py
 """
 
+import argparse
+import importlib
+import io
 import sys
 import os
 import subprocess
-import json
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 
+# Caminhos usados pelo exemplo
+BASE_DIR = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = BASE_DIR / "src" / "scripts"
+DADOS_DIR = BASE_DIR / "examples" / "dados_teste"
+CAMPEONATO_DIR = Path("Campeonatos/Copa-Exemplo-2025")
+TABELA_FILE = CAMPEONATO_DIR / "Tabela" / "tabela.json"
+
 # Adicionar src ao path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.append(str(BASE_DIR / "src"))
+
+from utils.serializacao import carregar_json, salvar_json
+
+# Resumo impresso pelo importar_palpites ao importar vários blocos
+RESUMO_BLOCOS_RE = re.compile(r"(\d+) de \d+ bloco\(s\) importado\(s\)")
+
+# Executar cada script em um novo interpretador Python (opção --subprocess)
+USAR_SUBPROCESSO = False
+
+# Resultados simulados das rodadas, indexados por (mandante, visitante)
+RESULTADOS_RODADA1 = {
+    ("Flamengo", "Palmeiras"): (2, 1),
+    ("Santos", "Corinthians"): (1, 1),
+    ("São Paulo", "Grêmio"): (3, 0),
+    ("Atlético-MG", "Botafogo"): (1, 2),
+    ("Vasco", "Cruzeiro"): (0, 1),
+    ("Internacional", "Bahia"): (2, 1)
+}
+
+RESULTADOS_RODADA2 = {
+    ("Palmeiras", "Santos"): (1, 0),
+    ("Corinthians", "São Paulo"): (2, 2),
+    ("Grêmio", "Atlético-MG"): (1, 1),
+    ("Botafogo", "Vasco"): (3, 1),
+    ("Cruzeiro", "Internacional"): (0, 2),
+    ("Bahia", "Flamengo"): (1, 3)
+}
+
+# Tabelas lidas ou gravadas pelo exemplo: caminho -> ((mtime_ns, tamanho), tabela)
+_cache_tabelas = {}
+
+# Módulos dos scripts já importados, reaproveitados entre as chamadas
+_modulos_scripts = {}
+
+def carregar_script(script):
+    """Importa o módulo de um script de src/scripts apenas na primeira chamada"""
+    modulo = _modulos_scripts.get(script)
+    if modulo is None:
+        modulo = importlib.import_module(f"scripts.{script}")
+        _modulos_scripts[script] = modulo
+    return modulo
+
+def exibir_saida(saida, erros):
+    """Exibe a saída e os erros/avisos de um script"""
+    if saida:
+        print("SAÍDA:")
+        print(saida)
+    
+    if erros:
+        print("ERROS/AVISOS:")
+        print(erros)
+
+def transmitir_subprocesso(comando):
+    """Executa um comando exibindo a saída à medida que ela é produzida
+    
+    Os erros vão direto para o terminal. A saída também é guardada e
+    retornada no formato (código de saída, saída, erros).
+    """
+    linhas = []
+    with subprocess.Popen(comando, stdout=subprocess.PIPE, text=True) as processo:
+        for linha in processo.stdout:
+            if not linhas:
+                print("SAÍDA:")
+            linhas.append(linha)
+            sys.stdout.write(linha)
+    
+    if linhas:
+        print()
+    
+    return processo.returncode, "".join(linhas), ""
+
+def executar_script(script, argumentos, mostrar_saida=False, guardar_saida=True, **kwargs):
+    """Executa um script e retorna (código de saída, saída, erros)
+    
+    Por padrão chama o main() do script no mesmo processo, evitando iniciar
+    um interpretador Python a cada comando; com --subprocess cada script roda
+    em um processo separado. Com mostrar_saida=True a saída é exibida (em
+    processo separado, enquanto o script executa); com guardar_saida=False
+    a saída de um processo separado é descartada em vez de lida. Argumentos
+    nomeados extras (ex: tabela=...) são repassados ao main() apenas no
+    mesmo processo; em processo separado o script lê os próprios arquivos.
+    """
+    if USAR_SUBPROCESSO:
+        caminho_script = str(SCRIPTS_DIR / f"{script}.py")
+        if mostrar_saida:
+            # -u: saída sem buffer, para exibi-la enquanto o script executa
+            return transmitir_subprocesso([sys.executable, "-u", caminho_script, *argumentos])
+        
+        result = subprocess.run(
+            [sys.executable, caminho_script, *argumentos],
+            stdout=subprocess.PIPE if guardar_saida else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        return result.returncode, result.stdout or "", result.stderr
+    
+    modulo = carregar_script(script)
+    saida = io.StringIO()
+    erros = io.StringIO()
+    
+    with redirect_stdout(saida), redirect_stderr(erros):
+        try:
+            codigo = modulo.main(argumentos, **kwargs)
+        except SystemExit as e:
+            # argparse encerra com SystemExit em caso de argumentos inválidos
+            codigo = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    
+    if mostrar_saida:
+        exibir_saida(saida.getvalue(), erros.getvalue())
+    
+    return codigo, saida.getvalue(), erros.getvalue()
 
-def executar_comando(comando, descricao, mostrar_saida=True):
-    """Executa um comando e exibe o resultado"""
+def executar_comando(script, argumentos, descricao, mostrar_saida=True, **kwargs):
+    """Executa um script de src/scripts e exibe o resultado"""
     if mostrar_saida:
         print(f"\n{'='*60}")
         print(f"EXECUTANDO: {descricao}")
         print('='*60)
     
     try:
-        result = subprocess.run(comando, capture_output=True, text=True, cwd=os.getcwd())
-        
-        if mostrar_saida and result.stdout:
-            print("SAÍDA:")
-            print(result.stdout)
-        
-        if result.stderr and mostrar_saida:
-            print("ERROS/AVISOS:")
-            print(result.stderr)
+        # A saída só é exibida, nunca usada depois
+        codigo, _, _ = executar_script(script, argumentos, mostrar_saida, guardar_saida=False, **kwargs)
             
-        if result.returncode != 0:
+        if codigo != 0:
             if mostrar_saida:
-                print(f"ERRO: Comando falhou com código {result.returncode}")
+                print(f"ERRO: Comando falhou com código {codigo}")
             return False
         else:
             if mostrar_saida:
@@ -58,10 +175,9 @@ def executar_comando(comando, descricao, mostrar_saida=True):
 
 def limpar_ambiente():
     """Limpa ambiente anterior"""
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    if campeonato_dir.exists():
+    if CAMPEONATO_DIR.exists():
         print(f"🧹 Removendo campeonato anterior...")
-        shutil.rmtree(campeonato_dir)
+        shutil.rmtree(CAMPEONATO_DIR)
 
 def setup_campeonato():
     """Configura o campeonato completo"""
@@ -69,13 +185,8 @@ def setup_campeonato():
     print("FASE 1: SETUP DO CAMPEONATO")
     print('='*60)
     
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
     # Criar campeonato
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "criar_campeonato.py"),
+    sucesso = executar_comando("criar_campeonato", [
         "--nome", "Copa-Exemplo-2025",
         "--temporada", "2025",
         "--codigo", "CEX25"
@@ -84,30 +195,32 @@ def setup_campeonato():
     if not sucesso:
         return False
     
-    # Gerar regras
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "gerar_regras.py"),
-        "--campeonato", "Copa-Exemplo-2025"
-    ], "Geração das regras", False)
-    
-    if not sucesso:
-        return False
+    # Gerar regras e criar participantes: ambos só leem tabela.json e gravam em
+    # diretórios distintos, então em processos separados rodam ao mesmo tempo.
+    # No mesmo processo a captura da saída é global e eles rodam em sequência.
+    etapas = [
+        ("gerar_regras", [
+            "--campeonato", "Copa-Exemplo-2025",
+            "--sobrescrever"
+        ], "Geração das regras"),
+        ("criar_participantes", [
+            "--campeonato", "Copa-Exemplo-2025",
+            "--arquivo", str(DADOS_DIR / "participantes.txt")
+        ], "Criação de participantes")
+    ]
     
-    # Criar participantes
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "criar_participantes.py"),
-        "--campeonato", "Copa-Exemplo-2025",
-        "--arquivo", str(dados_dir / "participantes.txt")
-    ], "Criação de participantes", False)
+    with ThreadPoolExecutor(max_workers=len(etapas) if USAR_SUBPROCESSO else 1) as executor:
+        resultados = list(executor.map(
+            lambda etapa: executar_comando(*etapa, mostrar_saida=False), etapas
+        ))
     
-    if not sucesso:
+    if not all(resultados):
         return False
     
-    # Importar tabela
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "importar_tabela.py"),
+    # Importar tabela por último, pois ela reescreve tabela.json
+    sucesso = executar_comando("importar_tabela", [
         "--campeonato", "Copa-Exemplo-2025",
-        "--arquivo", str(dados_dir / "tabela_jogos.txt")
+        "--arquivo", str(DADOS_DIR / "tabela_jogos.txt")
     ], "Importação da tabela", False)
     
     print("✅ Setup do campeonato concluído")
@@ -119,72 +232,71 @@ def importar_palpites_rodada1():
     print("FASE 2: IMPORTAÇÃO DE PALPITES - RODADA 1")
     print('='*60)
     
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
-    # Criar arquivos individuais do WhatsApp
-    whatsapp_file = dados_dir / "palpites_whatsapp.txt"
-    with open(whatsapp_file, 'r', encoding='utf-8') as f:
-        conteudo = f.read()
-    
-    blocos = conteudo.split('---')
-    arquivos_criados = []
-    
-    for i, bloco in enumerate(blocos):
-        bloco = bloco.strip()
-        if not bloco:
-            continue
-            
-        arquivo_individual = dados_dir / f"temp_palpite_{i+1}.txt"
-        with open(arquivo_individual, 'w', encoding='utf-8') as f:
-            f.write(bloco)
-        arquivos_criados.append(arquivo_individual)
-    
-    # Importar cada arquivo
-    palpites_importados = 0
-    for arquivo in arquivos_criados:
-        sucesso = executar_comando([
-            sys.executable, str(scripts_dir / "importar_palpites.py"),
+    # Importar todos os palpites da conversa em uma única execução,
+    # separando os apostadores pelo marcador "---"
+    try:
+        _, saida, _ = executar_script("importar_palpites", [
             "--campeonato", "Copa-Exemplo-2025",
-            "--arquivo", str(arquivo)
-        ], f"Importação: {arquivo.name}", False)
-        
-        if sucesso:
-            palpites_importados += 1
+            "--arquivo", str(DADOS_DIR / "palpites_whatsapp.txt"),
+            "--separador=---"
+        ])
+    except Exception as e:
+        print(f"ERRO ao executar comando: {e}")
+        return False
     
-    # Limpar arquivos temporários
-    for arquivo in arquivos_criados:
-        arquivo.unlink()
+    # Resumo final do script: "N de M bloco(s) importado(s) com sucesso"
+    resumo = RESUMO_BLOCOS_RE.search(saida)
+    palpites_importados = int(resumo.group(1)) if resumo else 0
     
     print(f"✅ {palpites_importados} conjuntos de palpites importados")
     return palpites_importados > 0
 
+def carregar_tabela(caminho=TABELA_FILE):
+    """Carrega a tabela do campeonato, reaproveitando a última leitura
+    
+    A tabela em cache só é usada enquanto o arquivo mantiver a mesma data de
+    modificação e o mesmo tamanho; qualquer gravação feita por um script
+    invalida o cache e força uma nova leitura.
+    """
+    chave = str(caminho)
+    info = os.stat(caminho)
+    versao = (info.st_mtime_ns, info.st_size)
+    
+    em_cache = _cache_tabelas.get(chave)
+    if em_cache is not None and em_cache[0] == versao:
+        return em_cache[1]
+    
+    tabela = carregar_json(caminho)
+    _cache_tabelas[chave] = (versao, tabela)
+    return tabela
+
+def salvar_tabela(tabela, caminho=TABELA_FILE):
+    """Grava a tabela do campeonato e mantém o cache atualizado"""
+    salvar_json(caminho, tabela)
+    info = os.stat(caminho)
+    _cache_tabelas[str(caminho)] = ((info.st_mtime_ns, info.st_size), tabela)
+
 def atualizar_resultados(rodada, resultados):
-    """Atualiza resultados de uma rodada"""
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    tabela_file = campeonato_dir / "Tabela" / "tabela.json"
+    """Atualiza resultados de uma rodada
     
-    with open(tabela_file, 'r', encoding='utf-8') as f:
-        tabela = json.load(f)
+    Os resultados são indexados por (mandante, visitante).
+    """
+    tabela = carregar_tabela()
+    
+    # Indexar os jogos da rodada por (mandante, visitante)
+    rodada_data = next((r for r in tabela.get('rodadas', []) if r.get('numero') == rodada), {})
+    jogos = {(jogo.get('mandante'), jogo.get('visitante')): jogo for jogo in rodada_data.get('jogos', [])}
     
     jogos_atualizados = 0
-    for rodada_data in tabela.get('rodadas', []):
-        if rodada_data.get('numero') == rodada:
-            for jogo in rodada_data.get('jogos', []):
-                mandante = jogo.get('mandante')
-                visitante = jogo.get('visitante')
-                chave_jogo = f"{mandante} x {visitante}"
-                
-                if chave_jogo in resultados:
-                    gols_mandante, gols_visitante = resultados[chave_jogo]
-                    jogo['gols_mandante'] = gols_mandante
-                    jogo['gols_visitante'] = gols_visitante
-                    jogo['status'] = 'finalizado'
-                    jogos_atualizados += 1
-    
-    with open(tabela_file, 'w', encoding='utf-8') as f:
-        json.dump(tabela, f, indent=2, ensure_ascii=False)
+    for chave_jogo, (gols_mandante, gols_visitante) in resultados.items():
+        jogo = jogos.get(chave_jogo)
+        if jogo is not None:
+            jogo['gols_mandante'] = gols_mandante
+            jogo['gols_visitante'] = gols_visitante
+            jogo['status'] = 'finalizado'
+            jogos_atualizados += 1
+    
+    salvar_tabela(tabela)
     
     return jogos_atualizados
 
@@ -194,29 +306,15 @@ def processar_rodada1():
     print("FASE 3: PROCESSAMENTO DA RODADA 1")
     print('='*60)
     
-    # Atualizar resultados da rodada 1
-    resultados_rodada1 = {
-        "Flamengo x Palmeiras": (2, 1),
-        "Santos x Corinthians": (1, 1),
-        "São Paulo x Grêmio": (3, 0),
-        "Atlético-MG x Botafogo": (1, 2),
-        "Vasco x Cruzeiro": (0, 1),
-        "Internacional x Bahia": (2, 1)
-    }
-    
-    jogos_atualizados = atualizar_resultados(1, resultados_rodada1)
+    jogos_atualizados = atualizar_resultados(1, RESULTADOS_RODADA1)
     print(f"📊 {jogos_atualizados} jogos da rodada 1 finalizados")
     
-    # Processar em modo final
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "processar_resultados.py"),
+    # Processar em modo final, com a tabela que acabou de ser gravada
+    sucesso = executar_comando("processar_resultados", [
         "--campeonato", "Copa-Exemplo-2025",
         "--rodada", "1",
         "--final"
-    ], "Processamento final da rodada 1", False)
+    ], "Processamento final da rodada 1", False, tabela=carregar_tabela())
     
     print("✅ Rodada 1 processada")
     return sucesso
@@ -227,15 +325,10 @@ def importar_palpites_rodada2():
     print("FASE 4: IMPORTAÇÃO DE PALPITES - RODADA 2")
     print('='*60)
     
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
     # Importar palpites da rodada 2
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "importar_palpites.py"),
+    sucesso = executar_comando("importar_palpites", [
         "--campeonato", "Copa-Exemplo-2025",
-        "--arquivo", str(dados_dir / "palpites_rodada2.txt")
+        "--arquivo", str(DADOS_DIR / "palpites_rodada2.txt")
     ], "Importação de palpites da rodada 2", False)
     
     print("✅ Palpites da rodada 2 importados")
@@ -247,29 +340,15 @@ def processar_rodada2():
     print("FASE 5: PROCESSAMENTO DA RODADA 2")
     print('='*60)
     
-    # Atualizar resultados da rodada 2
-    resultados_rodada2 = {
-        "Palmeiras x Santos": (1, 0),
-        "Corinthians x São Paulo": (2, 2),
-        "Grêmio x Atlético-MG": (1, 1),
-        "Botafogo x Vasco": (3, 1),
-        "Cruzeiro x Internacional": (0, 2),
-        "Bahia x Flamengo": (1, 3)
-    }
-    
-    jogos_atualizados = atualizar_resultados(2, resultados_rodada2)
+    jogos_atualizados = atualizar_resultados(2, RESULTADOS_RODADA2)
     print(f"📊 {jogos_atualizados} jogos da rodada 2 finalizados")
     
-    # Processar em modo final
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    
-    sucesso = executar_comando([
-        sys.executable, str(scripts_dir / "processar_resultados.py"),
+    # Processar em modo final, com a tabela que acabou de ser gravada
+    sucesso = executar_comando("processar_resultados", [
         "--campeonato", "Copa-Exemplo-2025",
         "--rodada", "2",
         "--final"
-    ], "Processamento final da rodada 2", False)
+    ], "Processamento final da rodada 2", False, tabela=carregar_tabela())
     
     print("✅ Rodada 2 processada")
     return sucesso
@@ -280,62 +359,80 @@ def analisar_resultados():
     print("FASE 6: ANÁLISE DOS RESULTADOS")
     print('='*60)
     
-    campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-    resultados_dir = campeonato_dir / "Resultados"
+    resultados_dir = os.path.join(CAMPEONATO_DIR, "Resultados")
+    tabela_dir = os.path.join(CAMPEONATO_DIR, "Tabela")
+    participantes_dir = os.path.join(CAMPEONATO_DIR, "Participantes")
+    
+    # Percorrer o campeonato uma única vez, separando relatórios, backups e
+    # palpites pelo diretório em que estão
+    relatorios = []
+    backups = []
+    arquivos_palpites = []
+    for raiz, _, arquivos in os.walk(CAMPEONATO_DIR):
+        if raiz == resultados_dir:
+            relatorios.extend(nome for nome in arquivos if nome.startswith("rodada") and nome.endswith(".txt"))
+        elif raiz == tabela_dir:
+            backups.extend(nome for nome in arquivos if nome.startswith("tabela_") and nome.endswith(".json"))
+        elif os.path.dirname(raiz) == participantes_dir and "palpites.json" in arquivos:
+            arquivos_palpites.append(os.path.join(raiz, "palpites.json"))
+    
+    relatorios.sort()
+    backups.sort()
     
     # Listar relatórios gerados
-    relatorios = sorted(list(resultados_dir.glob("rodada*.txt")))
     print(f"📄 {len(relatorios)} relatórios gerados:")
     
     for relatorio in relatorios:
-        print(f"   • {relatorio.name} ({relatorio.stat().st_size} bytes)")
+        print(f"   • {relatorio} ({os.path.getsize(os.path.join(resultados_dir, relatorio))} bytes)")
     
     # Mostrar classificação final
     if relatorios:
         relatorio_final = relatorios[-1]
-        print(f"\n📊 CLASSIFICAÇÃO FINAL ({relatorio_final.name}):")
+        print(f"\n📊 CLASSIFICAÇÃO FINAL ({relatorio_final}):")
         print("-" * 60)
         
-        with open(relatorio_final, 'r', encoding='utf-8') as f:
-            conteudo = f.read()
-            # Mostrar apenas as primeiras 20 linhas
-            linhas = conteudo.split('\n')
-            for linha in linhas[:20]:
-                print(linha)
-            if len(linhas) > 20:
-                print("...")
+        # Mostrar apenas as primeiras 20 linhas, sem ler o restante do arquivo
+        with open(os.path.join(resultados_dir, relatorio_final), 'r', encoding='utf-8') as f:
+            linhas = list(islice(f, 21))
+        for linha in linhas[:20]:
+            print(linha.rstrip('\n'))
+        if len(linhas) > 20:
+            print("...")
     
     # Estatísticas dos backups
-    tabela_dir = campeonato_dir / "Tabela"
-    backups = list(tabela_dir.glob("tabela_*.json"))
     print(f"\n💾 {len(backups)} backups criados:")
-    for backup in sorted(backups):
-        print(f"   • {backup.name}")
+    for backup in backups:
+        print(f"   • {backup}")
     
     # Estatísticas dos participantes
-    participantes_dir = campeonato_dir / "Participantes"
     total_palpites = 0
     participantes_ativos = 0
     
-    for participante_dir in participantes_dir.iterdir():
-        if participante_dir.is_dir():
-            palpites_file = participante_dir / "palpites.json"
-            if palpites_file.exists():
-                with open(palpites_file, 'r', encoding='utf-8') as f:
-                    dados = json.load(f)
-                
-                rodadas_com_palpites = len(dados.get('palpites', []))
-                if rodadas_com_palpites > 0:
-                    participantes_ativos += 1
-                    for rodada in dados['palpites']:
-                        total_palpites += len(rodada.get('jogos', []))
+    for arquivo_palpites in arquivos_palpites:
+        dados = carregar_json(arquivo_palpites)
+        
+        rodadas_com_palpites = len(dados.get('palpites', []))
+        if rodadas_com_palpites > 0:
+            participantes_ativos += 1
+            for rodada in dados['palpites']:
+                total_palpites += len(rodada.get('jogos', []))
     
     print(f"\n👥 ESTATÍSTICAS DOS PARTICIPANTES:")
     print(f"   • Participantes ativos: {participantes_ativos}")
     print(f"   • Total de palpites: {total_palpites}")
     print(f"   • Média por participante: {total_palpites/participantes_ativos:.1f}")
 
-def main():
+def main(argv=None):
+    global USAR_SUBPROCESSO
+    
+    parser = argparse.ArgumentParser(description="Exemplo 4: fluxo completo de 2 rodadas do campeonato")
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Executa cada script em um processo Python separado"
+    )
+    USAR_SUBPROCESSO = parser.parse_args(argv).subprocess
+    
     print("🏆 EXEMPLO 4: FLUXO COMPLETO")
     print("=" * 60)
     print("Este exemplo executa um fluxo completo de 2 rodadas do campeonato.")
@@ -389,12 +486,15 @@ def main():
         print("ARQUIVOS GERADOS")
         print('='*60)
         
-        campeonato_dir = Path("Campeonatos/Copa-Exemplo-2025")
-        
-        # Contar arquivos por tipo
-        arquivos_json = len(list(campeonato_dir.rglob("*.json")))
-        arquivos_txt = len(list(campeonato_dir.rglob("*.txt")))
-        diretorios = len([d for d in campeonato_dir.rglob("*") if d.is_dir()])
+        # Contar arquivos por tipo em uma única passada pela árvore
+        arquivos_json = arquivos_txt = diretorios = 0
+        for _, subdirs, arquivos in os.walk(CAMPEONATO_DIR):
+            diretorios += len(subdirs)
+            for nome in arquivos:
+                if nome.endswith(".json"):
+                    arquivos_json += 1
+                elif nome.endswith(".txt"):
+                    arquivos_txt += 1
         
         print(f"📁 {diretorios} diretórios criados")
         print(f"📄 {arquivos_json} arquivos JSON")
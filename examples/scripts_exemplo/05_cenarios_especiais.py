@@ -12,36 +12,162 @@ Este script demonstra o tratamento de situações especiais:
 Execute: python 05_cenarios_especiais.py
 """
 
-import sys
+import argparse
+import importlib
+import io
 import os
+import re
+import sys
 import subprocess
-import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
+# Caminhos usados pelo exemplo
+BASE_DIR = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = BASE_DIR / "src" / "scripts"
+DADOS_DIR = BASE_DIR / "examples" / "dados_teste"
+CAMPEONATO_DIR = Path("Campeonatos/Teste-Cenarios-2025")
+TABELA_FILE = CAMPEONATO_DIR / "Tabela" / "tabela.json"
+
 # Adicionar src ao path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.append(str(BASE_DIR / "src"))
+
+from utils.serializacao import carregar_json, salvar_json
+
+# Arquivos de dados criados em DADOS_DIR para os cenários
+ARQUIVOS_TESTE = [
+    "palpites_normalizacao.txt",
+    "palpites_formatos.txt",
+    "palpites_erros.txt",
+    "participantes_especiais.txt"
+]
+
+# Códigos de acerto exibidos nas tabelas de pontuação (colunas separadas por '|')
+CODIGOS_ACERTO_RE = re.compile(r'\b(AR|VG|VD|VS|V|E|G|S|RI|PA)\b')
+
+DESCRICOES_CODIGOS = {
+    'AR': 'Resultado Exato',
+    'VG': 'Vencedor + Gols de Uma Equipe',
+    'VD': 'Vencedor + Diferença de Gols',
+    'VS': 'Vencedor + Soma Total',
+    'V': 'Apenas Vencedor',
+    'E': 'Apenas Empate',
+    'G': 'Gols de Um Time',
+    'S': 'Soma Total de Gols',
+    'RI': 'Resultado Invertido',
+    'PA': 'Palpite Ausente'
+}
+
+# Resultados que demonstram diferentes regras de pontuação, indexados por (mandante, visitante)
+RESULTADOS_ESPECIAIS = {
+    ("Flamengo", "Palmeiras"): (2, 1),      # Para testar resultado exato
+    ("Santos", "Corinthians"): (1, 1),      # Para testar empate
+    ("São Paulo", "Grêmio"): (3, 0),        # Para testar vencedor + gols
+    ("Atlético-MG", "Botafogo"): (1, 2),    # Para testar resultado invertido
+    ("Vasco", "Cruzeiro"): (0, 1),          # Para testar apenas vencedor
+    ("Internacional", "Bahia"): (2, 1)      # Para testar diferença de gols
+}
+
+# Executar cada script em um novo interpretador Python (opção --subprocess)
+USAR_SUBPROCESSO = False
+
+# Módulos dos scripts já importados, reaproveitados entre as chamadas
+_modulos_scripts = {}
+
+def carregar_script(script):
+    """Importa o módulo de um script de src/scripts apenas na primeira chamada"""
+    modulo = _modulos_scripts.get(script)
+    if modulo is None:
+        modulo = importlib.import_module(f"scripts.{script}")
+        _modulos_scripts[script] = modulo
+    return modulo
+
+def exibir_saida(saida, erros):
+    """Exibe a saída e os erros/avisos de um script"""
+    if saida:
+        print("SAÍDA:")
+        print(saida)
+    
+    if erros:
+        print("ERROS/AVISOS:")
+        print(erros)
 
-def executar_comando(comando, descricao, mostrar_saida=True):
-    """Executa um comando e exibe o resultado"""
+def transmitir_subprocesso(comando):
+    """Executa um comando exibindo a saída à medida que ela é produzida
+    
+    Os erros vão direto para o terminal. A saída também é guardada e
+    retornada no formato (código de saída, saída, erros).
+    """
+    linhas = []
+    with subprocess.Popen(comando, stdout=subprocess.PIPE, text=True) as processo:
+        for linha in processo.stdout:
+            if not linhas:
+                print("SAÍDA:")
+            linhas.append(linha)
+            sys.stdout.write(linha)
+    
+    if linhas:
+        print()
+    
+    return processo.returncode, "".join(linhas), ""
+
+def executar_script(script, argumentos, mostrar_saida=False, guardar_saida=True, **kwargs):
+    """Executa um script e retorna (código de saída, saída, erros)
+    
+    Por padrão chama o main() do script no mesmo processo, evitando iniciar
+    um interpretador Python a cada comando; com --subprocess cada script roda
+    em um processo separado. Com mostrar_saida=True a saída é exibida (em
+    processo separado, enquanto o script executa); com guardar_saida=False
+    a saída de um processo separado é descartada em vez de lida. Argumentos
+    nomeados extras (ex: tabela=...) são repassados ao main() apenas no
+    mesmo processo; em processo separado o script lê os próprios arquivos.
+    """
+    if USAR_SUBPROCESSO:
+        caminho_script = str(SCRIPTS_DIR / f"{script}.py")
+        if mostrar_saida:
+            # -u: saída sem buffer, para exibi-la enquanto o script executa
+            return transmitir_subprocesso([sys.executable, "-u", caminho_script, *argumentos])
+        
+        result = subprocess.run(
+            [sys.executable, caminho_script, *argumentos],
+            stdout=subprocess.PIPE if guardar_saida else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        return result.returncode, result.stdout or "", result.stderr
+    
+    modulo = carregar_script(script)
+    saida = io.StringIO()
+    erros = io.StringIO()
+    
+    with redirect_stdout(saida), redirect_stderr(erros):
+        try:
+            codigo = modulo.main(argumentos, **kwargs)
+        except SystemExit as e:
+            # argparse encerra com SystemExit em caso de argumentos inválidos
+            codigo = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    
+    if mostrar_saida:
+        exibir_saida(saida.getvalue(), erros.getvalue())
+    
+    return codigo, saida.getvalue(), erros.getvalue()
+
+def executar_comando(script, argumentos, descricao, mostrar_saida=True, **kwargs):
+    """Executa um script de src/scripts e exibe o resultado"""
     if mostrar_saida:
         print(f"\n{'='*50}")
         print(f"TESTE: {descricao}")
         print('='*50)
     
     try:
-        result = subprocess.run(comando, capture_output=True, text=True, cwd=os.getcwd())
+        # Quem não exibe a saída também não a analisa
+        codigo, saida, erros = executar_script(
+            script, argumentos, mostrar_saida, guardar_saida=mostrar_saida, **kwargs
+        )
         
-        if mostrar_saida:
-            if result.stdout:
-                print("SAÍDA:")
-                print(result.stdout)
-            
-            if result.stderr:
-                print("ERROS/AVISOS:")
-                print(result.stderr)
-        
-        return result.returncode == 0, result.stdout, result.stderr
+        return codigo == 0, saida, erros
             
     except Exception as e:
         if mostrar_saida:
@@ -50,8 +176,6 @@ def executar_comando(comando, descricao, mostrar_saida=True):
 
 def criar_dados_teste_especiais():
     """Cria dados de teste para cenários especiais"""
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
     # 1. Palpites com nomes de times variados
     palpites_normalizacao = """
 João Silva
@@ -65,9 +189,6 @@ Vasco da Gama 0x1 Cruzeiro
 Internacional 2x1 Bahia
 """
     
-    with open(dados_dir / "palpites_normalizacao.txt", 'w', encoding='utf-8') as f:
-        f.write(palpites_normalizacao.strip())
-    
     # 2. Palpites com formatos diferentes
     palpites_formatos = """
 Maria Santos
@@ -81,9 +202,6 @@ Vasco 0 x 1 Cruzeiro
 Internacional 2x1 Bahia
 """
     
-    with open(dados_dir / "palpites_formatos.txt", 'w', encoding='utf-8') as f:
-        f.write(palpites_formatos.strip())
-    
     # 3. Palpites com erros intencionais
     palpites_erros = """
 Pedro Oliveira
@@ -97,9 +215,6 @@ Vasco 0x1 Cruzeiro
 Internacional 2x1 Bahia
 """
     
-    with open(dados_dir / "palpites_erros.txt", 'w', encoding='utf-8') as f:
-        f.write(palpites_erros.strip())
-    
     # 4. Participantes com nomes especiais
     participantes_especiais = """
 João da Silva Jr.
@@ -111,8 +226,19 @@ Fernanda & Roberto
 Carlos Alberto III
 """
     
-    with open(dados_dir / "participantes_especiais.txt", 'w', encoding='utf-8') as f:
-        f.write(participantes_especiais.strip())
+    conteudos = {
+        "palpites_normalizacao.txt": palpites_normalizacao,
+        "palpites_formatos.txt": palpites_formatos,
+        "palpites_erros.txt": palpites_erros,
+        "participantes_especiais.txt": participantes_especiais
+    }
+    
+    # Os arquivos são independentes: gravar todos ao mesmo tempo
+    with ThreadPoolExecutor(max_workers=len(ARQUIVOS_TESTE)) as executor:
+        list(executor.map(
+            lambda arquivo: (DADOS_DIR / arquivo).write_bytes(conteudos[arquivo].strip().encode('utf-8')),
+            ARQUIVOS_TESTE
+        ))
     
     print("✅ Dados de teste especiais criados")
 
@@ -123,17 +249,11 @@ def setup_campeonato_teste():
     print('='*60)
     
     # Limpar campeonato anterior
-    campeonato_dir = Path("Campeonatos/Teste-Cenarios-2025")
-    if campeonato_dir.exists():
-        shutil.rmtree(campeonato_dir)
-    
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
+    if CAMPEONATO_DIR.exists():
+        shutil.rmtree(CAMPEONATO_DIR)
     
     # Criar campeonato
-    sucesso, _, _ = executar_comando([
-        sys.executable, str(scripts_dir / "criar_campeonato.py"),
+    sucesso, _, _ = executar_comando("criar_campeonato", [
         "--nome", "Teste-Cenarios-2025",
         "--temporada", "2025",
         "--codigo", "TC25"
@@ -143,16 +263,15 @@ def setup_campeonato_teste():
         return False
     
     # Gerar regras
-    sucesso, _, _ = executar_comando([
-        sys.executable, str(scripts_dir / "gerar_regras.py"),
-        "--campeonato", "Teste-Cenarios-2025"
+    sucesso, _, _ = executar_comando("gerar_regras", [
+        "--campeonato", "Teste-Cenarios-2025",
+        "--sobrescrever"
     ], "Geração das regras", False)
     
     # Importar tabela
-    sucesso, _, _ = executar_comando([
-        sys.executable, str(scripts_dir / "importar_tabela.py"),
+    sucesso, _, _ = executar_comando("importar_tabela", [
         "--campeonato", "Teste-Cenarios-2025",
-        "--arquivo", str(dados_dir / "tabela_jogos.txt")
+        "--arquivo", str(DADOS_DIR / "tabela_jogos.txt")
     ], "Importação da tabela", False)
     
     print("✅ Campeonato de teste configurado")
@@ -164,22 +283,17 @@ def testar_normalizacao_nomes():
     print("CENÁRIO 1: NORMALIZAÇÃO DE NOMES DE PARTICIPANTES")
     print('='*60)
     
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
     # Testar criação de participantes com nomes especiais
-    sucesso, saida, erro = executar_comando([
-        sys.executable, str(scripts_dir / "criar_participantes.py"),
+    sucesso, saida, erro = executar_comando("criar_participantes", [
         "--campeonato", "Teste-Cenarios-2025",
-        "--arquivo", str(dados_dir / "participantes_especiais.txt")
+        "--arquivo", str(DADOS_DIR / "participantes_especiais.txt")
     ], "Criação de participantes com nomes especiais")
     
     if sucesso:
         print("✅ Nomes especiais normalizados com sucesso")
         
         # Verificar diretórios criados
-        participantes_dir = Path("Campeonatos/Teste-Cenarios-2025/Participantes")
+        participantes_dir = CAMPEONATO_DIR / "Participantes"
         diretorios = [d.name for d in participantes_dir.iterdir() if d.is_dir()]
         
         print("\n📁 Diretórios criados:")
@@ -194,32 +308,25 @@ def testar_formatos_palpites():
     print("CENÁRIO 2: FORMATOS DIFERENTES DE PALPITES")
     print('='*60)
     
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
     # Criar participante primeiro
-    sucesso, _, _ = executar_comando([
-        sys.executable, str(scripts_dir / "criar_participantes.py"),
+    sucesso, _, _ = executar_comando("criar_participantes", [
         "--campeonato", "Teste-Cenarios-2025",
-        "--arquivo", str(dados_dir / "participantes.txt")
+        "--arquivo", str(DADOS_DIR / "participantes.txt")
     ], "Criação de participantes básicos", False)
     
     # Testar formato com normalização
-    sucesso, saida, erro = executar_comando([
-        sys.executable, str(scripts_dir / "importar_palpites.py"),
+    sucesso, saida, erro = executar_comando("importar_palpites", [
         "--campeonato", "Teste-Cenarios-2025",
-        "--arquivo", str(dados_dir / "palpites_normalizacao.txt")
+        "--arquivo", str(DADOS_DIR / "palpites_normalizacao.txt")
     ], "Palpites com nomes de times variados")
     
     if sucesso:
         print("✅ Normalização de times funcionou")
     
     # Testar diferentes formatos de placar
-    sucesso, saida, erro = executar_comando([
-        sys.executable, str(scripts_dir / "importar_palpites.py"),
+    sucesso, saida, erro = executar_comando("importar_palpites", [
         "--campeonato", "Teste-Cenarios-2025",
-        "--arquivo", str(dados_dir / "palpites_formatos.txt")
+        "--arquivo", str(DADOS_DIR / "palpites_formatos.txt")
     ], "Palpites com formatos diferentes de placar")
     
     if sucesso:
@@ -231,15 +338,10 @@ def testar_tratamento_erros():
     print("CENÁRIO 3: TRATAMENTO DE ERROS")
     print('='*60)
     
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
     # Testar palpite com time inexistente
-    sucesso, saida, erro = executar_comando([
-        sys.executable, str(scripts_dir / "importar_palpites.py"),
+    sucesso, saida, erro = executar_comando("importar_palpites", [
         "--campeonato", "Teste-Cenarios-2025",
-        "--arquivo", str(dados_dir / "palpites_erros.txt")
+        "--arquivo", str(DADOS_DIR / "palpites_erros.txt")
     ], "Palpites com time inexistente")
     
     if not sucesso:
@@ -248,8 +350,7 @@ def testar_tratamento_erros():
             print("✅ Mensagem de erro específica exibida")
     
     # Testar campeonato inexistente
-    sucesso, saida, erro = executar_comando([
-        sys.executable, str(scripts_dir / "processar_resultados.py"),
+    sucesso, saida, erro = executar_comando("processar_resultados", [
         "--campeonato", "Campeonato-Inexistente",
         "--rodada", "1",
         "--teste"
@@ -265,54 +366,33 @@ def testar_casos_pontuacao():
     print('='*60)
     
     # Criar cenário com resultados específicos para testar todas as regras
-    campeonato_dir = Path("Campeonatos/Teste-Cenarios-2025")
-    tabela_file = campeonato_dir / "Tabela" / "tabela.json"
-    
-    if not tabela_file.exists():
+    if not TABELA_FILE.exists():
         print("❌ Tabela não encontrada")
         return
     
     # Atualizar com resultados específicos para demonstrar todas as regras
-    with open(tabela_file, 'r', encoding='utf-8') as f:
-        tabela = json.load(f)
-    
-    # Resultados que demonstram diferentes regras de pontuação
-    resultados_especiais = {
-        "Flamengo x Palmeiras": (2, 1),      # Para testar resultado exato
-        "Santos x Corinthians": (1, 1),      # Para testar empate
-        "São Paulo x Grêmio": (3, 0),        # Para testar vencedor + gols
-        "Atlético-MG x Botafogo": (1, 2),    # Para testar resultado invertido
-        "Vasco x Cruzeiro": (0, 1),          # Para testar apenas vencedor
-        "Internacional x Bahia": (2, 1)      # Para testar diferença de gols
-    }
+    tabela = carregar_json(TABELA_FILE)
+    
+    # Indexar os jogos da rodada 1 por (mandante, visitante)
+    rodada1 = next((r for r in tabela.get('rodadas', []) if r.get('numero') == 1), {})
+    jogos = {(jogo.get('mandante'), jogo.get('visitante')): jogo for jogo in rodada1.get('jogos', [])}
     
     # Atualizar jogos
-    for rodada in tabela.get('rodadas', []):
-        if rodada.get('numero') == 1:
-            for jogo in rodada.get('jogos', []):
-                mandante = jogo.get('mandante')
-                visitante = jogo.get('visitante')
-                chave_jogo = f"{mandante} x {visitante}"
-                
-                if chave_jogo in resultados_especiais:
-                    gols_mandante, gols_visitante = resultados_especiais[chave_jogo]
-                    jogo['gols_mandante'] = gols_mandante
-                    jogo['gols_visitante'] = gols_visitante
-                    jogo['status'] = 'finalizado'
-    
-    with open(tabela_file, 'w', encoding='utf-8') as f:
-        json.dump(tabela, f, indent=2, ensure_ascii=False)
-    
-    # Processar resultados
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    
-    sucesso, saida, erro = executar_comando([
-        sys.executable, str(scripts_dir / "processar_resultados.py"),
+    for chave_jogo, (gols_mandante, gols_visitante) in RESULTADOS_ESPECIAIS.items():
+        jogo = jogos.get(chave_jogo)
+        if jogo is not None:
+            jogo['gols_mandante'] = gols_mandante
+            jogo['gols_visitante'] = gols_visitante
+            jogo['status'] = 'finalizado'
+    
+    salvar_json(TABELA_FILE, tabela)
+    
+    # Processar resultados reaproveitando a tabela já carregada e atualizada
+    sucesso, saida, erro = executar_comando("processar_resultados", [
         "--campeonato", "Teste-Cenarios-2025",
         "--rodada", "1",
         "--teste"
-    ], "Processamento com casos extremos de pontuação")
+    ], "Processamento com casos extremos de pontuação", tabela=tabela)
     
     if sucesso:
         print("✅ Casos extremos de pontuação processados")
@@ -321,27 +401,13 @@ def testar_casos_pontuacao():
         if saida:
             print("\n📊 CÓDIGOS DE ACERTO ENCONTRADOS:")
             codigos_encontrados = set()
-            for linha in saida.split('\n'):
-                if '|' in linha and any(codigo in linha for codigo in ['AR', 'VG', 'VD', 'VS', 'V', 'E', 'G', 'S', 'RI', 'PA']):
-                    # Extrair códigos da linha
-                    for codigo in ['AR', 'VG', 'VD', 'VS', 'V', 'E', 'G', 'S', 'RI', 'PA']:
-                        if codigo in linha:
-                            codigos_encontrados.add(codigo)
+            for linha in saida.splitlines():
+                if '|' in linha:
+                    # Extrair códigos da coluna após o '|', fora dos nomes
+                    codigos_encontrados.update(CODIGOS_ACERTO_RE.findall(linha.rpartition('|')[2]))
             
             for codigo in sorted(codigos_encontrados):
-                descricoes = {
-                    'AR': 'Resultado Exato',
-                    'VG': 'Vencedor + Gols de Uma Equipe',
-                    'VD': 'Vencedor + Diferença de Gols',
-                    'VS': 'Vencedor + Soma Total',
-                    'V': 'Apenas Vencedor',
-                    'E': 'Apenas Empate',
-                    'G': 'Gols de Um Time',
-                    'S': 'Soma Total de Gols',
-                    'RI': 'Resultado Invertido',
-                    'PA': 'Palpite Ausente'
-                }
-                print(f"   ✅ {codigo}: {descricoes.get(codigo, 'Desconhecido')}")
+                print(f"   ✅ {codigo}: {DESCRICOES_CODIGOS.get(codigo, 'Desconhecido')}")
 
 def testar_validacao_dados():
     """Testa validação de dados"""
@@ -350,18 +416,13 @@ def testar_validacao_dados():
     print('='*60)
     
     # Testar arquivo JSON inválido
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    arquivo_invalido = dados_dir / "json_invalido.txt"
+    arquivo_invalido = DADOS_DIR / "json_invalido.txt"
     
     with open(arquivo_invalido, 'w', encoding='utf-8') as f:
         f.write("Este não é um JSON válido { malformado")
     
-    base_dir = Path(__file__).parent.parent.parent
-    scripts_dir = base_dir / "src" / "scripts"
-    
     # Testar processamento sem jogos finalizados
-    sucesso, saida, erro = executar_comando([
-        sys.executable, str(scripts_dir / "processar_resultados.py"),
+    sucesso, saida, erro = executar_comando("processar_resultados", [
         "--campeonato", "Teste-Cenarios-2025",
         "--rodada", "2",  # Rodada sem jogos finalizados
         "--teste"
@@ -375,28 +436,29 @@ def testar_validacao_dados():
 
 def limpar_dados_teste():
     """Limpa dados de teste criados"""
-    dados_dir = Path(__file__).parent.parent / "dados_teste"
-    
-    arquivos_teste = [
-        "palpites_normalizacao.txt",
-        "palpites_formatos.txt", 
-        "palpites_erros.txt",
-        "participantes_especiais.txt"
-    ]
-    
-    for arquivo in arquivos_teste:
-        arquivo_path = dados_dir / arquivo
-        if arquivo_path.exists():
-            arquivo_path.unlink()
+    with ThreadPoolExecutor(max_workers=len(ARQUIVOS_TESTE)) as executor:
+        list(executor.map(
+            lambda arquivo: (DADOS_DIR / arquivo).unlink(missing_ok=True),
+            ARQUIVOS_TESTE
+        ))
     
     # Remover campeonato de teste
-    campeonato_dir = Path("Campeonatos/Teste-Cenarios-2025")
-    if campeonato_dir.exists():
-        shutil.rmtree(campeonato_dir)
+    if CAMPEONATO_DIR.exists():
+        shutil.rmtree(CAMPEONATO_DIR)
     
     print("🧹 Dados de teste removidos")
 
-def main():
+def main(argv=None):
+    global USAR_SUBPROCESSO
+    
+    parser = argparse.ArgumentParser(description="Exemplo 5: cenários especiais e casos extremos")
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Executa cada script em um processo Python separado"
+    )
+    USAR_SUBPROCESSO = parser.parse_args(argv).subprocess
+    
     print("🧪 EXEMPLO 5: CENÁRIOS ESPECIAIS")
     print("=" * 60)
     print("Este exemplo testa situações especiais e casos extremos do sistema.")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Funções auxiliares compartilhadas pelos scripts de exemplo
+
+Os exemplos importam este módulo do próprio diretório, que o Python coloca
+no sys.path ao executar um script (ex: python 02_importar_dados.py).
+"""
+
+import io
+import shutil
+import sys
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
+
+def executar_comando(main_script, argumentos, descricao, capturar=False, **kwargs):
+    """Executa o main() de um script no mesmo processo e exibe o resultado
+
+    Por padrão a saída do script vai direto para o terminal; com capturar=True
+    ela é coletada e exibida separando saída de erros/avisos. Argumentos
+    nomeados extras são repassados ao main() (ex: tabela=...).
+    """
+    print(f"\n{'='*60}")
+    print(f"EXECUTANDO: {descricao}")
+    print(f"COMANDO: {main_script.__module__.rsplit('.', 1)[-1]}.py {' '.join(argumentos)}")
+    print('='*60)
+
+    saida = io.StringIO() if capturar else None
+    erros = io.StringIO() if capturar else None
+    falha = None
+
+    if not capturar:
+        print("SAÍDA:")
+
+    with ExitStack() as redirecionamentos:
+        if capturar:
+            redirecionamentos.enter_context(redirect_stdout(saida))
+            redirecionamentos.enter_context(redirect_stderr(erros))
+        try:
+            codigo = main_script(argumentos, **kwargs)
+        except SystemExit as e:
+            # argparse encerra com SystemExit em caso de argumentos inválidos
+            codigo = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            falha = e
+
+    if capturar and saida.getvalue():
+        print("SAÍDA:")
+        print(saida.getvalue())
+
+    if capturar and erros.getvalue():
+        print("ERROS/AVISOS:")
+        print(erros.getvalue())
+
+    if falha is not None:
+        print(f"ERRO ao executar comando: {falha}")
+        return False
+
+    if codigo:
+        print(f"ERRO: Comando falhou com código {codigo}")
+        return False
+    else:
+        print("✅ SUCESSO!")
+        return True
+
+def exibir_arquivo(caminho):
+    """Copia o conteúdo de um arquivo para o terminal sem decodificá-lo"""
+    sys.stdout.flush()
+    with open(caminho, 'rb') as origem:
+        shutil.copyfileobj(origem, sys.stdout.buffer)
+    sys.stdout.buffer.flush()
+    print()
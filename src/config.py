@@ -3,14 +3,34 @@ Configuração básica do Sistema de Controle de Bolão
 """
 
 import os
+import re
+import unicodedata
 from pathlib import Path
+from types import MappingProxyType
+
+
+def _congelar(valor):
+    """
+    Converte um dicionário (e os dicionários aninhados) em MappingProxyType,
+    para que as constantes possam ser compartilhadas sem cópias defensivas.
+
+    Args:
+        valor: Dicionário ou valor simples
+
+    Returns:
+        Visão somente leitura do dicionário, ou o próprio valor
+    """
+    if isinstance(valor, dict):
+        return MappingProxyType({k: _congelar(v) for k, v in valor.items()})
+    return valor
+
 
 # Diretórios base
 BASE_DIR = Path(__file__).parent.parent
 CAMPEONATOS_DIR = BASE_DIR / "Campeonatos"
 
 # Estrutura de diretórios padrão para campeonatos
-SUBDIRS_CAMPEONATO = ["Regras", "Tabela", "Resultados", "Participantes"]
+SUBDIRS_CAMPEONATO = ("Regras", "Tabela", "Resultados", "Participantes")
 
 # Arquivos JSON padrão
 ARQUIVO_REGRAS = "regras.json"
@@ -22,17 +42,27 @@ MAX_GOLS_POR_TIME = 20  # Limite máximo de gols por time
 MIN_GOLS_POR_TIME = 0   # Limite mínimo de gols por time
 
 # Formatos de data aceitos
-FORMATOS_DATA = [
+FORMATOS_DATA = (
     "%Y-%m-%d %H:%M",
     "%d/%m/%Y %H:%M",
     "%d-%m-%Y %H:%M",
     "%Y-%m-%dT%H:%M:%S",
     "%Y-%m-%dT%H:%M:%SZ",
     "%Y-%m-%dT%H:%M:%S.%f"  # Suporte para microsegundos
-]
+)
 
-# Configurações de pontuação padrão
-REGRAS_PONTUACAO_PADRAO = {
+# Os mesmos formatos de FORMATOS_DATA, com campos de dois dígitos, em uma
+# única expressão regular (datas no formato ano-mês-dia ou dia/mês/ano)
+FORMATO_DATA_RX = re.compile(
+    r'(?P<ano>[0-9]{4})-(?P<mes>[0-9]{2})-(?P<dia>[0-9]{2})'
+    r'(?: (?P<hora>[0-9]{2}):(?P<minuto>[0-9]{2})'
+    r'|T(?P<hora_t>[0-9]{2}):(?P<minuto_t>[0-9]{2}):(?P<segundo>[0-9]{2})(?:Z|\.(?P<fracao>[0-9]{1,6}))?)'
+    r'|(?P<dia_br>[0-9]{2})(?P<separador>[/-])(?P<mes_br>[0-9]{2})(?P=separador)(?P<ano_br>[0-9]{4})'
+    r' (?P<hora_br>[0-9]{2}):(?P<minuto_br>[0-9]{2})'
+)
+
+# Configurações de pontuação padrão (somente leitura)
+REGRAS_PONTUACAO_PADRAO = _congelar({
     "resultado_exato": {
         "pontos_base": 12,
         "bonus_divisor": True,
@@ -84,10 +114,10 @@ REGRAS_PONTUACAO_PADRAO = {
         "descricao": "Palpite não enviado (jogo obrigatório)",
         "codigo": "PA"
     }
-}
+})
 
-# Configurações de normalização de nomes
-CARACTERES_ESPECIAIS = {
+# Configurações de normalização de nomes (somente leitura)
+CARACTERES_ESPECIAIS = MappingProxyType({
     'á': 'a', 'à': 'a', 'ã': 'a', 'â': 'a', 'ä': 'a',
     'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
     'í': 'i', 'ì': 'i', 'î': 'i', 'ï': 'i',
@@ -95,7 +125,25 @@ CARACTERES_ESPECIAIS = {
     'ú': 'u', 'ù': 'u', 'û': 'u', 'ü': 'u',
     'ç': 'c', 'ñ': 'n',
     '/': '-', '\\': '-', '_': '-'
-}
+})
+
+# Tabela para str.translate com as letras acentuadas de CARACTERES_ESPECIAIS,
+# em minúsculas e maiúsculas (mesmo resultado de remover os acentos pela
+# decomposição Unicode)
+TABELA_ACENTOS = str.maketrans({
+    **{k: v for k, v in CARACTERES_ESPECIAIS.items() if k.isalpha()},
+    **{k.upper(): v.upper() for k, v in CARACTERES_ESPECIAIS.items() if k.isalpha()}
+})
+
+# Marcas de acentuação (categoria Unicode Mn) dos blocos de diacríticos
+# combinantes, para removê-las com uma única substituição após a decomposição
+MARCAS_ACENTUACAO_RX = re.compile('[' + ''.join(
+    chr(codigo)
+    for inicio, fim in ((0x0300, 0x036F), (0x1AB0, 0x1AFF), (0x1DC0, 0x1DFF),
+                        (0x20D0, 0x20FF), (0xFE20, 0xFE2F))
+    for codigo in range(inicio, fim + 1)
+    if unicodedata.category(chr(codigo)) == 'Mn'
+) + ']')
 
 # Configurações de parsing de texto
 MARCADORES_RODADA = [
@@ -111,12 +159,12 @@ MARCADORES_APOSTADOR = [
     r'participante:\s*(.+)'
 ]
 
-MARCADORES_APOSTA_EXTRA = [
+MARCADORES_APOSTA_EXTRA = (
     'aposta extra',
     'extra',
     'jogo extra',
     'adicional'
-]
+)
 
 # Formatos de placar aceitos
 FORMATOS_PLACAR = [
@@ -126,6 +174,12 @@ FORMATOS_PLACAR = [
     r'(.+?)\s*\(\s*(\d+)\s*\)\s*x\s*\(\s*(\d+)\s*\)\s*(.+)'  # "Time1 (2) x (1) Time2"
 ]
 
+# Padrões de parsing já compilados (sem diferenciar maiúsculas de minúsculas),
+# para que os parsers não precisem compilá-los a cada uso
+MARCADORES_RODADA_RX = [re.compile(p, re.IGNORECASE) for p in MARCADORES_RODADA]
+MARCADORES_APOSTADOR_RX = [re.compile(p, re.IGNORECASE) for p in MARCADORES_APOSTADOR]
+FORMATOS_PLACAR_RX = [re.compile(p, re.IGNORECASE) for p in FORMATOS_PLACAR]
+
 # Configurações de relatórios
 FORMATO_RELATORIO_RODADA = "rodada{:02d}.txt"
 FORMATO_BACKUP_TABELA = "tabela_{timestamp}.json"
\ No newline at end of file
@@ -7,12 +7,14 @@ para um novo campeonato, incluindo validação de nomes duplicados
 e normalização de nomes.
 """
 
-import argparse
-import json
+import base64
+import os
+import secrets
+import shutil
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, List
 
 # Adicionar o diretório pai ao path para imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -25,7 +27,22 @@ from config import (
     REGRAS_PONTUACAO_PADRAO
 )
 from utils.normalizacao import normalizar_nome_campeonato
-from utils.validacao import validar_estrutura_tabela, validar_estrutura_regras
+from utils.serializacao import salvar_json
+
+# Funções públicas do script; argparse e os validadores de estrutura são
+# importados apenas nas funções que os utilizam, para acelerar a inicialização
+__all__ = [
+    'gerar_codigo_campeonato',
+    'obter_data_hora_utc',
+    'criar_estrutura_basica_tabela',
+    'criar_estrutura_basica_regras',
+    'criar_diretorio_campeonato',
+    'criar_subdiretorios',
+    'criar_arquivos_json_basicos',
+    'confirmar_operacao',
+    'criar_campeonato',
+    'main'
+]
 
 
 def gerar_codigo_campeonato() -> str:
@@ -35,14 +52,23 @@ def gerar_codigo_campeonato() -> str:
     Returns:
         String com código único
     """
-    import random
-    import string
+    # Gera código alfanumérico de 5 caracteres (letras A-Z e dígitos 2-7)
+    # codificando 4 bytes aleatórios em base32 de uma só vez
+    return base64.b32encode(secrets.token_bytes(4))[:5].decode('ascii')
+
+
+def obter_data_hora_utc() -> str:
+    """
+    Obtém o momento atual em ISO 8601 (UTC), ex: "2025-01-15T18:30:00Z".
     
-    # Gera código alfanumérico de 5 caracteres
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=5))
+    Returns:
+        Data e hora atuais com precisão de segundos
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec='seconds') + 'Z'
 
 
-def criar_estrutura_basica_tabela(nome_campeonato: str, temporada: str, codigo: str) -> dict:
+def criar_estrutura_basica_tabela(nome_campeonato: str, temporada: str, codigo: str,
+                                  data_hora: Optional[str] = None) -> dict:
     """
     Cria estrutura básica do arquivo tabela.json.
     
@@ -50,6 +76,7 @@ def criar_estrutura_basica_tabela(nome_campeonato: str, temporada: str, codigo:
         nome_campeonato: Nome do campeonato
         temporada: Temporada do campeonato
         codigo: Código único do campeonato
+        data_hora: Data e hora da criação em ISO 8601 (padrão: momento atual)
         
     Returns:
         Dicionário com estrutura básica da tabela
@@ -58,19 +85,21 @@ def criar_estrutura_basica_tabela(nome_campeonato: str, temporada: str, codigo:
         "campeonato": nome_campeonato,
         "temporada": temporada,
         "rodada_atual": 0,
-        "data_atualizacao": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "data_atualizacao": data_hora or obter_data_hora_utc(),
         "codigo_campeonato": codigo,
         "rodadas": []
     }
 
 
-def criar_estrutura_basica_regras(nome_campeonato: str, temporada: str) -> dict:
+def criar_estrutura_basica_regras(nome_campeonato: str, temporada: str,
+                                  data_hora: Optional[str] = None) -> dict:
     """
     Cria estrutura básica do arquivo regras.json.
     
     Args:
         nome_campeonato: Nome do campeonato
         temporada: Temporada do campeonato
+        data_hora: Data e hora da criação em ISO 8601 (padrão: momento atual)
         
     Returns:
         Dicionário com estrutura básica das regras
@@ -79,7 +108,7 @@ def criar_estrutura_basica_regras(nome_campeonato: str, temporada: str) -> dict:
         "campeonato": nome_campeonato,
         "temporada": temporada,
         "versao": "1.0",
-        "data_criacao": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "data_criacao": data_hora or obter_data_hora_utc(),
         "regras": {
             # Adiciona uma regra básica para passar na validação
             "placeholder": {
@@ -95,24 +124,14 @@ def criar_estrutura_basica_regras(nome_campeonato: str, temporada: str) -> dict:
     }
 
 
-def validar_nome_duplicado(nome_normalizado: str) -> bool:
-    """
-    Verifica se já existe um campeonato com o mesmo nome.
-    
-    Args:
-        nome_normalizado: Nome normalizado do campeonato
-        
-    Returns:
-        True se o nome já existe, False caso contrário
-    """
-    caminho_campeonato = CAMPEONATOS_DIR / nome_normalizado
-    return caminho_campeonato.exists()
-
-
 def criar_diretorio_campeonato(nome_normalizado: str, sobrescrever: bool = False) -> Path:
     """
     Cria o diretório principal do campeonato.
     
+    A existência do diretório é verificada pela própria criação: se já existir
+    um campeonato com o mesmo nome e sobrescrever for False, FileExistsError
+    é lançado para que o chamador decida o que fazer.
+    
     Args:
         nome_normalizado: Nome normalizado do campeonato
         sobrescrever: Se True, remove diretório existente antes de criar
@@ -121,26 +140,27 @@ def criar_diretorio_campeonato(nome_normalizado: str, sobrescrever: bool = False
         Path para o diretório criado
         
     Raises:
+        FileExistsError: Se o diretório já existir e sobrescrever for False
         OSError: Se não conseguir criar o diretório
     """
     caminho_campeonato = CAMPEONATOS_DIR / nome_normalizado
     
     try:
-        # Criar diretório Campeonatos se não existir
-        CAMPEONATOS_DIR.mkdir(parents=True, exist_ok=True)
+        # Se deve sobrescrever, remove o diretório anterior (se houver); falhas
+        # na remoção são propagadas, e não confundidas com diretório existente
+        if sobrescrever:
+            try:
+                shutil.rmtree(caminho_campeonato)
+            except FileNotFoundError:
+                pass
         
-        # Se deve sobrescrever e o diretório existe, remove primeiro
-        if sobrescrever and caminho_campeonato.exists():
-            import shutil
-            shutil.rmtree(caminho_campeonato)
-        
-        # Criar diretório do campeonato
-        caminho_campeonato.mkdir(parents=True, exist_ok=sobrescrever)
+        # Criar diretório do campeonato (e o diretório Campeonatos, se necessário)
+        caminho_campeonato.mkdir(parents=True)
         
         return caminho_campeonato
         
     except FileExistsError:
-        raise OSError(f"Diretório do campeonato '{nome_normalizado}' já existe")
+        raise FileExistsError(f"Diretório do campeonato '{nome_normalizado}' já existe")
     except Exception as e:
         raise OSError(f"Erro ao criar diretório do campeonato: {str(e)}")
 
@@ -156,9 +176,13 @@ def criar_subdiretorios(caminho_campeonato: Path) -> None:
         OSError: Se não conseguir criar algum subdiretório
     """
     try:
+        # Uma única listagem do diretório substitui uma verificação por subdiretório
+        with os.scandir(caminho_campeonato) as entradas:
+            existentes = {entrada.name for entrada in entradas}
+        
         for subdir in SUBDIRS_CAMPEONATO:
-            subdir_path = caminho_campeonato / subdir
-            subdir_path.mkdir(parents=True, exist_ok=True)
+            if subdir not in existentes:
+                os.mkdir(os.path.join(caminho_campeonato, subdir))
             
     except Exception as e:
         raise OSError(f"Erro ao criar subdiretórios: {str(e)}")
@@ -179,9 +203,14 @@ def criar_arquivos_json_basicos(caminho_campeonato: Path, nome_campeonato: str,
         OSError: Se não conseguir criar algum arquivo
         ValueError: Se a estrutura gerada for inválida
     """
+    from utils.validacao import validar_estrutura_tabela, validar_estrutura_regras
+    
     try:
+        # Mesma data e hora de criação para os dois arquivos
+        data_hora = obter_data_hora_utc()
+        
         # Criar arquivo tabela.json
-        estrutura_tabela = criar_estrutura_basica_tabela(nome_campeonato, temporada, codigo)
+        estrutura_tabela = criar_estrutura_basica_tabela(nome_campeonato, temporada, codigo, data_hora)
         
         # Validar estrutura antes de salvar
         valido, erros = validar_estrutura_tabela(estrutura_tabela)
@@ -189,11 +218,10 @@ def criar_arquivos_json_basicos(caminho_campeonato: Path, nome_campeonato: str,
             raise ValueError(f"Estrutura da tabela inválida: {'; '.join(erros)}")
         
         caminho_tabela = caminho_campeonato / "Tabela" / ARQUIVO_TABELA
-        with open(caminho_tabela, 'w', encoding='utf-8') as f:
-            json.dump(estrutura_tabela, f, indent=2, ensure_ascii=False)
+        salvar_json(caminho_tabela, estrutura_tabela)
         
         # Criar arquivo regras.json
-        estrutura_regras = criar_estrutura_basica_regras(nome_campeonato, temporada)
+        estrutura_regras = criar_estrutura_basica_regras(nome_campeonato, temporada, data_hora)
         
         # Validar estrutura antes de salvar
         valido, erros = validar_estrutura_regras(estrutura_regras)
@@ -201,8 +229,7 @@ def criar_arquivos_json_basicos(caminho_campeonato: Path, nome_campeonato: str,
             raise ValueError(f"Estrutura das regras inválida: {'; '.join(erros)}")
         
         caminho_regras = caminho_campeonato / "Regras" / ARQUIVO_REGRAS
-        with open(caminho_regras, 'w', encoding='utf-8') as f:
-            json.dump(estrutura_regras, f, indent=2, ensure_ascii=False)
+        salvar_json(caminho_regras, estrutura_regras)
             
     except Exception as e:
         raise OSError(f"Erro ao criar arquivos JSON: {str(e)}")
@@ -244,18 +271,18 @@ def criar_campeonato(nome: str, temporada: str, codigo: Optional[str] = None,
             print("Erro: Nome do campeonato inválido após normalização")
             return False
         
-        # Verificar se nome já existe
-        sobrescrever = False
-        if validar_nome_duplicado(nome_normalizado):
+        # Criar diretório do campeonato; se o nome já existir, confirmar antes de sobrescrever
+        try:
+            caminho_campeonato = criar_diretorio_campeonato(nome_normalizado)
+        except FileExistsError:
             if not forcar:
                 print(f"Aviso: Já existe um campeonato com nome '{nome_normalizado}'")
                 if not confirmar_operacao("Deseja continuar mesmo assim?"):
                     print("Operação cancelada pelo usuário")
                     return False
-                sobrescrever = True
             else:
                 print(f"Aviso: Sobrescrevendo campeonato existente '{nome_normalizado}'")
-                sobrescrever = True
+            caminho_campeonato = criar_diretorio_campeonato(nome_normalizado, sobrescrever=True)
         
         # Gerar código se não fornecido
         if not codigo:
@@ -264,9 +291,6 @@ def criar_campeonato(nome: str, temporada: str, codigo: Optional[str] = None,
         print(f"Criando campeonato '{nome}' (normalizado: '{nome_normalizado}')")
         print(f"Temporada: {temporada}")
         print(f"Código: {codigo}")
-        
-        # Criar estrutura do campeonato
-        caminho_campeonato = criar_diretorio_campeonato(nome_normalizado, sobrescrever)
         print(f"✓ Diretório principal criado: {caminho_campeonato}")
         
         criar_subdiretorios(caminho_campeonato)
@@ -298,8 +322,18 @@ def criar_campeonato(nome: str, temporada: str, codigo: Optional[str] = None,
         return False
 
 
-def main():
-    """Função principal do script."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Função principal do script.
+    
+    Args:
+        argv: Argumentos de linha de comando (padrão: sys.argv[1:])
+        
+    Returns:
+        Código de saída do script (0 para sucesso)
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Cria estrutura inicial de um novo campeonato",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -334,20 +368,20 @@ Exemplos de uso:
         help='Força criação sem confirmação, mesmo se campeonato já existir'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Validar argumentos
     if not args.nome.strip():
         print("Erro: Nome do campeonato não pode estar vazio")
-        sys.exit(1)
+        return 1
     
     if not args.temporada.strip():
         print("Erro: Temporada não pode estar vazia")
-        sys.exit(1)
+        return 1
     
     if args.codigo and len(args.codigo) != 5:
         print("Erro: Código do campeonato deve ter exatamente 5 caracteres")
-        sys.exit(1)
+        return 1
     
     # Executar criação do campeonato
     sucesso = criar_campeonato(
@@ -359,11 +393,11 @@ Exemplos de uso:
     
     if sucesso:
         print("\n✅ Script executado com sucesso!")
-        sys.exit(0)
+        return 0
     else:
         print("\n❌ Falha na execução do script")
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -8,16 +8,22 @@ ou planilhas Excel, normalização de nomes e validação de duplicados.
 """
 
 import argparse
+import base64
 import json
+import os
+import secrets
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
-import random
-import string
+from typing import Iterable, List, Optional, Sequence, Set, Tuple, Union
 
-# Adicionar o diretório pai ao path para imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Adicionar o diretório pai ao path para imports (uma única vez, mesmo que
+# o módulo seja importado novamente, ex: por testes ou outros scripts)
+_DIRETORIO_SRC = str(Path(__file__).parent.parent)
+if _DIRETORIO_SRC not in sys.path:
+    sys.path.append(_DIRETORIO_SRC)
 
 from config import (
     CAMPEONATOS_DIR, 
@@ -25,16 +31,44 @@ from config import (
 )
 from utils.normalizacao import normalizar_nome_participante
 from utils.validacao import validar_estrutura_palpites
+from utils.serializacao import serializar_json
 
+# Criação de diretórios e arquivos é limitada por I/O: mais threads que CPUs
+MAX_THREADS_CRIACAO = min(32, (os.cpu_count() or 1) * 4)
 
-def gerar_codigo_participante() -> str:
+# Marcadores do nome e do código no modelo de palpites.json (caracteres
+# nulos, que não aparecem em nomes válidos)
+MARCADOR_APOSTADOR = "\x00apostador\x00"
+MARCADOR_CODIGO = "\x00codigo\x00"
+_MARCADOR_APOSTADOR_JSON = serializar_json(MARCADOR_APOSTADOR)
+_MARCADOR_CODIGO_JSON = serializar_json(MARCADOR_CODIGO)
+
+# Máximo de itens exibidos nas listas de avisos (duplicados, já existentes)
+LIMITE_LISTAGEM = 20
+
+
+def gerar_codigo_participante(codigos_usados: Optional[Set[str]] = None) -> str:
     """
     Gera código único de 4 dígitos para o participante.
     
+    Args:
+        codigos_usados: Códigos já atribuídos (opcional); o código gerado é
+            diferente de todos eles e é acrescentado ao conjunto
+    
     Returns:
         String com código único alfanumérico
     """
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
+    while True:
+        # Código alfanumérico de 4 caracteres (letras A-Z e dígitos 2-7)
+        # codificando 3 bytes aleatórios em base32 de uma só vez
+        codigo = base64.b32encode(secrets.token_bytes(3))[:4].decode('ascii')
+        
+        if codigos_usados is None:
+            return codigo
+        
+        if codigo not in codigos_usados:
+            codigos_usados.add(codigo)
+            return codigo
 
 
 def ler_nomes_arquivo_texto(caminho_arquivo: Path) -> List[str]:
@@ -55,15 +89,10 @@ def ler_nomes_arquivo_texto(caminho_arquivo: Path) -> List[str]:
         if not caminho_arquivo.exists():
             raise OSError(f"Arquivo não encontrado: {caminho_arquivo}")
         
-        with open(caminho_arquivo, 'r', encoding='utf-8') as f:
-            linhas = f.readlines()
-        
-        # Filtrar linhas vazias e remover espaços
-        nomes = []
-        for i, linha in enumerate(linhas, 1):
-            nome = linha.strip()
-            if nome:  # Ignora linhas vazias
-                nomes.append(nome)
+        # Percorre o arquivo linha a linha (buffer de 1 MiB), filtrando linhas
+        # vazias e removendo espaços, sem montar a lista de linhas
+        with open(caminho_arquivo, 'r', encoding='utf-8', buffering=1024 * 1024) as f:
+            nomes = [nome for nome in (linha.strip() for linha in f) if nome]
         
         if not nomes:
             raise ValueError(f"Arquivo '{caminho_arquivo}' não contém nomes válidos")
@@ -76,10 +105,62 @@ def ler_nomes_arquivo_texto(caminho_arquivo: Path) -> List[str]:
         raise OSError(f"Erro ao ler arquivo '{caminho_arquivo}': {str(e)}")
 
 
+def extrair_nomes_coluna(linhas: Iterable[Sequence], nome_coluna: str) -> List[str]:
+    """
+    Extrai os nomes de uma coluna a partir das linhas de uma planilha.
+    
+    Args:
+        linhas: Linhas da planilha (valores das células), começando pelo cabeçalho
+        nome_coluna: Nome da coluna que contém os nomes (sem diferenciar maiúsculas)
+        
+    Returns:
+        Lista de nomes extraídos da coluna
+        
+    Raises:
+        ValueError: Se a coluna não for encontrada ou estiver vazia
+    """
+    linhas = iter(linhas)
+    
+    # Encontrar coluna com os nomes: mapa do cabeçalho normalizado para o
+    # índice da coluna (a primeira ocorrência prevalece em nomes repetidos)
+    cabecalho = next(linhas, ())
+    indices_colunas = {}
+    for indice, valor_cabecalho in enumerate(cabecalho):
+        if valor_cabecalho:
+            indices_colunas.setdefault(str(valor_cabecalho).strip().lower(), indice)
+    
+    coluna_nomes = indices_colunas.get(nome_coluna.strip().lower())
+    
+    if coluna_nomes is None:
+        colunas_disponiveis = [str(valor) for valor in cabecalho if valor]
+        
+        raise ValueError(f"Coluna '{nome_coluna}' não encontrada. Colunas disponíveis: {', '.join(colunas_disponiveis)}")
+    
+    # Extrair nomes da coluna (demais linhas, após o cabeçalho)
+    nomes = []
+    for linha in linhas:
+        valor = linha[coluna_nomes] if coluna_nomes < len(linha) else None
+        if not valor:
+            continue
+        
+        # Células de texto já são str: converte apenas os demais valores
+        nome = valor.strip() if type(valor) is str else str(valor).strip()
+        if nome:
+            nomes.append(nome)
+    
+    if not nomes:
+        raise ValueError(f"Coluna '{nome_coluna}' não contém nomes válidos")
+    
+    return nomes
+
+
 def ler_nomes_planilha_excel(caminho_arquivo: Path, nome_coluna: str = "Nome") -> List[str]:
     """
     Lê lista de nomes de planilha Excel.
     
+    Usa python-calamine quando instalado, que lê a planilha em código nativo,
+    e openpyxl em modo somente leitura caso contrário.
+    
     Args:
         caminho_arquivo: Path para o arquivo Excel
         nome_coluna: Nome da coluna que contém os nomes
@@ -90,51 +171,37 @@ def ler_nomes_planilha_excel(caminho_arquivo: Path, nome_coluna: str = "Nome") -
     Raises:
         OSError: Se não conseguir ler o arquivo
         ValueError: Se a coluna não for encontrada ou estiver vazia
-        ImportError: Se openpyxl não estiver instalado
+        ImportError: Se nem python-calamine nem openpyxl estiverem instalados
     """
     try:
-        import openpyxl
+        from python_calamine import CalamineWorkbook
     except ImportError:
-        raise ImportError("Biblioteca 'openpyxl' não encontrada. Instale com: pip install openpyxl")
+        CalamineWorkbook = None
+        try:
+            import openpyxl
+        except ImportError:
+            raise ImportError("Biblioteca 'openpyxl' não encontrada. Instale com: pip install openpyxl "
+                              "(ou pip install python-calamine)")
     
     try:
         if not caminho_arquivo.exists():
             raise OSError(f"Arquivo não encontrado: {caminho_arquivo}")
         
-        # Carregar planilha
-        workbook = openpyxl.load_workbook(caminho_arquivo)
-        sheet = workbook.active
-        
-        # Encontrar coluna com os nomes
-        coluna_nomes = None
-        for col in range(1, sheet.max_column + 1):
-            valor_cabecalho = sheet.cell(row=1, column=col).value
-            if valor_cabecalho and str(valor_cabecalho).strip().lower() == nome_coluna.lower():
-                coluna_nomes = col
-                break
-        
-        if coluna_nomes is None:
-            colunas_disponiveis = []
-            for col in range(1, sheet.max_column + 1):
-                valor = sheet.cell(row=1, column=col).value
-                if valor:
-                    colunas_disponiveis.append(str(valor))
-            
-            raise ValueError(f"Coluna '{nome_coluna}' não encontrada. Colunas disponíveis: {', '.join(colunas_disponiveis)}")
-        
-        # Extrair nomes da coluna (começando da linha 2, pulando cabeçalho)
-        nomes = []
-        for row in range(2, sheet.max_row + 1):
-            valor = sheet.cell(row=row, column=coluna_nomes).value
-            if valor:
-                nome = str(valor).strip()
-                if nome:
-                    nomes.append(nome)
+        if CalamineWorkbook is not None:
+            # Primeira planilha, já convertida em lista de linhas
+            linhas = CalamineWorkbook.from_path(str(caminho_arquivo)).get_sheet_by_index(0).to_python(
+                skip_empty_area=True
+            )
+            return extrair_nomes_coluna(linhas, nome_coluna)
         
-        if not nomes:
-            raise ValueError(f"Coluna '{nome_coluna}' não contém nomes válidos")
-        
-        return nomes
+        # Carregar planilha em modo somente leitura: as linhas são lidas sob
+        # demanda, sem montar a árvore de células da planilha inteira
+        workbook = openpyxl.load_workbook(caminho_arquivo, read_only=True, data_only=True, keep_links=False)
+        try:
+            return extrair_nomes_coluna(workbook.active.iter_rows(values_only=True), nome_coluna)
+        finally:
+            # Obrigatório no modo somente leitura para liberar o arquivo
+            workbook.close()
         
     except Exception as e:
         if isinstance(e, (OSError, ValueError, ImportError)):
@@ -186,11 +253,13 @@ def verificar_campeonato_existe(nome_campeonato: str) -> Tuple[bool, Path, Optio
     """
     caminho_campeonato = CAMPEONATOS_DIR / nome_campeonato
     
-    if not caminho_campeonato.exists():
+    # Verificar se existe e é um diretório válido de campeonato com um único stat
+    try:
+        info = os.stat(caminho_campeonato)
+    except OSError:
         return (False, caminho_campeonato, None)
     
-    # Verificar se é um diretório válido de campeonato
-    if not caminho_campeonato.is_dir():
+    if not stat.S_ISDIR(info.st_mode):
         return (False, caminho_campeonato, None)
     
     # Tentar obter dados do campeonato
@@ -213,13 +282,15 @@ def obter_participantes_existentes(caminho_campeonato: Path) -> Set[str]:
     
     caminho_participantes = caminho_campeonato / "Participantes"
     
-    if caminho_participantes.exists():
-        try:
-            for item in caminho_participantes.iterdir():
-                if item.is_dir():
-                    participantes_existentes.add(item.name)
-        except Exception:
-            pass  # Ignora erros de acesso
+    # os.scandir informa o tipo de cada entrada junto com a listagem,
+    # sem um stat por participante
+    try:
+        with os.scandir(caminho_participantes) as entradas:
+            for entrada in entradas:
+                if entrada.is_dir():
+                    participantes_existentes.add(entrada.name)
+    except OSError:
+        pass  # Diretório inexistente ou erro de acesso
     
     return participantes_existentes
 
@@ -247,122 +318,243 @@ def criar_estrutura_basica_palpites(nome_participante: str, codigo_participante:
     }
 
 
-def criar_diretorio_participante(caminho_participantes: Path, nome_normalizado: str) -> Path:
+def criar_diretorio_participante(caminho_participantes: Union[str, Path], nome_normalizado: str,
+                                 exist_ok: bool = False) -> str:
     """
     Cria o diretório do participante.
     
+    O diretório Participantes deve existir; ele é criado uma única vez pelo
+    chamador, antes de criar os participantes.
+    
     Args:
-        caminho_participantes: Path para o diretório de participantes
+        caminho_participantes: Caminho do diretório de participantes
         nome_normalizado: Nome normalizado do participante
+        exist_ok: Se True, não considera erro o diretório já existir
         
     Returns:
-        Path para o diretório criado
+        Caminho (string) do diretório criado
         
     Raises:
         OSError: Se não conseguir criar o diretório
     """
+    caminho_participante = os.path.join(caminho_participantes, nome_normalizado)
+    
     try:
-        # Garantir que o diretório Participantes existe
-        caminho_participantes.mkdir(parents=True, exist_ok=True)
-        
-        # Criar diretório do participante
-        caminho_participante = caminho_participantes / nome_normalizado
-        caminho_participante.mkdir(parents=True, exist_ok=True)
-        
-        return caminho_participante
-        
+        os.mkdir(caminho_participante)
+    except FileExistsError:
+        if not exist_ok:
+            raise OSError(f"Erro ao criar diretório do participante '{nome_normalizado}': diretório já existe")
     except Exception as e:
         raise OSError(f"Erro ao criar diretório do participante '{nome_normalizado}': {str(e)}")
+    
+    return caminho_participante
 
 
-def criar_arquivo_palpites_vazio(caminho_participante: Path, nome_participante: str, 
-                                codigo_participante: str, nome_campeonato: str, 
-                                temporada: str) -> None:
+def criar_modelo_palpites(nome_campeonato: str, temporada: str) -> bytes:
     """
-    Cria o arquivo palpites.json vazio para o participante.
+    Serializa uma única vez o palpites.json vazio de um campeonato, com
+    marcadores no lugar do nome e do código do participante.
     
     Args:
-        caminho_participante: Path para o diretório do participante
-        nome_participante: Nome original do participante
-        codigo_participante: Código único do participante
         nome_campeonato: Nome do campeonato
         temporada: Temporada do campeonato
         
+    Returns:
+        Conteúdo JSON do modelo (ver preencher_modelo_palpites)
+    """
+    return serializar_json(
+        criar_estrutura_basica_palpites(MARCADOR_APOSTADOR, MARCADOR_CODIGO, nome_campeonato, temporada)
+    )
+
+
+def preencher_modelo_palpites(modelo: bytes, nome_participante: str, codigo_participante: str) -> bytes:
+    """
+    Gera o conteúdo do palpites.json de um participante a partir do modelo.
+    
+    O resultado é idêntico a serializar a estrutura de
+    criar_estrutura_basica_palpites, mas apenas o nome e o código são
+    serializados para cada participante.
+    
+    Args:
+        modelo: Modelo gerado por criar_modelo_palpites
+        nome_participante: Nome original do participante
+        codigo_participante: Código único do participante
+        
+    Returns:
+        Conteúdo JSON do arquivo palpites.json
+    """
+    # "apostador" e "codigo_apostador" são os primeiros campos da estrutura,
+    # então a primeira ocorrência de cada marcador é a do próprio campo. O nome
+    # é substituído por último, para que seu conteúdo nunca seja examinado
+    return modelo.replace(
+        _MARCADOR_CODIGO_JSON, serializar_json(codigo_participante), 1
+    ).replace(
+        _MARCADOR_APOSTADOR_JSON, serializar_json(nome_participante), 1
+    )
+
+
+def gravar_arquivo_novo(caminho_arquivo: Union[str, Path], conteudo: bytes) -> None:
+    """
+    Grava um arquivo que ainda não existe, diretamente pelo descritor.
+    
+    O arquivo é criado com O_EXCL: se já existir, nada é sobrescrito (sem
+    a janela entre verificar e criar de um exists() seguido de open()).
+    
+    Args:
+        caminho_arquivo: Caminho do arquivo a ser criado
+        conteudo: Bytes a serem gravados
+        
     Raises:
-        OSError: Se não conseguir criar o arquivo
-        ValueError: Se a estrutura gerada for inválida
+        OSError: Se o arquivo já existir ou não puder ser gravado
     """
     try:
-        # Criar estrutura básica
-        estrutura_palpites = criar_estrutura_basica_palpites(
-            nome_participante, codigo_participante, nome_campeonato, temporada
-        )
+        fd = os.open(caminho_arquivo, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o644)
+    except FileExistsError:
+        raise OSError(f"Arquivo '{caminho_arquivo}' já existe")
+    
+    try:
+        dados = memoryview(conteudo)
+        while dados:
+            dados = dados[os.write(fd, dados):]
+    finally:
+        os.close(fd)
+
+
+def criar_participante(caminho_participantes: Union[str, Path], nome_participante: str,
+                       nome_normalizado: str, codigo_participante: str,
+                       modelo_palpites: bytes) -> str:
+    """
+    Cria o diretório e o arquivo palpites.json de um participante.
+    
+    Args:
+        caminho_participantes: Caminho do diretório de participantes
+        nome_participante: Nome original do participante
+        nome_normalizado: Nome normalizado do participante
+        codigo_participante: Código único do participante
+        modelo_palpites: Modelo do palpites.json do campeonato (ver criar_modelo_palpites)
         
-        # Validar estrutura antes de salvar
-        valido, erros = validar_estrutura_palpites(estrutura_palpites)
-        if not valido:
-            raise ValueError(f"Estrutura dos palpites inválida: {'; '.join(erros)}")
+    Returns:
+        Caminho (string) do diretório do participante
         
-        # Escrever arquivo
-        caminho_palpites = caminho_participante / ARQUIVO_PALPITES
-        with open(caminho_palpites, 'w', encoding='utf-8') as f:
-            json.dump(estrutura_palpites, f, indent=2, ensure_ascii=False)
-            
-    except Exception as e:
-        if isinstance(e, (OSError, ValueError)):
-            raise
-        else:
-            raise OSError(f"Erro ao criar arquivo de palpites: {str(e)}")
+    Raises:
+        OSError: Se não conseguir criar o diretório ou o arquivo
+    """
+    caminho_participante = criar_diretorio_participante(caminho_participantes, nome_normalizado)
+    
+    conteudo = preencher_modelo_palpites(modelo_palpites, nome_participante, codigo_participante)
+    gravar_arquivo_novo(os.path.join(caminho_participante, ARQUIVO_PALPITES), conteudo)
+    
+    return caminho_participante
 
 
 def confirmar_operacao(mensagem: str) -> bool:
     """
     Solicita confirmação do usuário para operações críticas.
     
+    Sem um terminal na entrada padrão (ex: cron, CI ou entrada redirecionada)
+    não há quem responda: a operação não é confirmada, sem aguardar leitura.
+    Nesses casos use --forcar para prosseguir sem confirmação.
+    
     Args:
         mensagem: Mensagem a ser exibida
         
     Returns:
         True se o usuário confirmar, False caso contrário
     """
+    if not sys.stdin or not sys.stdin.isatty():
+        print(f"{mensagem} (s/n): entrada não interativa, operação não confirmada (use --forcar)")
+        return False
+    
     resposta = input(f"{mensagem} (s/n): ").strip().lower()
     return resposta in ['s', 'sim', 'y', 'yes']
 
 
-def processar_lista_participantes(nomes_originais: List[str]) -> Tuple[List[Tuple[str, str]], List[str]]:
+def classificar_participantes(nomes_originais: List[str], participantes_existentes: Set[str]
+                              ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]], List[str]]:
     """
-    Processa lista de nomes, normalizando e detectando duplicados.
+    Normaliza a lista de nomes e classifica cada um em uma única passagem.
     
     Args:
         nomes_originais: Lista de nomes originais
+        participantes_existentes: Nomes normalizados dos participantes já existentes
         
     Returns:
-        Tupla (lista_processada, lista_duplicados)
-        onde lista_processada contém tuplas (nome_original, nome_normalizado)
-        e lista_duplicados contém nomes que resultaram em duplicados após normalização
+        Tupla (novos, ja_existem, duplicados) onde novos e ja_existem contêm
+        tuplas (nome_original, nome_normalizado) e duplicados contém nomes que
+        repetem um nome anterior da lista após normalização
     """
-    nomes_processados = []
-    nomes_normalizados_vistos = set()
+    novos = []
+    ja_existem = []
     duplicados = []
     
+    # Nome normalizado -> já apareceu na lista? Os existentes começam como não vistos,
+    # de forma que cada nome é classificado com uma única consulta
+    vistos = dict.fromkeys(participantes_existentes, False)
+    
+    # Nomes repetidos na lista (ex: mesma pessoa duas vezes na planilha)
+    # são normalizados uma única vez
+    normalizados = {}
+    
     for nome_original in nomes_originais:
-        nome_normalizado = normalizar_nome_participante(nome_original)
+        nome_normalizado = normalizados.get(nome_original)
+        if nome_normalizado is None:
+            nome_normalizado = normalizados[nome_original] = normalizar_nome_participante(nome_original)
         
         if not nome_normalizado:
             print(f"Aviso: Nome '{nome_original}' resultou em string vazia após normalização - ignorado")
             continue
         
-        if nome_normalizado in nomes_normalizados_vistos:
-            duplicados.append(nome_original)
+        visto = vistos.get(nome_normalizado)
+        if visto is None:
+            novos.append((nome_original, nome_normalizado))
+        elif not visto:
+            ja_existem.append((nome_original, nome_normalizado))
         else:
-            nomes_normalizados_vistos.add(nome_normalizado)
-            nomes_processados.append((nome_original, nome_normalizado))
+            duplicados.append(nome_original)
+            continue
+        
+        vistos[nome_normalizado] = True
+    
+    return novos, ja_existem, duplicados
+
+
+def processar_lista_participantes(nomes_originais: List[str]) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    Processa lista de nomes, normalizando e detectando duplicados.
+    
+    Args:
+        nomes_originais: Lista de nomes originais
+        
+    Returns:
+        Tupla (lista_processada, lista_duplicados)
+        onde lista_processada contém tuplas (nome_original, nome_normalizado)
+        e lista_duplicados contém nomes que resultaram em duplicados após normalização
+    """
+    nomes_processados, _, duplicados = classificar_participantes(nomes_originais, set())
     
     return nomes_processados, duplicados
 
 
+def exibir_lista(itens: List[str], detalhado: bool = False) -> None:
+    """
+    Exibe uma lista de itens de aviso, um por linha, em uma única escrita.
+    
+    Args:
+        itens: Textos a serem exibidos
+        detalhado: Se True, exibe todos os itens; caso contrário exibe no
+            máximo LIMITE_LISTAGEM e resume os demais
+    """
+    exibidos = itens if detalhado else itens[:LIMITE_LISTAGEM]
+    linhas = [f"  - {item}" for item in exibidos]
+    
+    if len(itens) > len(exibidos):
+        linhas.append(f"  ... (+{len(itens) - len(exibidos)} mais; use --detalhado para ver todos)")
+    
+    sys.stdout.write("\n".join(linhas) + "\n")
+
+
 def criar_participantes(nome_campeonato: str, nomes_participantes: List[str], 
-                       forcar: bool = False) -> bool:
+                       forcar: bool = False, detalhado: bool = False) -> bool:
     """
     Função principal para criar participantes de um campeonato.
     
@@ -370,6 +562,7 @@ def criar_participantes(nome_campeonato: str, nomes_participantes: List[str],
         nome_campeonato: Nome normalizado do campeonato
         nomes_participantes: Lista de nomes dos participantes
         forcar: Se True, não solicita confirmação para operações
+        detalhado: Se True, lista todos os duplicados e já existentes
         
     Returns:
         True se os participantes foram criados com sucesso, False caso contrário
@@ -398,41 +591,44 @@ def criar_participantes(nome_campeonato: str, nomes_participantes: List[str],
                 print("Erro: Nome e temporada são obrigatórios")
                 return False
         
+        # A estrutura do palpites.json só varia no nome e no código do
+        # participante (strings por construção): valida-se um exemplo uma
+        # única vez, antes de qualquer processamento
+        valido, erros = validar_estrutura_palpites(
+            criar_estrutura_basica_palpites("", "", nome_original_campeonato, temporada)
+        )
+        if not valido:
+            print(f"Erro: Estrutura dos palpites inválida: {'; '.join(erros)}")
+            return False
+        
         # Processar lista de participantes
         print(f"Processando {len(nomes_participantes)} nomes de participantes...")
         
-        nomes_processados, duplicados = processar_lista_participantes(nomes_participantes)
+        # Normalizar, detectar duplicados e separar os já existentes em uma única passagem
+        participantes_existentes = obter_participantes_existentes(caminho_campeonato)
+        novos_participantes, participantes_ja_existem, duplicados = classificar_participantes(
+            nomes_participantes, participantes_existentes
+        )
         
         if duplicados:
             print(f"Aviso: {len(duplicados)} nomes resultaram em duplicados após normalização:")
-            for dup in duplicados:
-                print(f"  - {dup}")
+            exibir_lista(duplicados, detalhado)
             
             if not forcar:
                 if not confirmar_operacao("Deseja continuar mesmo assim?"):
                     print("Operação cancelada pelo usuário")
                     return False
         
-        if not nomes_processados:
+        if not novos_participantes and not participantes_ja_existem:
             print("Erro: Nenhum nome válido para processar")
             return False
         
-        # Verificar participantes já existentes
-        participantes_existentes = obter_participantes_existentes(caminho_campeonato)
-        
-        novos_participantes = []
-        participantes_ja_existem = []
-        
-        for nome_original, nome_normalizado in nomes_processados:
-            if nome_normalizado in participantes_existentes:
-                participantes_ja_existem.append((nome_original, nome_normalizado))
-            else:
-                novos_participantes.append((nome_original, nome_normalizado))
-        
         if participantes_ja_existem:
             print(f"Aviso: {len(participantes_ja_existem)} participantes já existem:")
-            for nome_orig, nome_norm in participantes_ja_existem:
-                print(f"  - {nome_orig} (diretório: {nome_norm})")
+            exibir_lista(
+                [f"{nome_orig} (diretório: {nome_norm})" for nome_orig, nome_norm in participantes_ja_existem],
+                detalhado
+            )
             
             if not forcar:
                 if not confirmar_operacao("Deseja continuar criando apenas os novos participantes?"):
@@ -447,30 +643,42 @@ def criar_participantes(nome_campeonato: str, nomes_participantes: List[str],
         
         # Criar estrutura para cada participante
         caminho_participantes = caminho_campeonato / "Participantes"
+        caminho_participantes.mkdir(parents=True, exist_ok=True)
+        
+        # Caminho base como string: os caminhos de cada participante são
+        # montados com os.path.join, sem criar um objeto Path por operação
+        base_participantes = os.fspath(caminho_participantes)
         participantes_criados = 0
+        codigos_usados = set()
         
-        for nome_original, nome_normalizado in novos_participantes:
-            try:
-                # Gerar código único
-                codigo_participante = gerar_codigo_participante()
-                
-                print(f"Criando participante: {nome_original} (diretório: {nome_normalizado}, código: {codigo_participante})")
-                
-                # Criar diretório
-                caminho_participante = criar_diretorio_participante(caminho_participantes, nome_normalizado)
-                
-                # Criar arquivo palpites.json
-                criar_arquivo_palpites_vazio(
-                    caminho_participante, nome_original, codigo_participante,
-                    nome_original_campeonato, temporada
+        modelo_palpites = criar_modelo_palpites(nome_original_campeonato, temporada)
+        
+        # Códigos gerados antes, para que sejam únicos no lote; diretório e
+        # arquivo de cada participante são independentes e criados em paralelo
+        codigos = [gerar_codigo_participante(codigos_usados) for _ in novos_participantes]
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_THREADS_CRIACAO, len(novos_participantes))) as executor:
+            futuros = [
+                executor.submit(
+                    criar_participante, base_participantes, nome_original, nome_normalizado,
+                    codigo_participante, modelo_palpites
                 )
+                for (nome_original, nome_normalizado), codigo_participante in zip(novos_participantes, codigos)
+            ]
+            
+            # Resultados na ordem da lista, para manter a saída determinística
+            for (nome_original, nome_normalizado), codigo_participante, futuro in zip(
+                novos_participantes, codigos, futuros
+            ):
+                print(f"Criando participante: {nome_original} (diretório: {nome_normalizado}, código: {codigo_participante})")
                 
-                participantes_criados += 1
-                print(f"✓ Participante '{nome_original}' criado com sucesso")
-                
-            except Exception as e:
-                print(f"✗ Erro ao criar participante '{nome_original}': {str(e)}")
-                continue
+                try:
+                    futuro.result()
+                    participantes_criados += 1
+                    print(f"✓ Participante '{nome_original}' criado com sucesso")
+                    
+                except Exception as e:
+                    print(f"✗ Erro ao criar participante '{nome_original}': {str(e)}")
         
         # Resumo final
         print(f"\n🎉 Processo concluído!")
@@ -501,8 +709,16 @@ def criar_participantes(nome_campeonato: str, nomes_participantes: List[str],
         return False
 
 
-def main():
-    """Função principal do script."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Função principal do script.
+    
+    Args:
+        argv: Argumentos de linha de comando (padrão: sys.argv[1:])
+        
+    Returns:
+        Código de saída do script (0 para sucesso)
+    """
     parser = argparse.ArgumentParser(
         description="Cria estrutura de participantes para um campeonato",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -545,16 +761,22 @@ Exemplos de uso:
         help='Força criação sem confirmação, mesmo com duplicados ou participantes existentes'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--detalhado',
+        action='store_true',
+        help=f'Lista todos os nomes duplicados e participantes existentes (padrão: até {LIMITE_LISTAGEM})'
+    )
+    
+    args = parser.parse_args(argv)
     
     # Validar argumentos
     if not args.campeonato.strip():
         print("Erro: Nome do campeonato não pode estar vazio")
-        sys.exit(1)
+        return 1
     
     if not args.coluna.strip():
         print("Erro: Nome da coluna não pode estar vazio")
-        sys.exit(1)
+        return 1
     
     # Determinar fonte dos nomes e ler dados
     try:
@@ -570,28 +792,29 @@ Exemplos de uso:
         
         else:
             print("Erro: Deve especificar --arquivo ou --excel")
-            sys.exit(1)
+            return 1
         
         print(f"✓ {len(nomes_participantes)} nomes lidos com sucesso")
         
     except (OSError, ValueError, ImportError) as e:
         print(f"Erro ao ler fonte de dados: {str(e)}")
-        sys.exit(1)
+        return 1
     
     # Executar criação de participantes
     sucesso = criar_participantes(
         nome_campeonato=args.campeonato.strip(),
         nomes_participantes=nomes_participantes,
-        forcar=args.forcar
+        forcar=args.forcar,
+        detalhado=args.detalhado
     )
     
     if sucesso:
         print("\n✅ Script executado com sucesso!")
-        sys.exit(0)
+        return 0
     else:
         print("\n❌ Falha na execução do script")
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -7,12 +7,18 @@ para um campeonato existente, incluindo validação e confirmação para
 sobrescrever arquivos existentes.
 """
 
-import argparse
-import json
+import mmap
+import os
+import stat
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, List
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # Adicionar o diretório pai ao path para imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -22,7 +28,60 @@ from config import (
     ARQUIVO_REGRAS, 
     REGRAS_PONTUACAO_PADRAO
 )
-from utils.validacao import validar_estrutura_regras
+from utils.serializacao import carregar_json, salvar_json
+
+# Funções públicas do script; argparse e o validador de estrutura são
+# importados apenas nas funções que os utilizam, para acelerar a inicialização
+# (o argparse só é necessário para ajuda, erros e formas menos comuns da linha
+# de comando)
+__all__ = [
+    'carregar_template_regras_padrao',
+    'criar_estrutura_regras_completa',
+    'obter_dados_campeonato_existente',
+    'verificar_campeonato_existe',
+    'verificar_arquivo_regras_existe',
+    'confirmar_operacao',
+    'escrever_arquivo_regras',
+    'formatar_regra',
+    'gerar_regras',
+    'main'
+]
+
+
+if msgspec is not None:
+    class _CabecalhoTabela(msgspec.Struct):
+        """Campos do tabela.json usados para identificar o campeonato; os demais são ignorados."""
+        campeonato: Any = None
+        temporada: Any = None
+
+
+# A partir deste tamanho o tabela.json é mapeado em memória em vez de lido
+LIMITE_MMAP_TABELA = 1024 * 1024
+
+
+def _decodificar_cabecalho_tabela(caminho_tabela: Path):
+    """
+    Decodifica o cabeçalho do tabela.json com msgspec.
+    
+    Arquivos a partir de LIMITE_MMAP_TABELA são mapeados em memória e
+    entregues diretamente ao msgspec, sem copiar o conteúdo para um bytes.
+    
+    Args:
+        caminho_tabela: Path para o arquivo tabela.json
+        
+    Returns:
+        Cabeçalho com os campos 'campeonato' e 'temporada'
+        
+    Raises:
+        OSError: Se o arquivo não puder ser lido
+        ValueError: Se o conteúdo não for um objeto JSON válido
+    """
+    with open(caminho_tabela, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < LIMITE_MMAP_TABELA:
+            return msgspec.json.decode(f.read(), type=_CabecalhoTabela)
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as conteudo:
+            return msgspec.json.decode(conteudo, type=_CabecalhoTabela)
 
 
 def carregar_template_regras_padrao() -> dict:
@@ -30,9 +89,24 @@ def carregar_template_regras_padrao() -> dict:
     Carrega o template de regras padrão do sistema.
     
     Returns:
-        Dicionário com as regras de pontuação padrão
+        Dicionário com as regras de pontuação padrão (cópia editável do
+        template somente leitura da configuração)
     """
-    return REGRAS_PONTUACAO_PADRAO.copy()
+    return {nome: dict(regra) for nome, regra in REGRAS_PONTUACAO_PADRAO.items()}
+
+
+# Regras padrão em dicionários comuns (serializáveis), montadas uma única vez
+# e compartilhadas pelas estruturas geradas, que não as alteram
+_REGRAS_PADRAO = carregar_template_regras_padrao()
+
+
+# Observações incluídas em todo regras.json gerado
+_OBSERVACOES_PADRAO = (
+    "Regras de pontuação padrão do Sistema de Controle de Bolão",
+    "Hierarquia: maior pontuação aplicável é atribuída",
+    "Bônus para resultado exato: 1/N onde N = número de acertos exatos no jogo",
+    "Jogos obrigatórios sem palpite recebem penalidade de -1 ponto"
+)
 
 
 def criar_estrutura_regras_completa(nome_campeonato: str, temporada: str) -> dict:
@@ -44,22 +118,16 @@ def criar_estrutura_regras_completa(nome_campeonato: str, temporada: str) -> dic
         temporada: Temporada do campeonato
         
     Returns:
-        Dicionário com estrutura completa das regras
+        Dicionário com estrutura completa das regras (o dicionário em
+        "regras" é compartilhado e não deve ser alterado)
     """
-    regras_padrao = carregar_template_regras_padrao()
-    
     return {
         "campeonato": nome_campeonato,
         "temporada": temporada,
         "versao": "1.0",
-        "data_criacao": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "regras": regras_padrao,
-        "observacoes": [
-            "Regras de pontuação padrão do Sistema de Controle de Bolão",
-            "Hierarquia: maior pontuação aplicável é atribuída",
-            "Bônus para resultado exato: 1/N onde N = número de acertos exatos no jogo",
-            "Jogos obrigatórios sem palpite recebem penalidade de -1 ponto"
-        ]
+        "data_criacao": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec='seconds') + 'Z',
+        "regras": _REGRAS_PADRAO,
+        "observacoes": list(_OBSERVACOES_PADRAO)
     }
 
 
@@ -73,24 +141,46 @@ def obter_dados_campeonato_existente(caminho_campeonato: Path) -> Optional[tuple
     Returns:
         Tupla (nome_campeonato, temporada) ou None se não conseguir obter
     """
+    caminho_tabela = caminho_campeonato / "Tabela" / "tabela.json"
+    
+    # Arquivo ausente ou ilegível e JSON inválido resultam em None, sem
+    # verificar a existência do arquivo antes da leitura
     try:
-        caminho_tabela = caminho_campeonato / "Tabela" / "tabela.json"
-        
-        if not caminho_tabela.exists():
-            return None
-            
-        with open(caminho_tabela, 'r', encoding='utf-8') as f:
-            dados_tabela = json.load(f)
-            
-        nome = dados_tabela.get("campeonato")
-        temporada = dados_tabela.get("temporada")
-        
-        if nome and temporada:
-            return (nome, temporada)
+        if msgspec is not None:
+            # Decodifica só o cabeçalho; a lista de jogos é pulada sem criar objetos
+            cabecalho = _decodificar_cabecalho_tabela(caminho_tabela)
+            nome = cabecalho.campeonato
+            temporada = cabecalho.temporada
+        else:
+            dados_tabela = carregar_json(caminho_tabela)
+            if not isinstance(dados_tabela, dict):
+                return None
             
+            nome = dados_tabela.get("campeonato")
+            temporada = dados_tabela.get("temporada")
+    except (OSError, ValueError):
         return None
+    
+    if nome and temporada:
+        return (nome, temporada)
+        
+    return None
+
+
+def _stat_ou_none(caminho: Path) -> Optional[os.stat_result]:
+    """
+    Obtém as informações de um caminho com uma única chamada a stat.
+    
+    Args:
+        caminho: Path a ser consultado
         
-    except Exception:
+    Returns:
+        Resultado de os.stat ou None se o caminho não existir ou não puder
+        ser consultado (mesmo critério de Path.exists)
+    """
+    try:
+        return os.stat(caminho)
+    except OSError:
         return None
 
 
@@ -106,11 +196,9 @@ def verificar_campeonato_existe(nome_campeonato: str) -> tuple:
     """
     caminho_campeonato = CAMPEONATOS_DIR / nome_campeonato
     
-    if not caminho_campeonato.exists():
-        return (False, caminho_campeonato, None)
-    
-    # Verificar se é um diretório válido de campeonato
-    if not caminho_campeonato.is_dir():
+    # Verificar se existe e é um diretório válido de campeonato
+    info = _stat_ou_none(caminho_campeonato)
+    if info is None or not stat.S_ISDIR(info.st_mode):
         return (False, caminho_campeonato, None)
     
     # Tentar obter dados do campeonato
@@ -130,35 +218,48 @@ def verificar_arquivo_regras_existe(caminho_campeonato: Path) -> bool:
         True se o arquivo existe, False caso contrário
     """
     caminho_regras = caminho_campeonato / "Regras" / ARQUIVO_REGRAS
-    return caminho_regras.exists()
+    return _stat_ou_none(caminho_regras) is not None
 
 
 def confirmar_operacao(mensagem: str) -> bool:
     """
     Solicita confirmação do usuário para operações críticas.
     
+    Sem um terminal na entrada padrão (ex: cron, CI ou entrada redirecionada)
+    não há quem responda: a operação não é confirmada, sem aguardar leitura.
+    Nesses casos use --sobrescrever para prosseguir sem confirmação.
+    
     Args:
         mensagem: Mensagem a ser exibida
         
     Returns:
         True se o usuário confirmar, False caso contrário
     """
+    if not sys.stdin or not sys.stdin.isatty():
+        print(f"{mensagem} (s/n): entrada não interativa, operação não confirmada (use --sobrescrever)")
+        return False
+    
     resposta = input(f"{mensagem} (s/n): ").strip().lower()
     return resposta in ['s', 'sim', 'y', 'yes']
 
 
-def escrever_arquivo_regras(caminho_campeonato: Path, estrutura_regras: dict) -> None:
+def escrever_arquivo_regras(caminho_campeonato: Path, estrutura_regras: dict,
+                            criar_diretorio: bool = True) -> None:
     """
     Escreve o arquivo regras.json no diretório do campeonato.
     
     Args:
         caminho_campeonato: Path para o diretório do campeonato
         estrutura_regras: Estrutura das regras a ser salva
+        criar_diretorio: Se False, assume que o diretório Regras já existe
+            (ex: o arquivo de regras já foi encontrado) e não o verifica
         
     Raises:
         OSError: Se não conseguir escrever o arquivo
         ValueError: Se a estrutura for inválida
     """
+    from utils.validacao import validar_estrutura_regras
+    
     try:
         # Validar estrutura antes de salvar
         valido, erros = validar_estrutura_regras(estrutura_regras)
@@ -167,17 +268,44 @@ def escrever_arquivo_regras(caminho_campeonato: Path, estrutura_regras: dict) ->
         
         # Garantir que o diretório Regras existe
         dir_regras = caminho_campeonato / "Regras"
-        dir_regras.mkdir(parents=True, exist_ok=True)
+        if criar_diretorio:
+            # O diretório do campeonato normalmente já existe (e Regras também,
+            # criado com o campeonato): um único mkdir resolve o caso comum, e
+            # os diretórios pais só são criados se estiverem faltando
+            try:
+                os.mkdir(dir_regras)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                dir_regras.mkdir(parents=True, exist_ok=True)
         
         # Escrever arquivo
         caminho_regras = dir_regras / ARQUIVO_REGRAS
-        with open(caminho_regras, 'w', encoding='utf-8') as f:
-            json.dump(estrutura_regras, f, indent=2, ensure_ascii=False)
+        salvar_json(caminho_regras, estrutura_regras, atomico=True)
             
     except Exception as e:
         raise OSError(f"Erro ao escrever arquivo de regras: {str(e)}")
 
 
+def formatar_regra(regra: dict) -> str:
+    """
+    Formata uma regra de pontuação para exibição no resumo.
+    
+    Args:
+        regra: Regra de pontuação
+        
+    Returns:
+        Linha com código, descrição e pontos da regra
+    """
+    pontos = regra.get("pontos_base", regra.get("pontos", 0))
+    codigo = regra.get("codigo", "")
+    descricao = regra.get("descricao", "")
+    
+    if regra.get("bonus_divisor"):
+        return f"  [{codigo}] {descricao}: {pontos} + bônus (1/N)"
+    return f"  [{codigo}] {descricao}: {pontos} pontos"
+
+
 def gerar_regras(nome_campeonato: str, sobrescrever: bool = False) -> bool:
     """
     Função principal para gerar arquivo de regras.
@@ -228,33 +356,28 @@ def gerar_regras(nome_campeonato: str, sobrescrever: bool = False) -> bool:
         estrutura_regras = criar_estrutura_regras_completa(nome_original, temporada)
         
         # Escrever arquivo
-        escrever_arquivo_regras(caminho_campeonato, estrutura_regras)
+        escrever_arquivo_regras(caminho_campeonato, estrutura_regras,
+                                criar_diretorio=not arquivo_existe)
         
         # Exibir resumo das regras criadas
         total_regras = len(estrutura_regras["regras"])
         print(f"✓ Arquivo de regras criado com {total_regras} regras de pontuação")
         
-        # Listar as regras criadas
-        print("\n📋 Regras de pontuação configuradas:")
-        for codigo_regra, regra in estrutura_regras["regras"].items():
-            pontos = regra.get("pontos_base", regra.get("pontos", 0))
-            codigo = regra.get("codigo", "")
-            descricao = regra.get("descricao", "")
-            
-            if regra.get("bonus_divisor"):
-                print(f"  [{codigo}] {descricao}: {pontos} + bônus (1/N)")
-            else:
-                print(f"  [{codigo}] {descricao}: {pontos} pontos")
-        
+        # Listar as regras criadas e os próximos passos em uma única escrita
         caminho_regras = caminho_campeonato / "Regras" / ARQUIVO_REGRAS
-        print(f"\n🎉 Arquivo de regras gerado com sucesso!")
-        print(f"📁 Localização: {caminho_regras}")
-        
-        # Sugerir próximos passos
-        print("\n📋 Próximos passos sugeridos:")
-        print(f"1. Execute: python criar_participantes.py --campeonato '{nome_campeonato}' --arquivo lista.txt")
-        print(f"2. Execute: python importar_tabela.py --campeonato '{nome_campeonato}' --arquivo jogos.txt")
-        print(f"3. Execute: python importar_palpites.py --campeonato '{nome_campeonato}' --arquivo palpite.txt")
+        linhas = ["", "📋 Regras de pontuação configuradas:"]
+        linhas.extend(formatar_regra(regra) for regra in estrutura_regras["regras"].values())
+        linhas.extend([
+            "",
+            "🎉 Arquivo de regras gerado com sucesso!",
+            f"📁 Localização: {caminho_regras}",
+            "",
+            "📋 Próximos passos sugeridos:",
+            f"1. Execute: python criar_participantes.py --campeonato '{nome_campeonato}' --arquivo lista.txt",
+            f"2. Execute: python importar_tabela.py --campeonato '{nome_campeonato}' --arquivo jogos.txt",
+            f"3. Execute: python importar_palpites.py --campeonato '{nome_campeonato}' --arquivo palpite.txt",
+        ])
+        sys.stdout.write("\n".join(linhas) + "\n")
         
         return True
         
@@ -269,8 +392,15 @@ def gerar_regras(nome_campeonato: str, sobrescrever: bool = False) -> bool:
         return False
 
 
-def main():
-    """Função principal do script."""
+def _criar_parser():
+    """
+    Cria o parser de argumentos de linha de comando (argparse).
+    
+    Returns:
+        ArgumentParser com as opções do script
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Gera arquivo de regras com template padrão para um campeonato",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -293,26 +423,88 @@ Exemplos de uso:
         help='Sobrescreve arquivo de regras existente sem confirmação'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _interpretar_argumentos_simples(argv: List[str]) -> Optional[tuple]:
+    """
+    Interpreta as formas usuais da linha de comando sem carregar o argparse.
+    
+    Aceita apenas '--campeonato VALOR' (ou '--campeonato=VALOR'), uma vez, e
+    '--sobrescrever', no máximo uma vez. Qualquer outra forma (ajuda, opção
+    desconhecida ou abreviada, valor ausente ou iniciado por '-') fica para o
+    argparse, que produz as mesmas mensagens de ajuda e de erro de antes.
+    
+    Args:
+        argv: Argumentos de linha de comando
+        
+    Returns:
+        Tupla (campeonato, sobrescrever) ou None se o argparse deve decidir
+    """
+    campeonato = None
+    sobrescrever = False
+    
+    i = 0
+    while i < len(argv):
+        argumento = argv[i]
+        if argumento == '--sobrescrever' and not sobrescrever:
+            sobrescrever = True
+        elif argumento == '--campeonato' and campeonato is None:
+            if i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+                return None
+            i += 1
+            campeonato = argv[i]
+        elif argumento.startswith('--campeonato=') and campeonato is None:
+            campeonato = argumento[len('--campeonato='):]
+        else:
+            return None
+        i += 1
+    
+    if campeonato is None:
+        return None
+    
+    return (campeonato, sobrescrever)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Função principal do script.
+    
+    Args:
+        argv: Argumentos de linha de comando (padrão: sys.argv[1:])
+        
+    Returns:
+        Código de saída do script (0 para sucesso)
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # O argparse só é carregado para ajuda, erros e formas menos comuns
+    argumentos = _interpretar_argumentos_simples(argv)
+    if argumentos is None:
+        args = _criar_parser().parse_args(argv)
+        argumentos = (args.campeonato, args.sobrescrever)
+    
+    campeonato, sobrescrever = argumentos
     
     # Validar argumentos
-    if not args.campeonato.strip():
+    if not campeonato.strip():
         print("Erro: Nome do campeonato não pode estar vazio")
-        sys.exit(1)
+        return 1
     
     # Executar geração de regras
     sucesso = gerar_regras(
-        nome_campeonato=args.campeonato.strip(),
-        sobrescrever=args.sobrescrever
+        nome_campeonato=campeonato.strip(),
+        sobrescrever=sobrescrever
     )
     
     if sucesso:
         print("\n✅ Script executado com sucesso!")
-        sys.exit(0)
+        return 0
     else:
         print("\n❌ Falha na execução do script")
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
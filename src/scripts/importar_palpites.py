@@ -12,12 +12,16 @@ Uso:
     python importar_palpites.py --campeonato "Brasileirao-2025" --texto "Mario Silva\n1ª Rodada\nFlamengo 2x1 Palmeiras"
     python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpites_multiplas_rodadas.txt"
     python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpites_multiplas_rodadas.txt" --rodada 5
+    python importar_palpites.py --campeonato "Brasileirao-2025" --arquivos "palpite1.txt" "palpite2.txt"
+    python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "conversa.txt" --separador=---
 """
 
 import argparse
 import json
+import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -29,6 +33,7 @@ from config import CAMPEONATOS_DIR, ARQUIVO_PALPITES, ARQUIVO_TABELA
 from utils.parser import processar_texto_palpite, processar_texto_multiplas_rodadas
 from utils.validacao import validar_id_jogo, validar_participante
 from utils.normalizacao import normalizar_nome_time, encontrar_time_similar
+from utils.serializacao import carregar_json, salvar_json
 
 
 def carregar_tabela_campeonato(caminho_campeonato: Path) -> Optional[Dict[str, Any]]:
@@ -48,8 +53,7 @@ def carregar_tabela_campeonato(caminho_campeonato: Path) -> Optional[Dict[str, A
         return None
     
     try:
-        with open(arquivo_tabela, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return carregar_json(arquivo_tabela)
     except json.JSONDecodeError as e:
         print(f"Erro: Arquivo tabela.json inválido: {e}")
         return None
@@ -75,8 +79,7 @@ def carregar_palpites_participante(caminho_participante: Path) -> Optional[Dict[
         return None
     
     try:
-        with open(arquivo_palpites, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return carregar_json(arquivo_palpites)
     except json.JSONDecodeError as e:
         print(f"Erro: Arquivo palpites.json inválido: {e}")
         return None
@@ -99,14 +102,32 @@ def salvar_palpites_participante(caminho_participante: Path, dados: Dict[str, An
     arquivo_palpites = caminho_participante / ARQUIVO_PALPITES
     
     try:
-        with open(arquivo_palpites, 'w', encoding='utf-8') as f:
-            json.dump(dados, f, indent=2, ensure_ascii=False)
+        salvar_json(arquivo_palpites, dados)
         return True
     except Exception as e:
         print(f"Erro ao salvar palpites.json: {e}")
         return False
 
 
+# Caracteres ignorados ao comparar o nome do apostador com os diretórios
+_CARACTERES_IGNORADOS_NOME = str.maketrans('', '', ' -_.')
+
+
+@lru_cache(maxsize=512)
+def _normalizar_nome_busca(nome: str) -> str:
+    """
+    Normaliza um nome para a busca de participantes (minúsculas, sem
+    espaços, hífens, sublinhados e pontos).
+    
+    Args:
+        nome: Nome do apostador ou do diretório do participante
+        
+    Returns:
+        Nome normalizado para comparação
+    """
+    return nome.lower().translate(_CARACTERES_IGNORADOS_NOME)
+
+
 def identificar_participante(nome_apostador: str, caminho_campeonato: Path) -> Optional[Path]:
     """
     Identifica o diretório do participante baseado no nome do apostador.
@@ -126,22 +147,21 @@ def identificar_participante(nome_apostador: str, caminho_campeonato: Path) -> O
         print(f"Erro: Diretório Participantes não encontrado em {participantes_dir}")
         return None
     
-    # Primeiro, tentar correspondência exata com nome normalizado
-    nome_normalizado = nome_apostador.lower().replace(' ', '').replace('-', '').replace('_', '').replace('.', '')
+    # Listar os participantes uma única vez para todas as buscas
+    with os.scandir(participantes_dir) as entradas:
+        participantes_disponiveis = [entrada.name for entrada in entradas if entrada.is_dir()]
+    nomes_normalizados = [_normalizar_nome_busca(nome_dir) for nome_dir in participantes_disponiveis]
     
-    for participante_dir in participantes_dir.iterdir():
-        if participante_dir.is_dir():
-            nome_dir_normalizado = participante_dir.name.lower().replace(' ', '').replace('-', '').replace('_', '').replace('.', '')
-            if nome_normalizado == nome_dir_normalizado:
-                return participante_dir
+    # Primeiro, tentar correspondência exata com nome normalizado
+    nome_normalizado = _normalizar_nome_busca(nome_apostador)
     
-    # Se não encontrou correspondência exata, tentar busca por similaridade
-    participantes_disponiveis = [d.name for d in participantes_dir.iterdir() if d.is_dir()]
+    for nome_dir, nome_dir_normalizado in zip(participantes_disponiveis, nomes_normalizados):
+        if nome_normalizado == nome_dir_normalizado:
+            return participantes_dir / nome_dir
     
-    # Buscar por correspondência parcial (nome contido no diretório ou vice-versa)
-    for nome_dir in participantes_disponiveis:
-        nome_dir_normalizado = nome_dir.lower().replace(' ', '').replace('-', '').replace('_', '').replace('.', '')
-        
+    # Se não encontrou correspondência exata, buscar por correspondência
+    # parcial (nome contido no diretório ou vice-versa)
+    for nome_dir, nome_dir_normalizado in zip(participantes_disponiveis, nomes_normalizados):
         # Verificar se o nome do apostador está contido no nome do diretório
         if nome_normalizado in nome_dir_normalizado or nome_dir_normalizado in nome_normalizado:
             return participantes_dir / nome_dir
@@ -264,6 +284,12 @@ def validar_palpites_contra_tabela(palpites: List[Dict[str, Any]], rodada: int,
     
     jogos_rodada = rodada_encontrada.get('jogos', [])
     
+    # Índice dos jogos por (mandante, visitante); em caso de repetição vale
+    # o primeiro jogo da rodada, como na busca sequencial
+    indice_jogos = {}
+    for jogo in jogos_rodada:
+        indice_jogos.setdefault((jogo.get('mandante'), jogo.get('visitante')), jogo)
+    
     for palpite in palpites:
         # Pular palpites sem placar especificado
         if palpite.get('gols_mandante') is None or palpite.get('gols_visitante') is None:
@@ -271,12 +297,7 @@ def validar_palpites_contra_tabela(palpites: List[Dict[str, Any]], rodada: int,
             continue
         
         # Procurar jogo correspondente na rodada
-        jogo_encontrado = None
-        for jogo in jogos_rodada:
-            if (jogo.get('mandante') == palpite.get('mandante') and 
-                jogo.get('visitante') == palpite.get('visitante')):
-                jogo_encontrado = jogo
-                break
+        jogo_encontrado = indice_jogos.get((palpite.get('mandante'), palpite.get('visitante')))
         
         if not jogo_encontrado:
             erros.append(f"Jogo não encontrado na rodada {rodada}: {palpite.get('mandante', '?')} x {palpite.get('visitante', '?')}")
@@ -397,93 +418,138 @@ def confirmar_sobrescrita(participante: str, rodada: int, palpites_existentes: L
     return resposta in ['s', 'sim', 'y', 'yes']
 
 
-def main():
-    """Função principal do script."""
-    parser = argparse.ArgumentParser(
-        description="Importa palpites de participantes para o campeonato",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Exemplos de uso:
-  # Importar palpites de uma rodada
-  python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpite.txt"
-  
-  # Importar palpites de múltiplas rodadas
-  python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpites_completos.txt"
-  
-  # Importar apenas uma rodada específica de um arquivo com múltiplas rodadas
-  python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpites_completos.txt" --rodada 5
-  
-  # Usar texto direto
-  python importar_palpites.py --campeonato "Brasileirao-2025" --texto "Mario Silva\\n1ª Rodada\\nFlamengo 2x1 Palmeiras"
-        """
-    )
-    
-    parser.add_argument(
-        '--campeonato',
-        required=True,
-        help='Nome do campeonato'
-    )
+def normalizar_quebras_linha(texto: str) -> str:
+    """
+    Converte quebras de linha CRLF e CR em LF, como na leitura em modo texto.
     
-    parser.add_argument(
-        '--arquivo',
-        help='Arquivo texto com palpite'
-    )
+    Args:
+        texto: Texto lido como bytes e decodificado
+        
+    Returns:
+        Texto apenas com quebras de linha LF
+    """
+    return texto.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def ler_arquivo_palpite(arquivo_palpite: Path) -> Optional[str]:
+    """
+    Lê o conteúdo de um arquivo texto com palpites.
     
-    parser.add_argument(
-        '--texto',
-        help='Texto direto do palpite'
-    )
+    Args:
+        arquivo_palpite: Caminho para o arquivo de palpite
+        
+    Returns:
+        Texto do arquivo ou None se erro
+    """
+    # Leitura do arquivo inteiro em bytes, decodificado de uma só vez
+    try:
+        texto = arquivo_palpite.read_bytes().decode('utf-8')
+    except FileNotFoundError:
+        print(f"Erro: Arquivo '{arquivo_palpite}' não encontrado")
+        return None
+    except Exception as e:
+        print(f"Erro ao ler arquivo: {e}")
+        return None
     
-    parser.add_argument(
-        '--rodada',
-        type=int,
-        help='Forçar número da rodada específica (opcional). Para arquivos com múltiplas rodadas, processa apenas a rodada especificada.'
-    )
+    return normalizar_quebras_linha(texto)
+
+
+def importar_arquivos_palpites(arquivos: List[Path], caminho_campeonato: Path, tabela: Dict[str, Any],
+                               rodada_forcada: Optional[int] = None, forcar: bool = False) -> int:
+    """
+    Importa vários arquivos de palpites em uma única execução.
     
-    parser.add_argument(
-        '--forcar',
-        action='store_true',
-        help='Força importação sem confirmação'
-    )
+    A tabela do campeonato é carregada uma única vez e reutilizada para
+    todos os arquivos, evitando uma execução do script por arquivo.
     
-    args = parser.parse_args()
+    Args:
+        arquivos: Lista de arquivos texto, cada um com o palpite de um apostador
+        caminho_campeonato: Caminho para o diretório do campeonato
+        tabela: Dados da tabela do campeonato
+        rodada_forcada: Rodada a ser usada no lugar da detectada no texto
+        forcar: Se True, não solicita confirmações
+        
+    Returns:
+        0 se todos os arquivos foram importados, 1 caso contrário
+    """
+    importados = 0
     
-    # Validar argumentos
-    if not args.arquivo and not args.texto:
-        print("Erro: É necessário fornecer --arquivo ou --texto")
-        return 1
+    for i, arquivo in enumerate(arquivos, 1):
+        print(f"\n=== Arquivo {i}/{len(arquivos)}: {arquivo.name} ===")
+        
+        texto_palpite = ler_arquivo_palpite(arquivo)
+        if texto_palpite is None:
+            continue
+        
+        if importar_texto_palpite(texto_palpite, caminho_campeonato, tabela, rodada_forcada, forcar) == 0:
+            importados += 1
+        else:
+            print(f"❌ Falha na importação de {arquivo.name}")
     
-    if args.arquivo and args.texto:
-        print("Erro: Forneça apenas --arquivo OU --texto, não ambos")
-        return 1
+    print(f"\n{importados} de {len(arquivos)} arquivo(s) importado(s) com sucesso")
+    return 0 if importados == len(arquivos) else 1
+
+
+def dividir_blocos_palpites(texto: str, separador: str) -> List[str]:
+    """
+    Divide um texto com palpites de vários apostadores em blocos.
     
-    # Verificar se campeonato existe
-    caminho_campeonato = CAMPEONATOS_DIR / args.campeonato
-    if not caminho_campeonato.exists():
-        print(f"Erro: Campeonato '{args.campeonato}' não encontrado em {CAMPEONATOS_DIR}")
-        return 1
+    Args:
+        texto: Texto completo (ex: conversa do WhatsApp)
+        separador: Marcador que separa os palpites de cada apostador
+        
+    Returns:
+        Lista de blocos não vazios, sem espaços nas extremidades
+    """
+    return [bloco.strip() for bloco in texto.split(separador) if bloco.strip()]
+
+
+def importar_blocos_palpites(blocos: List[str], caminho_campeonato: Path, tabela: Dict[str, Any],
+                             rodada_forcada: Optional[int] = None, forcar: bool = False) -> int:
+    """
+    Importa vários blocos de texto, cada um com o palpite de um apostador.
     
-    # Carregar tabela do campeonato
-    tabela = carregar_tabela_campeonato(caminho_campeonato)
-    if not tabela:
-        return 1
+    Args:
+        blocos: Textos de palpite já separados por apostador
+        caminho_campeonato: Caminho para o diretório do campeonato
+        tabela: Dados da tabela do campeonato
+        rodada_forcada: Rodada a ser usada no lugar da detectada no texto
+        forcar: Se True, não solicita confirmações
+        
+    Returns:
+        0 se todos os blocos foram importados, 1 caso contrário
+    """
+    importados = 0
     
-    # Obter texto do palpite
-    if args.arquivo:
-        arquivo_palpite = Path(args.arquivo)
-        if not arquivo_palpite.exists():
-            print(f"Erro: Arquivo '{args.arquivo}' não encontrado")
-            return 1
+    for i, bloco in enumerate(blocos, 1):
+        print(f"\n=== Bloco {i}/{len(blocos)} ===")
         
-        try:
-            with open(arquivo_palpite, 'r', encoding='utf-8') as f:
-                texto_palpite = f.read()
-        except Exception as e:
-            print(f"Erro ao ler arquivo: {e}")
-            return 1
-    else:
-        texto_palpite = args.texto
+        if importar_texto_palpite(bloco, caminho_campeonato, tabela, rodada_forcada, forcar) == 0:
+            importados += 1
+        else:
+            print(f"❌ Falha na importação do bloco {i}")
     
+    print(f"\n{importados} de {len(blocos)} bloco(s) importado(s) com sucesso")
+    return 0 if importados == len(blocos) else 1
+
+
+def importar_texto_palpite(texto_palpite: str, caminho_campeonato: Path, tabela: Dict[str, Any],
+                           rodada_forcada: Optional[int] = None, forcar: bool = False) -> int:
+    """
+    Processa o texto de um palpite e atualiza o arquivo do participante.
+    
+    Detecta automaticamente se o texto contém uma ou várias rodadas.
+    
+    Args:
+        texto_palpite: Texto do palpite (ex: mensagem do WhatsApp)
+        caminho_campeonato: Caminho para o diretório do campeonato
+        tabela: Dados da tabela do campeonato
+        rodada_forcada: Rodada a ser usada no lugar da detectada no texto
+        forcar: Se True, não solicita confirmações
+        
+    Returns:
+        0 se sucesso, 1 se erro
+    """
     # Processar texto do palpite - detectar se há múltiplas rodadas
     print("Processando texto do palpite...")
     
@@ -495,15 +561,15 @@ Exemplos de uso:
         print(f"Detectadas {len(resultados_multiplas_rodadas)} rodadas no texto")
         
         # Verificar se foi especificada uma rodada específica
-        if args.rodada:
+        if rodada_forcada:
             # Filtrar apenas a rodada especificada
-            resultados_filtrados = [r for r in resultados_multiplas_rodadas if r['rodada'] == args.rodada]
+            resultados_filtrados = [r for r in resultados_multiplas_rodadas if r['rodada'] == rodada_forcada]
             if not resultados_filtrados:
-                print(f"Erro: Rodada {args.rodada} não encontrada no texto")
+                print(f"Erro: Rodada {rodada_forcada} não encontrada no texto")
                 print(f"Rodadas disponíveis: {[r['rodada'] for r in resultados_multiplas_rodadas]}")
                 return 1
             resultados_multiplas_rodadas = resultados_filtrados
-            print(f"Processando apenas a rodada {args.rodada} conforme especificado")
+            print(f"Processando apenas a rodada {rodada_forcada} conforme especificado")
         
         # Processar cada rodada
         apostador_principal = None
@@ -576,7 +642,7 @@ Exemplos de uso:
                     break
             
             if palpites_existentes:
-                if not confirmar_sobrescrita(apostador_principal, rodada, palpites_existentes, args.forcar):
+                if not confirmar_sobrescrita(apostador_principal, rodada, palpites_existentes, forcar):
                     print(f"Rodada {rodada} pulada pelo usuário")
                     continue
             
@@ -644,16 +710,16 @@ Exemplos de uso:
     print(f"Participante encontrado: {caminho_participante.name}")
     
     # Determinar rodada
-    rodada = args.rodada if args.rodada else resultado_parsing['rodada']
+    rodada = rodada_forcada if rodada_forcada else resultado_parsing['rodada']
     
     if not rodada:
         print("Erro: Não foi possível determinar a rodada")
         print("Use --rodada para especificar manualmente ou inclua indicação de rodada no texto")
         return 1
     
-    if resultado_parsing['rodada_inferida'] and not args.rodada:
+    if resultado_parsing['rodada_inferida'] and not rodada_forcada:
         print(f"Rodada inferida automaticamente: {rodada}")
-        if not args.forcar:
+        if not forcar:
             resposta = input("Confirma esta rodada? (s/n): ").strip().lower()
             if resposta not in ['s', 'sim', 'y', 'yes']:
                 print("Operação cancelada")
@@ -705,7 +771,7 @@ Exemplos de uso:
             break
     
     if palpites_existentes:
-        if not confirmar_sobrescrita(resultado_parsing['apostador'], rodada, palpites_existentes, args.forcar):
+        if not confirmar_sobrescrita(resultado_parsing['apostador'], rodada, palpites_existentes, forcar):
             print("Operação cancelada")
             return 1
     
@@ -743,5 +809,146 @@ Exemplos de uso:
         return 1
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Função principal do script.
+    
+    Args:
+        argv: Argumentos de linha de comando (padrão: sys.argv[1:])
+        
+    Returns:
+        Código de saída do script (0 para sucesso)
+    """
+    parser = argparse.ArgumentParser(
+        description="Importa palpites de participantes para o campeonato",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos de uso:
+  # Importar palpites de uma rodada
+  python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpite.txt"
+  
+  # Importar palpites de múltiplas rodadas
+  python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpites_completos.txt"
+  
+  # Importar apenas uma rodada específica de um arquivo com múltiplas rodadas
+  python importar_palpites.py --campeonato "Brasileirao-2025" --arquivo "palpites_completos.txt" --rodada 5
+  
+  # Usar texto direto
+  python importar_palpites.py --campeonato "Brasileirao-2025" --texto "Mario Silva\\n1ª Rodada\\nFlamengo 2x1 Palmeiras"
+  
+  # Importar vários arquivos de uma vez
+  python importar_palpites.py --campeonato "Brasileirao-2025" --arquivos palpite1.txt palpite2.txt
+  
+  # Importar uma conversa com palpites de vários apostadores separados por ---
+  cat conversa.txt | python importar_palpites.py --campeonato "Brasileirao-2025" --stdin --separador=--- --forcar
+        """
+    )
+    
+    parser.add_argument(
+        '--campeonato',
+        required=True,
+        help='Nome do campeonato'
+    )
+    
+    parser.add_argument(
+        '--arquivo',
+        help='Arquivo texto com palpite'
+    )
+    
+    parser.add_argument(
+        '--texto',
+        help='Texto direto do palpite'
+    )
+    
+    parser.add_argument(
+        '--arquivos',
+        nargs='+',
+        help='Vários arquivos texto, um palpite por arquivo, importados em uma única execução'
+    )
+    
+    parser.add_argument(
+        '--stdin',
+        action='store_true',
+        help='Lê o texto do palpite da entrada padrão (requer --forcar)'
+    )
+    
+    parser.add_argument(
+        '--separador',
+        help='Marcador que separa palpites de vários apostadores no mesmo texto (ex: --separador=---)'
+    )
+    
+    parser.add_argument(
+        '--rodada',
+        type=int,
+        help='Forçar número da rodada específica (opcional). Para arquivos com múltiplas rodadas, processa apenas a rodada especificada.'
+    )
+    
+    parser.add_argument(
+        '--forcar',
+        action='store_true',
+        help='Força importação sem confirmação'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    # Validar argumentos
+    fontes = [fonte for fonte in (args.arquivo, args.texto, args.arquivos, args.stdin) if fonte]
+    if not fontes:
+        print("Erro: É necessário fornecer --arquivo, --arquivos, --texto ou --stdin")
+        return 1
+    
+    if len(fontes) > 1:
+        print("Erro: Forneça apenas uma opção entre --arquivo, --arquivos, --texto e --stdin")
+        return 1
+    
+    if args.stdin and not args.forcar:
+        # A entrada padrão é consumida pelo texto e não pode responder às confirmações
+        print("Erro: --stdin requer --forcar")
+        return 1
+    
+    if args.separador and args.arquivos:
+        print("Erro: --separador não pode ser usado com --arquivos")
+        return 1
+    
+    # Verificar se campeonato existe
+    caminho_campeonato = CAMPEONATOS_DIR / args.campeonato
+    if not caminho_campeonato.exists():
+        print(f"Erro: Campeonato '{args.campeonato}' não encontrado em {CAMPEONATOS_DIR}")
+        return 1
+    
+    # Carregar tabela do campeonato
+    tabela = carregar_tabela_campeonato(caminho_campeonato)
+    if not tabela:
+        return 1
+    
+    # Importar lote de arquivos, um palpite por arquivo
+    if args.arquivos:
+        return importar_arquivos_palpites(
+            [Path(arquivo) for arquivo in args.arquivos], caminho_campeonato, tabela,
+            args.rodada, args.forcar
+        )
+    
+    # Obter texto do palpite
+    if args.arquivo:
+        texto_palpite = ler_arquivo_palpite(Path(args.arquivo))
+        if texto_palpite is None:
+            return 1
+    elif args.stdin:
+        texto_palpite = normalizar_quebras_linha(sys.stdin.buffer.read().decode('utf-8'))
+    else:
+        texto_palpite = args.texto
+    
+    # Texto com palpites de vários apostadores
+    if args.separador:
+        blocos = dividir_blocos_palpites(texto_palpite, args.separador)
+        if not blocos:
+            print("Erro: Nenhum palpite encontrado no texto")
+            return 1
+        
+        return importar_blocos_palpites(blocos, caminho_campeonato, tabela, args.rodada, args.forcar)
+    
+    return importar_texto_palpite(texto_palpite, caminho_campeonato, tabela, args.rodada, args.forcar)
+
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -19,11 +19,10 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from config import (
     CAMPEONATOS_DIR, 
-    ARQUIVO_TABELA,
-    FORMATOS_DATA
+    ARQUIVO_TABELA
 )
 from utils.normalizacao import normalizar_nome_time, encontrar_time_similar
-from utils.validacao import validar_estrutura_tabela, validar_data, validar_placar
+from utils.validacao import validar_estrutura_tabela, validar_data, validar_placar, interpretar_data
 from utils.parser import extrair_rodada
 
 
@@ -60,13 +59,12 @@ def converter_data_iso8601(data_str: str, hora_str: Optional[str] = None) -> str
     else:
         data_completa = data_str
     
-    # Tentar cada formato configurado
-    for formato in FORMATOS_DATA:
-        try:
-            dt = datetime.strptime(data_completa, formato)
-            return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-        except ValueError:
-            continue
+    # Tentar os formatos configurados
+    try:
+        dt = interpretar_data(data_completa)
+        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    except ValueError:
+        pass
     
     # Se nenhum formato funcionou, tentar formatos adicionais comuns
     formatos_extras = [
@@ -733,8 +731,16 @@ def importar_tabela(campeonato: str, arquivo: Optional[str] = None, excel: Optio
         return False
 
 
-def main():
-    """Função principal do script."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Função principal do script.
+    
+    Args:
+        argv: Argumentos de linha de comando (padrão: sys.argv[1:])
+        
+    Returns:
+        Código de saída do script (0 para sucesso)
+    """
     parser = argparse.ArgumentParser(
         description="Importa tabela de jogos de arquivo externo para tabela.json",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -787,12 +793,12 @@ Formato da planilha Excel:
         help='Força importação sem confirmação'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Validar argumentos
     if not args.campeonato.strip():
         print("Erro: Nome do campeonato não pode estar vazio")
-        sys.exit(1)
+        return 1
     
     # Executar importação
     sucesso = importar_tabela(
@@ -805,11 +811,11 @@ Formato da planilha Excel:
     
     if sucesso:
         print("\n✅ Script executado com sucesso!")
-        sys.exit(0)
+        return 0
     else:
         print("\n❌ Falha na execução do script")
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
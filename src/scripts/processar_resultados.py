@@ -21,14 +21,17 @@ from config import CAMPEONATOS_DIR, ARQUIVO_TABELA, ARQUIVO_REGRAS, ARQUIVO_PALP
 from utils.validacao import validar_estrutura_tabela, validar_estrutura_regras, validar_estrutura_palpites
 from utils.pontuacao import calcular_pontuacao, calcular_pontuacao_palpite_ausente
 from utils.relatorio import gerar_tabela_classificacao, gerar_resumo_rodada
+from utils.serializacao import carregar_json, salvar_json
 
 
-def carregar_dados_campeonato(nome_campeonato: str) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+def carregar_dados_campeonato(nome_campeonato: str,
+                              tabela: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
     """
     Carrega tabela, regras e palpites de todos os participantes do campeonato.
     
     Args:
         nome_campeonato: Nome do campeonato
+        tabela: Tabela já carregada em memória; se informada, tabela.json não é relido
         
     Returns:
         Tupla (tabela, regras, lista_palpites_participantes)
@@ -43,12 +46,13 @@ def carregar_dados_campeonato(nome_campeonato: str) -> Tuple[Dict[str, Any], Dic
         raise FileNotFoundError(f"Campeonato '{nome_campeonato}' não encontrado")
     
     # Carregar tabela
-    caminho_tabela = caminho_campeonato / "Tabela" / ARQUIVO_TABELA
-    if not caminho_tabela.exists():
-        raise FileNotFoundError(f"Arquivo de tabela não encontrado: {caminho_tabela}")
-    
-    with open(caminho_tabela, 'r', encoding='utf-8') as f:
-        tabela = json.load(f)
+    if tabela is None:
+        caminho_tabela = caminho_campeonato / "Tabela" / ARQUIVO_TABELA
+        if not caminho_tabela.exists():
+            raise FileNotFoundError(f"Arquivo de tabela não encontrado: {caminho_tabela}")
+        
+        with open(caminho_tabela, 'r', encoding='utf-8') as f:
+            tabela = json.load(f)
     
     # Validar estrutura da tabela
     valido, erros = validar_estrutura_tabela(tabela)
@@ -446,12 +450,17 @@ def calcular_variacao_posicao_participantes(resultados: List[Dict[str, Any]],
     return resultados
 
 
-def criar_backup_tabela(caminho_tabela: Path) -> str:
+def criar_backup_tabela(caminho_tabela: Path, tabela: Optional[Dict[str, Any]] = None) -> str:
     """
     Cria backup da tabela com timestamp.
     
+    O backup é gravado em JSON compacto, sem indentação: ele só é lido pelo
+    sistema e ocupa cerca de metade do espaço do arquivo formatado.
+    
     Args:
         caminho_tabela: Caminho para o arquivo tabela.json
+        tabela: Tabela já carregada em memória; se informada, é gravada no
+            backup sem reler o arquivo
         
     Returns:
         Nome do arquivo de backup criado
@@ -464,12 +473,10 @@ def criar_backup_tabela(caminho_tabela: Path) -> str:
     caminho_backup = caminho_tabela.parent / nome_backup
     
     try:
-        # Copiar arquivo original para backup
-        with open(caminho_tabela, 'r', encoding='utf-8') as f_orig:
-            conteudo = f_orig.read()
+        if tabela is None:
+            tabela = carregar_json(caminho_tabela)
         
-        with open(caminho_backup, 'w', encoding='utf-8') as f_backup:
-            f_backup.write(conteudo)
+        salvar_json(caminho_backup, tabela, compacto=True)
         
         return nome_backup
         
@@ -477,21 +484,25 @@ def criar_backup_tabela(caminho_tabela: Path) -> str:
         raise IOError(f"Erro ao criar backup: {e}")
 
 
-def atualizar_rodada_atual(caminho_tabela: Path, nova_rodada: int) -> None:
+def atualizar_rodada_atual(caminho_tabela: Path, nova_rodada: int,
+                           tabela: Optional[Dict[str, Any]] = None) -> None:
     """
     Atualiza o campo rodada_atual na tabela.
     
     Args:
         caminho_tabela: Caminho para o arquivo tabela.json
         nova_rodada: Número da nova rodada atual
+        tabela: Tabela já carregada em memória; se informada, é atualizada
+            no próprio dicionário e gravada sem reler o arquivo
         
     Raises:
         IOError: Se não conseguir atualizar o arquivo
     """
     try:
         # Carregar tabela atual
-        with open(caminho_tabela, 'r', encoding='utf-8') as f:
-            tabela = json.load(f)
+        if tabela is None:
+            with open(caminho_tabela, 'r', encoding='utf-8') as f:
+                tabela = json.load(f)
         
         # Atualizar rodada atual
         tabela["rodada_atual"] = nova_rodada
@@ -548,13 +559,15 @@ Gerado em: {timestamp}
         raise IOError(f"Erro ao salvar relatório: {e}")
 
 
-def processar_resultados_modo_final(nome_campeonato: str, numero_rodada: int) -> bool:
+def processar_resultados_modo_final(nome_campeonato: str, numero_rodada: int,
+                                    tabela: Optional[Dict[str, Any]] = None) -> bool:
     """
     Processa resultados em modo final (atualiza arquivos e gera relatório).
     
     Args:
         nome_campeonato: Nome do campeonato
         numero_rodada: Número da rodada
+        tabela: Tabela já carregada em memória (opcional, evita reler tabela.json)
         
     Returns:
         True se processamento foi bem-sucedido
@@ -564,7 +577,7 @@ def processar_resultados_modo_final(nome_campeonato: str, numero_rodada: int) ->
         print("=" * 80)
         
         # Carregar dados
-        tabela, regras, todos_palpites = carregar_dados_campeonato(nome_campeonato)
+        tabela, regras, todos_palpites = carregar_dados_campeonato(nome_campeonato, tabela)
         
         # Obter jogos da rodada
         jogos = obter_jogos_rodada(tabela, numero_rodada)
@@ -596,7 +609,7 @@ def processar_resultados_modo_final(nome_campeonato: str, numero_rodada: int) ->
         
         # 1. Criar backup da tabela
         print("\n1. Criando backup da tabela...")
-        nome_backup = criar_backup_tabela(caminho_tabela)
+        nome_backup = criar_backup_tabela(caminho_tabela, tabela)
         print(f"   Backup criado: {nome_backup}")
         
         # Contar acertos exatos por jogo
@@ -628,7 +641,7 @@ def processar_resultados_modo_final(nome_campeonato: str, numero_rodada: int) ->
         
         # 2. Atualizar rodada atual na tabela
         print("2. Atualizando rodada atual na tabela...")
-        atualizar_rodada_atual(caminho_tabela, numero_rodada)
+        atualizar_rodada_atual(caminho_tabela, numero_rodada, tabela)
         print(f"   Rodada atual atualizada para: {numero_rodada}")
         
         # 3. Salvar relatório
@@ -652,13 +665,15 @@ def processar_resultados_modo_final(nome_campeonato: str, numero_rodada: int) ->
         return False
 
 
-def processar_resultados_modo_teste(nome_campeonato: str, numero_rodada: int) -> bool:
+def processar_resultados_modo_teste(nome_campeonato: str, numero_rodada: int,
+                                    tabela: Optional[Dict[str, Any]] = None) -> bool:
     """
     Processa resultados em modo teste (apenas exibe, não modifica arquivos).
     
     Args:
         nome_campeonato: Nome do campeonato
         numero_rodada: Número da rodada
+        tabela: Tabela já carregada em memória (opcional, evita reler tabela.json)
         
     Returns:
         True se processamento foi bem-sucedido
@@ -668,7 +683,7 @@ def processar_resultados_modo_teste(nome_campeonato: str, numero_rodada: int) ->
         print("=" * 80)
         
         # Carregar dados
-        tabela, regras, todos_palpites = carregar_dados_campeonato(nome_campeonato)
+        tabela, regras, todos_palpites = carregar_dados_campeonato(nome_campeonato, tabela)
         
         # Obter jogos da rodada
         jogos = obter_jogos_rodada(tabela, numero_rodada)
@@ -725,8 +740,18 @@ def processar_resultados_modo_teste(nome_campeonato: str, numero_rodada: int) ->
         return False
 
 
-def main():
-    """Função principal do script."""
+def main(argv: Optional[List[str]] = None, tabela: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Função principal do script.
+    
+    Args:
+        argv: Argumentos de linha de comando (padrão: sys.argv[1:])
+        tabela: Tabela já carregada em memória por quem chama o script no mesmo
+            processo; no modo final o campo rodada_atual é atualizado nela
+        
+    Returns:
+        Código de saída do script (0 para sucesso)
+    """
     parser = argparse.ArgumentParser(
         description="Processa resultados de uma rodada do campeonato",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -766,22 +791,22 @@ Exemplos de uso:
         help="Modo final (atualiza arquivos e gera relatório)"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Validar argumentos
     if args.rodada < 1:
         print("Erro: Número da rodada deve ser maior que 0")
-        sys.exit(1)
+        return 1
     
     # Processar baseado no modo
     if args.teste:
-        sucesso = processar_resultados_modo_teste(args.campeonato, args.rodada)
+        sucesso = processar_resultados_modo_teste(args.campeonato, args.rodada, tabela)
     else:
         # Modo final
-        sucesso = processar_resultados_modo_final(args.campeonato, args.rodada)
+        sucesso = processar_resultados_modo_final(args.campeonato, args.rodada, tabela)
     
-    sys.exit(0 if sucesso else 1)
+    return 0 if sucesso else 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
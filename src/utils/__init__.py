@@ -1,48 +1,53 @@
 """
 Utilitários para normalização, validação e processamento de dados
-"""
-
-from .normalizacao import (
-    normalizar_nome_time,
-    normalizar_nome_participante,
-    normalizar_nome_campeonato,
-    encontrar_time_similar
-)
 
-from .validacao import (
-    validar_estrutura_tabela,
-    validar_estrutura_palpites,
-    validar_estrutura_regras,
-    validar_placar,
-    validar_data,
-    validar_id_jogo,
-    validar_participante
-)
+Os submódulos são importados sob demanda, no primeiro acesso a um dos nomes
+exportados, para que scripts que usam apenas parte dos utilitários não paguem
+a importação dos demais.
+"""
 
-from .pontuacao import (
-    verificar_resultado_exato,
-    verificar_vitoria_gols_um_time,
-    verificar_vitoria_diferenca_gols,
-    verificar_vitoria_soma_gols,
-    verificar_apenas_vitoria,
-    verificar_apenas_empate,
-    verificar_gols_um_time,
-    verificar_soma_gols,
-    verificar_resultado_inverso,
-    calcular_pontuacao,
-    calcular_bonus_resultado_exato,
-    calcular_pontuacao_palpite_ausente
-)
+import importlib
 
-from .relatorio import (
-    gerar_tabela_classificacao,
-    calcular_variacao_posicao,
-    formatar_linha_participante,
-    gerar_cabecalho_relatorio,
-    gerar_resumo_rodada
-)
+# Nome exportado -> submódulo que o define
+_SUBMODULOS = {
+    'remover_acentos': 'normalizacao',
+    'normalizar_nome_time': 'normalizacao',
+    'normalizar_nome_participante': 'normalizacao',
+    'normalizar_nome_campeonato': 'normalizacao',
+    'encontrar_time_similar': 'normalizacao',
+    'validar_estrutura_tabela': 'validacao',
+    'validar_estrutura_palpites': 'validacao',
+    'validar_estrutura_regras': 'validacao',
+    'validar_placar': 'validacao',
+    'validar_data': 'validacao',
+    'validar_id_jogo': 'validacao',
+    'validar_participante': 'validacao',
+    'verificar_resultado_exato': 'pontuacao',
+    'verificar_vitoria_gols_um_time': 'pontuacao',
+    'verificar_vitoria_diferenca_gols': 'pontuacao',
+    'verificar_vitoria_soma_gols': 'pontuacao',
+    'verificar_apenas_vitoria': 'pontuacao',
+    'verificar_apenas_empate': 'pontuacao',
+    'verificar_gols_um_time': 'pontuacao',
+    'verificar_soma_gols': 'pontuacao',
+    'verificar_resultado_inverso': 'pontuacao',
+    'calcular_pontuacao': 'pontuacao',
+    'calcular_bonus_resultado_exato': 'pontuacao',
+    'calcular_pontuacao_palpite_ausente': 'pontuacao',
+    'gerar_tabela_classificacao': 'relatorio',
+    'calcular_variacao_posicao': 'relatorio',
+    'formatar_linha_participante': 'relatorio',
+    'gerar_cabecalho_relatorio': 'relatorio',
+    'gerar_resumo_rodada': 'relatorio',
+    'serializar_json': 'serializacao',
+    'desserializar_json': 'serializacao',
+    'carregar_json': 'serializacao',
+    'iterar_itens_json': 'serializacao',
+    'salvar_json': 'serializacao'
+}
 
 __all__ = [
+    'remover_acentos',
     'normalizar_nome_time',
     'normalizar_nome_participante', 
     'normalizar_nome_campeonato',
@@ -70,5 +75,36 @@ __all__ = [
     'calcular_variacao_posicao',
     'formatar_linha_participante',
     'gerar_cabecalho_relatorio',
-    'gerar_resumo_rodada'
-]
\ No newline at end of file
+    'gerar_resumo_rodada',
+    'serializar_json',
+    'desserializar_json',
+    'carregar_json',
+    'iterar_itens_json',
+    'salvar_json'
+]
+
+
+def __getattr__(nome):
+    """
+    Importa o submódulo que define o nome solicitado no primeiro acesso.
+
+    Args:
+        nome: Nome do atributo acessado no pacote
+
+    Returns:
+        Objeto exportado pelo submódulo
+
+    Raises:
+        AttributeError: Se o nome não for exportado pelo pacote
+    """
+    submodulo = _SUBMODULOS.get(nome)
+    if submodulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+    valor = getattr(importlib.import_module(f'.{submodulo}', __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,9 +8,59 @@ de escrita do mesmo nome.
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Optional, List
 from Levenshtein import distance
 
+# Import config with fallback for testing
+try:
+    from ..config import TABELA_ACENTOS, MARCAS_ACENTUACAO_RX
+except ImportError:
+    # Fallback for direct testing
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+    from config import TABELA_ACENTOS, MARCAS_ACENTUACAO_RX
+
+
+def remover_acentos(texto: str) -> str:
+    """
+    Remove acentos de um texto.
+    
+    As letras acentuadas mais comuns são trocadas de uma só vez com
+    str.translate. Se o resultado já for ASCII (caso de quase todos os nomes
+    em português) não há mais acentos a remover; caso contrário ele passa
+    pela decomposição Unicode (NFD), descartando as marcas de acentuação
+    (os diacríticos combinantes comuns com uma única expressão regular, e
+    as demais marcas caractere a caractere apenas se ainda houver algum
+    caractere fora do ASCII).
+    
+    Args:
+        texto: Texto a ser processado
+        
+    Returns:
+        Texto sem acentos
+        
+    Examples:
+        >>> remover_acentos("São Paulo")
+        'Sao Paulo'
+        >>> remover_acentos("Grêmio")
+        'Gremio'
+    """
+    texto = texto.translate(TABELA_ACENTOS)
+    if texto.isascii():
+        return texto
+    
+    # Verificação rápida (Quick Check): evita recriar o texto se ele já estiver decomposto
+    if not unicodedata.is_normalized('NFD', texto):
+        texto = unicodedata.normalize('NFD', texto)
+    
+    texto = MARCAS_ACENTUACAO_RX.sub('', texto)
+    if texto.isascii():
+        return texto
+    
+    return ''.join(char for char in texto if unicodedata.category(char) != 'Mn')
+
 
 def normalizar_nome_time(nome: str) -> str:
     """
@@ -40,8 +90,7 @@ def normalizar_nome_time(nome: str) -> str:
     nome = nome.strip()
     
     # Remove acentos
-    nome = unicodedata.normalize('NFD', nome)
-    nome = ''.join(char for char in nome if unicodedata.category(char) != 'Mn')
+    nome = remover_acentos(nome)
     
     # Converte para lowercase
     nome = nome.lower()
@@ -94,8 +143,7 @@ def normalizar_nome_participante(nome: str) -> str:
     nome = nome.strip()
     
     # Remove acentos
-    nome = unicodedata.normalize('NFD', nome)
-    nome = ''.join(char for char in nome if unicodedata.category(char) != 'Mn')
+    nome = remover_acentos(nome)
     
     # Remove espaços e caracteres especiais, mantendo apenas letras e números
     nome = re.sub(r'[^a-zA-Z0-9]', '', nome)
@@ -105,11 +153,14 @@ def normalizar_nome_participante(nome: str) -> str:
     return nome
 
 
+@lru_cache(maxsize=2048)
 def normalizar_nome_campeonato(nome: str) -> str:
     """
     Normaliza nome de campeonato para formato de diretório.
     
     Remove ou substitui caracteres problemáticos, mantendo legibilidade.
+    Os mesmos nomes são normalizados por vários scripts, então o resultado
+    (que depende apenas do nome) é guardado em cache.
     
     Args:
         nome: Nome do campeonato a ser normalizado
@@ -132,8 +183,7 @@ def normalizar_nome_campeonato(nome: str) -> str:
     nome = nome.strip()
     
     # Remove acentos
-    nome = unicodedata.normalize('NFD', nome)
-    nome = ''.join(char for char in nome if unicodedata.category(char) != 'Mn')
+    nome = remover_acentos(nome)
     
     # Substitui caracteres problemáticos por hífens
     nome = re.sub(r'[/\\:*?"<>|]', '-', nome)
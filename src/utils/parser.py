@@ -11,7 +11,7 @@ from datetime import datetime
 
 # Import config and normalization with fallback for testing
 try:
-    from ..config import FORMATOS_PLACAR
+    from ..config import FORMATOS_PLACAR, FORMATOS_PLACAR_RX
     from .normalizacao import normalizar_nome_time, encontrar_time_similar
 except ImportError:
     # Fallback for direct testing
@@ -19,7 +19,7 @@ except ImportError:
     import os
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
     try:
-        from config import FORMATOS_PLACAR
+        from config import FORMATOS_PLACAR, FORMATOS_PLACAR_RX
         from normalizacao import normalizar_nome_time, encontrar_time_similar
     except ImportError:
         # Define constants locally if config is not available
@@ -29,6 +29,7 @@ except ImportError:
             r'(.+?)\s+(\d+)\s*:\s*(\d+)\s+(.+)',      # "Time1 2:1 Time2"
             r'(.+?)\s*\(\s*(\d+)\s*\)\s*x\s*\(\s*(\d+)\s*\)\s*(.+)'  # "Time1 (2) x (1) Time2"
         ]
+        FORMATOS_PLACAR_RX = [re.compile(p, re.IGNORECASE) for p in FORMATOS_PLACAR]
         
         def normalizar_nome_time(nome):
             """Fallback normalization function"""
@@ -170,14 +171,6 @@ def extrair_palpites(texto: str) -> List[Dict[str, Any]]:
     palpites = []
     linhas = texto.split('\n')
     
-    # Padrões para diferentes formatos de placar
-    padroes_placar = [
-        r'(.+?)\s+(\d+)\s*x\s*(\d+)\s+(.+)',      # "Time1 2x1 Time2", "Time1 2 x 1 Time2"
-        r'(.+?)\s+(\d+)\s*-\s*(\d+)\s+(.+)',      # "Time1 2-1 Time2", "Time1 2 - 1 Time2"
-        r'(.+?)\s+(\d+)\s*:\s*(\d+)\s+(.+)',      # "Time1 2:1 Time2", "Time1 2 : 1 Time2"
-        r'(.+?)\s*\(\s*(\d+)\s*\)\s*x\s*\(\s*(\d+)\s*\)\s*(.+)',  # "Time1 (2) x (1) Time2"
-    ]
-    
     for linha in linhas:
         linha = linha.strip()
         if not linha:
@@ -193,8 +186,8 @@ def extrair_palpites(texto: str) -> List[Dict[str, Any]]:
         
         # Tentar cada padrão de placar
         palpite_encontrado = False
-        for padrao in padroes_placar:
-            match = re.match(padrao, linha, re.IGNORECASE)
+        for padrao in FORMATOS_PLACAR_RX:
+            match = padrao.match(linha)
             if match:
                 mandante = match.group(1).strip()
                 gols_mandante = int(match.group(2))
@@ -365,15 +358,8 @@ def identificar_apostas_extras(texto: str) -> List[Dict[str, Any]]:
                 palpite_texto = match.group(2).strip()
                 
                 # Extrair palpite da parte após os dois pontos usando padrões de placar
-                padroes_placar = [
-                    r'(.+?)\s+(\d+)\s*x\s*(\d+)\s+(.+)',      # "Time1 2x1 Time2"
-                    r'(.+?)\s+(\d+)\s*-\s*(\d+)\s+(.+)',      # "Time1 2-1 Time2"
-                    r'(.+?)\s+(\d+)\s*:\s*(\d+)\s+(.+)',      # "Time1 2:1 Time2"
-                    r'(.+?)\s*\(\s*(\d+)\s*\)\s*x\s*\(\s*(\d+)\s*\)\s*(.+)'  # "Time1 (2) x (1) Time2"
-                ]
-                
-                for padrao in padroes_placar:
-                    match_placar = re.match(padrao, palpite_texto, re.IGNORECASE)
+                for padrao in FORMATOS_PLACAR_RX:
+                    match_placar = padrao.match(palpite_texto)
                     if match_placar:
                         mandante = match_placar.group(1).strip()
                         gols_mandante = int(match_placar.group(2))
@@ -399,15 +385,8 @@ def identificar_apostas_extras(texto: str) -> List[Dict[str, Any]]:
             palpite_texto = match.group(2).strip()
             
             # Extrair palpite usando padrões de placar
-            padroes_placar = [
-                r'(.+?)\s+(\d+)\s*x\s*(\d+)\s+(.+)',      # "Time1 2x1 Time2"
-                r'(.+?)\s+(\d+)\s*-\s*(\d+)\s+(.+)',      # "Time1 2-1 Time2"
-                r'(.+?)\s+(\d+)\s*:\s*(\d+)\s+(.+)',      # "Time1 2:1 Time2"
-                r'(.+?)\s*\(\s*(\d+)\s*\)\s*x\s*\(\s*(\d+)\s*\)\s*(.+)'  # "Time1 (2) x (1) Time2"
-            ]
-            
-            for padrao in padroes_placar:
-                match_placar = re.match(padrao, palpite_texto, re.IGNORECASE)
+            for padrao in FORMATOS_PLACAR_RX:
+                match_placar = padrao.match(palpite_texto)
                 if match_placar:
                     mandante = match_placar.group(1).strip()
                     gols_mandante = int(match_placar.group(2))
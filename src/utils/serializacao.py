@@ -0,0 +1,159 @@
+"""
+Módulo de leitura e escrita de arquivos JSON para o Sistema de Controle de Bolão
+
+Usa orjson quando disponível, que faz o parse e a serialização em C e
+escreve UTF-8 diretamente, e recorre ao módulo json da biblioteca padrão
+caso contrário. Em ambos os casos o arquivo gerado usa indentação de 2
+espaços e preserva caracteres acentuados, no mesmo formato de json.dump
+com indent=2 e ensure_ascii=False. Arquivos lidos apenas por programas
+(ex: backups) podem ser gravados em formato compacto, sem espaços nem
+quebras de linha. Arquivos que não podem ficar corrompidos por uma
+interrupção no meio da gravação (ex: regras.json) podem ser gravados de
+forma atômica, em um arquivo temporário que substitui o original.
+
+Leituras parciais (ex: contar rodadas de um palpites.json) podem usar
+iterar_itens_json, que percorre o arquivo sob demanda com ijson quando
+disponível.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def serializar_json(dados: Any, compacto: bool = False) -> bytes:
+    """
+    Serializa dados para JSON codificado em UTF-8.
+
+    Args:
+        dados: Estrutura a ser serializada
+        compacto: Se True, gera o documento em uma única linha, sem espaços
+            entre os elementos; caso contrário usa indentação de 2 espaços
+
+    Returns:
+        Bytes do documento JSON
+    """
+    if orjson is not None:
+        if compacto:
+            return orjson.dumps(dados, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps(dados, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    if compacto:
+        return json.dumps(dados, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(dados, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def desserializar_json(conteudo: Union[bytes, str]) -> Any:
+    """
+    Converte o conteúdo de um documento JSON em estruturas Python.
+
+    Args:
+        conteudo: Documento JSON em bytes (UTF-8) ou texto
+
+    Returns:
+        Estrutura decodificada
+
+    Raises:
+        json.JSONDecodeError: Se o conteúdo não for JSON válido
+    """
+    if orjson is not None:
+        return orjson.loads(conteudo)
+
+    return json.loads(conteudo)
+
+
+def carregar_json(caminho: Path) -> Any:
+    """
+    Lê e decodifica um arquivo JSON.
+
+    Args:
+        caminho: Caminho para o arquivo
+
+    Returns:
+        Estrutura decodificada
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido
+        json.JSONDecodeError: Se o conteúdo não for JSON válido
+    """
+    with open(caminho, 'rb') as f:
+        return desserializar_json(f.read())
+
+
+def iterar_itens_json(caminho: Path, prefixo: str) -> Iterator[Any]:
+    """
+    Percorre os itens de um arquivo JSON a partir de um prefixo no formato do ijson.
+
+    Com ijson instalado os itens são lidos sob demanda, sem carregar o documento
+    inteiro em memória; caso contrário o arquivo é carregado e percorrido.
+
+    Args:
+        caminho: Caminho para o arquivo
+        prefixo: Caminho até os itens, ex: "palpites.item" para cada elemento
+            da lista "palpites"
+
+    Yields:
+        Cada item encontrado no prefixo
+    """
+    if ijson is not None:
+        with open(caminho, 'rb') as f:
+            yield from ijson.items(f, prefixo)
+        return
+
+    niveis = [carregar_json(caminho)]
+    for chave in prefixo.split('.') if prefixo else []:
+        if chave == 'item':
+            niveis = [item for valor in niveis if isinstance(valor, list) for item in valor]
+        else:
+            niveis = [valor[chave] for valor in niveis if isinstance(valor, dict) and chave in valor]
+
+    yield from niveis
+
+
+def salvar_json(caminho: Path, dados: Any, compacto: bool = False, atomico: bool = False) -> None:
+    """
+    Serializa e grava dados em um arquivo JSON.
+
+    Args:
+        caminho: Caminho para o arquivo
+        dados: Estrutura a ser gravada
+        compacto: Se True, grava o documento sem indentação (ver serializar_json)
+        atomico: Se True, grava em um arquivo temporário no mesmo diretório,
+            sincroniza com o disco e o renomeia sobre o destino, de modo que
+            o arquivo nunca fique parcialmente gravado
+
+    Raises:
+        OSError: Se o arquivo não puder ser gravado
+        TypeError: Se os dados não forem serializáveis
+    """
+    conteudo = serializar_json(dados, compacto)
+
+    if not atomico:
+        with open(caminho, 'wb') as f:
+            f.write(conteudo)
+        return
+
+    caminho_temporario = os.fspath(caminho) + ".tmp"
+    try:
+        with open(caminho_temporario, 'wb') as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(caminho_temporario, caminho)
+    except BaseException:
+        try:
+            os.remove(caminho_temporario)
+        except OSError:
+            pass
+        raise
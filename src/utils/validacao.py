@@ -8,13 +8,19 @@ campos obrigatórios, formatos de data, placares e referências entre arquivos.
 import json
 import re
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
 from pathlib import Path
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 # Import config with fallback for testing
 try:
     from ..config import (
         FORMATOS_DATA, 
+        FORMATO_DATA_RX,
         MAX_GOLS_POR_TIME, 
         MIN_GOLS_POR_TIME,
         CAMPEONATOS_DIR
@@ -26,6 +32,7 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
     from config import (
         FORMATOS_DATA, 
+        FORMATO_DATA_RX,
         MAX_GOLS_POR_TIME, 
         MIN_GOLS_POR_TIME,
         CAMPEONATOS_DIR
@@ -326,6 +333,79 @@ def _validar_estrutura_jogo_palpite(jogo_palpite: Dict[str, Any], rodada: int, j
     return erros
 
 
+# Campos e tipos do regras.json, montados uma única vez na importação do módulo
+_CAMPOS_OBRIGATORIOS_REGRAS = ("campeonato", "temporada", "versao", "regras")
+_CAMPOS_TEXTO_REGRAS = ("campeonato", "temporada", "versao")
+_CAMPOS_OBRIGATORIOS_REGRA = ("descricao", "codigo")
+
+# (campo, tipos aceitos, descrição do tipo na mensagem de erro) de cada regra de pontuação
+_TIPOS_CAMPOS_REGRA = (
+    ("pontos", (int, float), "um número"),
+    ("pontos_base", (int, float), "um número"),
+    ("descricao", str, "uma string"),
+    ("codigo", str, "uma string"),
+    ("bonus_divisor", bool, "um booleano"),
+)
+
+
+if msgspec is not None:
+    class _RegraPontuacao(msgspec.Struct):
+        """Modelo de uma regra de pontuação do regras.json."""
+        descricao: str
+        codigo: str
+        pontos: Union[int, float] = msgspec.UNSET
+        pontos_base: Union[int, float] = msgspec.UNSET
+        bonus_divisor: bool = msgspec.UNSET
+
+    class _EstruturaRegras(msgspec.Struct):
+        """Modelo do arquivo regras.json."""
+        campeonato: str
+        temporada: str
+        versao: str
+        regras: Dict[str, _RegraPontuacao]
+        observacoes: List[str] = msgspec.UNSET
+        data_criacao: Any = msgspec.UNSET
+
+
+def _estrutura_regras_valida_rapida(dados: Any) -> bool:
+    """
+    Confere a estrutura do regras.json com o modelo msgspec, quando disponível
+    
+    A conversão do msgspec é feita em C e é mais restrita que a validação
+    manual (ex: não aceita booleanos em 'pontos'), então um resultado False
+    não significa estrutura inválida: apenas que a validação manual deve
+    decidir e montar as mensagens de erro.
+    
+    Args:
+        dados: Dados lidos do regras.json
+        
+    Returns:
+        True se a estrutura for certamente válida
+    """
+    if msgspec is None or not isinstance(dados, dict):
+        return False
+    
+    # O msgspec aceita qualquer mapeamento ou sequência; a validação manual exige dict e list
+    regras = dados.get("regras")
+    if not isinstance(regras, dict) or not all(isinstance(regra, dict) for regra in regras.values()):
+        return False
+    if "observacoes" in dados and not isinstance(dados["observacoes"], list):
+        return False
+    
+    try:
+        estrutura = msgspec.convert(dados, _EstruturaRegras)
+    except msgspec.ValidationError:
+        return False
+    
+    if not estrutura.regras:
+        return False
+    for regra in estrutura.regras.values():
+        if regra.pontos is msgspec.UNSET and regra.pontos_base is msgspec.UNSET:
+            return False
+    
+    return estrutura.data_criacao is msgspec.UNSET or validar_data(estrutura.data_criacao)[0]
+
+
 def validar_estrutura_regras(dados: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Valida estrutura do arquivo regras.json
@@ -336,24 +416,20 @@ def validar_estrutura_regras(dados: Dict[str, Any]) -> Tuple[bool, List[str]]:
     Returns:
         Tupla (sucesso, lista_de_erros)
     """
+    if _estrutura_regras_valida_rapida(dados):
+        return True, []
+    
     erros = []
     
     # Campos obrigatórios no nível raiz
-    campos_obrigatorios = ["campeonato", "temporada", "versao", "regras"]
-    
-    for campo in campos_obrigatorios:
+    for campo in _CAMPOS_OBRIGATORIOS_REGRAS:
         if campo not in dados:
             erros.append(f"Campo obrigatório '{campo}' ausente na estrutura de regras")
     
     # Validar tipos dos campos
-    if "campeonato" in dados and not isinstance(dados["campeonato"], str):
-        erros.append("Campo 'campeonato' deve ser uma string")
-    
-    if "temporada" in dados and not isinstance(dados["temporada"], str):
-        erros.append("Campo 'temporada' deve ser uma string")
-    
-    if "versao" in dados and not isinstance(dados["versao"], str):
-        erros.append("Campo 'versao' deve ser uma string")
+    for campo in _CAMPOS_TEXTO_REGRAS:
+        if campo in dados and not isinstance(dados[campo], str):
+            erros.append(f"Campo '{campo}' deve ser uma string")
     
     # Validar data de criação (opcional)
     if "data_criacao" in dados:
@@ -393,13 +469,6 @@ def _validar_estrutura_regras_pontuacao(regras: Dict[str, Any]) -> List[str]:
     """
     erros = []
     
-    # Regras esperadas (pelo menos algumas devem estar presentes)
-    regras_esperadas = [
-        "resultado_exato", "vitoria_gols_um_time", "vitoria_diferenca_gols",
-        "vitoria_soma_gols", "apenas_vitoria", "apenas_empate",
-        "gols_um_time", "soma_gols", "resultado_inverso", "palpite_ausente"
-    ]
-    
     if len(regras) == 0:
         erros.append("Nenhuma regra de pontuação definida")
         return erros
@@ -410,33 +479,19 @@ def _validar_estrutura_regras_pontuacao(regras: Dict[str, Any]) -> List[str]:
             erros.append(f"Regra '{nome_regra}' deve ser um dicionário")
             continue
         
-        # Campos obrigatórios para cada regra
-        campos_obrigatorios = ["descricao", "codigo"]
-        
         # Verificar se tem pontos ou pontos_base
         if "pontos" not in regra and "pontos_base" not in regra:
             erros.append(f"Regra '{nome_regra}' deve ter campo 'pontos' ou 'pontos_base'")
         
-        for campo in campos_obrigatorios:
+        # Campos obrigatórios para cada regra
+        for campo in _CAMPOS_OBRIGATORIOS_REGRA:
             if campo not in regra:
                 erros.append(f"Campo obrigatório '{campo}' ausente na regra '{nome_regra}'")
         
         # Validar tipos
-        if "pontos" in regra and not isinstance(regra["pontos"], (int, float)):
-            erros.append(f"Campo 'pontos' da regra '{nome_regra}' deve ser um número")
-        
-        if "pontos_base" in regra and not isinstance(regra["pontos_base"], (int, float)):
-            erros.append(f"Campo 'pontos_base' da regra '{nome_regra}' deve ser um número")
-        
-        if "descricao" in regra and not isinstance(regra["descricao"], str):
-            erros.append(f"Campo 'descricao' da regra '{nome_regra}' deve ser uma string")
-        
-        if "codigo" in regra and not isinstance(regra["codigo"], str):
-            erros.append(f"Campo 'codigo' da regra '{nome_regra}' deve ser uma string")
-        
-        # Validar campos específicos
-        if "bonus_divisor" in regra and not isinstance(regra["bonus_divisor"], bool):
-            erros.append(f"Campo 'bonus_divisor' da regra '{nome_regra}' deve ser um booleano")
+        for campo, tipo, descricao_tipo in _TIPOS_CAMPOS_REGRA:
+            if campo in regra and not isinstance(regra[campo], tipo):
+                erros.append(f"Campo '{campo}' da regra '{nome_regra}' deve ser {descricao_tipo}")
     
     return erros
 
@@ -476,6 +531,52 @@ def validar_placar(gols_mandante: Any, gols_visitante: Any) -> Tuple[bool, str]:
     return True, ""
 
 
+def interpretar_data(data_str: str) -> datetime:
+    """
+    Converte string em datetime usando os formatos de FORMATOS_DATA
+    
+    As datas com campos de dois dígitos são reconhecidas por uma única
+    expressão regular, sem tentar um strptime por formato. Os demais casos
+    aceitos por strptime (ex: dia ou mês com um dígito) continuam sendo
+    tentados formato a formato.
+    
+    Args:
+        data_str: String com data
+        
+    Returns:
+        Data e hora correspondentes
+        
+    Raises:
+        ValueError: Se a string não estiver em nenhum dos formatos aceitos
+    """
+    match = FORMATO_DATA_RX.fullmatch(data_str)
+    if match:
+        campos = match.groupdict()
+        if campos['ano'] is not None:
+            data = (campos['ano'], campos['mes'], campos['dia'])
+            hora = (campos['hora'] or campos['hora_t'], campos['minuto'] or campos['minuto_t'],
+                    campos['segundo'] or '0')
+            microssegundos = int(campos['fracao'].ljust(6, '0')) if campos['fracao'] else 0
+        else:
+            data = (campos['ano_br'], campos['mes_br'], campos['dia_br'])
+            hora = (campos['hora_br'], campos['minuto_br'], '0')
+            microssegundos = 0
+        
+        try:
+            return datetime(*map(int, data + hora), microssegundos)
+        except ValueError:
+            # Valores fora do intervalo (ex: mês 13) seguem para strptime
+            pass
+    
+    for formato in FORMATOS_DATA:
+        try:
+            return datetime.strptime(data_str, formato)
+        except ValueError:
+            continue
+    
+    raise ValueError(f"Data '{data_str}' não está em nenhum dos formatos aceitos")
+
+
 def validar_data(data_str: str) -> Tuple[bool, str]:
     """
     Valida que string está em formato de data válido
@@ -492,13 +593,11 @@ def validar_data(data_str: str) -> Tuple[bool, str]:
     if not data_str.strip():
         return False, "Data não pode estar vazia"
     
-    # Tentar cada formato de data configurado
-    for formato in FORMATOS_DATA:
-        try:
-            datetime.strptime(data_str, formato)
-            return True, ""
-        except ValueError:
-            continue
+    try:
+        interpretar_data(data_str)
+        return True, ""
+    except ValueError:
+        pass
     
     # Se chegou aqui, nenhum formato funcionou
     formatos_str = ", ".join(FORMATOS_DATA)
@@ -15,13 +15,18 @@ from hypothesis import given, settings, strategies as st
 from src.scripts.criar_participantes import (
     criar_participantes,
     processar_lista_participantes,
+    classificar_participantes,
     criar_estrutura_basica_palpites,
-    gerar_codigo_participante
+    gerar_codigo_participante,
+    ler_nomes_planilha_excel,
+    criar_modelo_palpites,
+    preencher_modelo_palpites
 )
 from src.scripts.criar_campeonato import criar_campeonato
 from src.config import ARQUIVO_PALPITES
 from src.utils.validacao import validar_estrutura_palpites
 from src.utils.normalizacao import normalizar_nome_participante
+from src.utils.serializacao import serializar_json
 
 
 # Generators para property-based testing
@@ -347,6 +352,25 @@ class TestParticipantCreationHelpers:
         assert estrutura["temporada"] == temporada
         assert estrutura["palpites"] == []
     
+    @given(
+        st.text(max_size=30),
+        st.text(max_size=30),
+        st.text(max_size=30),
+        st.text(max_size=10)
+    )
+    @settings(max_examples=100)
+    def test_modelo_palpites_equivale_a_estrutura_basica(self, nome_participante, codigo,
+                                                         nome_campeonato, temporada):
+        """
+        Testa que preencher o modelo de palpites.json produz exatamente a
+        serialização da estrutura básica, para quaisquer nomes.
+        """
+        modelo = criar_modelo_palpites(nome_campeonato, temporada)
+        
+        assert preencher_modelo_palpites(modelo, nome_participante, codigo) == serializar_json(
+            criar_estrutura_basica_palpites(nome_participante, codigo, nome_campeonato, temporada)
+        )
+    
     @settings(max_examples=100)
     @given(st.integers(min_value=1, max_value=100))
     def test_gerar_codigo_participante_format(self, _):
@@ -363,6 +387,19 @@ class TestParticipantCreationHelpers:
         assert codigo.isalnum()
         assert all(c.isupper() or c.isdigit() for c in codigo)
     
+    @settings(max_examples=20)
+    @given(st.integers(min_value=1, max_value=500))
+    def test_gerar_codigo_participante_unico_no_lote(self, quantidade):
+        """
+        Testa que códigos gerados com o mesmo conjunto de códigos usados
+        nunca se repetem.
+        """
+        codigos_usados = set()
+        codigos = [gerar_codigo_participante(codigos_usados) for _ in range(quantidade)]
+        
+        assert len(set(codigos)) == quantidade
+        assert codigos_usados == set(codigos)
+    
     @given(valid_participant_names())
     @settings(max_examples=50)
     def test_processar_lista_participantes_uniqueness(self, participant_names):
@@ -389,6 +426,55 @@ class TestParticipantCreationHelpers:
             assert nome_original and nome_original.strip(), f"Nome original não deve estar vazio: '{nome_original}'"
             assert nome_normalizado and nome_normalizado.strip(), f"Nome normalizado não deve estar vazio: '{nome_normalizado}'"
 
+    
+    @given(valid_participant_names(), valid_participant_names())
+    @settings(max_examples=50)
+    def test_classificar_participantes_separa_existentes(self, participant_names, existing_names):
+        """
+        Testa que a classificação em uma passagem equivale a remover os
+        duplicados e depois separar os participantes já existentes.
+        """
+        existentes = {normalizar_nome_participante(nome) for nome in existing_names}
+        
+        novos, ja_existem, duplicados = classificar_participantes(participant_names, existentes)
+        nomes_processados, duplicados_esperados = processar_lista_participantes(participant_names)
+        
+        assert duplicados == duplicados_esperados
+        assert novos == [par for par in nomes_processados if par[1] not in existentes]
+        assert ja_existem == [par for par in nomes_processados if par[1] in existentes]
+    
+    @given(valid_participant_names(), st.integers(min_value=0, max_value=3))
+    @settings(max_examples=20, deadline=None)
+    def test_ler_nomes_planilha_excel(self, participant_names, coluna):
+        """
+        Testa que todos os nomes da coluna indicada são lidos da planilha,
+        na ordem, ignorando as demais colunas e as células vazias.
+        """
+        openpyxl = pytest.importorskip("openpyxl")
+        
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        cabecalho = [f"Coluna{i}" for i in range(4)]
+        cabecalho[coluna] = "Apostador"
+        sheet.append(cabecalho)
+        for nome in participant_names:
+            linha = ["x"] * 4
+            linha[coluna] = f"  {nome}  "
+            sheet.append(linha)
+            sheet.append(["x"] * coluna)  # célula da coluna de nomes vazia
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            caminho = Path(temp_dir) / "participantes.xlsx"
+            workbook.save(caminho)
+            
+            assert ler_nomes_planilha_excel(caminho, "apostador") == participant_names
+            
+            with pytest.raises(ValueError):
+                ler_nomes_planilha_excel(caminho, "Inexistente")
+        finally:
+            shutil.rmtree(temp_dir)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
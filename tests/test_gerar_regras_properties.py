@@ -16,8 +16,10 @@ from src.scripts.gerar_regras import (
     gerar_regras,
     criar_estrutura_regras_completa,
     carregar_template_regras_padrao,
-    escrever_arquivo_regras
+    escrever_arquivo_regras,
+    obter_dados_campeonato_existente
 )
+import src.scripts.gerar_regras
 from src.scripts.criar_campeonato import criar_campeonato
 from src.config import REGRAS_PONTUACAO_PADRAO, ARQUIVO_REGRAS
 from src.utils.validacao import validar_estrutura_regras
@@ -368,6 +370,58 @@ class TestRulesGenerationHelpers:
             if "bonus_divisor" in regra:
                 assert isinstance(regra["bonus_divisor"], bool)
 
+    
+    @given(st.dictionaries(
+        st.sampled_from(["campeonato", "temporada", "rodadas"]),
+        st.none() | st.integers() | st.sampled_from(["", "Brasileirão", "2025"]) | st.lists(st.integers(), max_size=3),
+    ))
+    @settings(max_examples=50, deadline=None)
+    def test_obter_dados_campeonato_com_e_sem_msgspec(self, dados_tabela):
+        """
+        Para qualquer tabela.json, os dados do campeonato obtidos pelo cabeçalho
+        decodificado com msgspec, lido ou mapeado em memória, devem ser os
+        mesmos da leitura completa.
+        """
+        if src.scripts.gerar_regras.msgspec is None:
+            pytest.skip("msgspec não instalado")
+        
+        temp_dir = tempfile.mkdtemp()
+        msgspec_original = src.scripts.gerar_regras.msgspec
+        limite_original = src.scripts.gerar_regras.LIMITE_MMAP_TABELA
+        try:
+            caminho_campeonato = Path(temp_dir)
+            (caminho_campeonato / "Tabela").mkdir()
+            with open(caminho_campeonato / "Tabela" / "tabela.json", 'w', encoding='utf-8') as f:
+                json.dump(dados_tabela, f, ensure_ascii=False)
+            
+            resultado_msgspec = obter_dados_campeonato_existente(caminho_campeonato)
+            src.scripts.gerar_regras.LIMITE_MMAP_TABELA = 0
+            resultado_mmap = obter_dados_campeonato_existente(caminho_campeonato)
+            src.scripts.gerar_regras.msgspec = None
+            resultado_completo = obter_dados_campeonato_existente(caminho_campeonato)
+            
+            assert resultado_msgspec == resultado_completo
+            assert resultado_mmap == resultado_completo
+        finally:
+            src.scripts.gerar_regras.msgspec = msgspec_original
+            src.scripts.gerar_regras.LIMITE_MMAP_TABELA = limite_original
+            shutil.rmtree(temp_dir)
+    
+    @given(st.lists(st.sampled_from([
+        '--campeonato', '--campeonato=copa', '--campeonato=', '--sobrescrever',
+        '--camp', '--help', '-h', '-x', 'copa', 'serie a'
+    ]), max_size=5))
+    @settings(max_examples=200)
+    def test_argumentos_simples_equivalem_ao_argparse(self, argv):
+        """
+        Para qualquer linha de comando interpretada sem o argparse, o resultado
+        deve ser o mesmo que o argparse produziria.
+        """
+        argumentos = src.scripts.gerar_regras._interpretar_argumentos_simples(argv)
+        
+        if argumentos is not None:
+            args = src.scripts.gerar_regras._criar_parser().parse_args(argv)
+            assert argumentos == (args.campeonato, args.sobrescrever)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -18,7 +18,9 @@ from src.scripts.importar_palpites import (
     validar_palpites_contra_tabela,
     normalizar_palpites_times,
     salvar_palpites_participante,
-    carregar_palpites_participante
+    carregar_palpites_participante,
+    dividir_blocos_palpites,
+    ler_arquivo_palpite
 )
 
 
@@ -567,7 +569,47 @@ class TestImportarPalpitesProperties:
                         break
                 
                 assert found_new_prediction, f"Novo palpite não encontrado na rodada alvo {target_round}"
-
+    
+    @given(
+        st.lists(st.text(st.characters(blacklist_categories=('Cs',)), max_size=30), max_size=6),
+        st.sampled_from(['---', '***', '\n\n', 'çã'])
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_blocos_arquivo_iguais_aos_blocos_do_texto(self, partes, separador):
+        """
+        Para qualquer texto com palpites separados por um marcador, inclusive
+        com quebras de linha CRLF, os blocos lidos do arquivo devem ser iguais
+        aos obtidos dividindo o texto lido em modo texto.
+        """
+        texto = separador.join(partes)
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            arquivo = Path(temp_dir) / "conversa.txt"
+            arquivo.write_bytes(texto.encode('utf-8'))
+            
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                esperado = dividir_blocos_palpites(f.read(), separador)
+            
+            assert dividir_blocos_palpites(ler_arquivo_palpite(arquivo), separador) == esperado
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_blocos_arquivo_crlf(self):
+        """
+        Uma conversa exportada com quebras de linha CRLF deve ser dividida nos
+        mesmos blocos da versão com LF.
+        """
+        temp_dir = tempfile.mkdtemp()
+        try:
+            arquivo = Path(temp_dir) / "conversa.txt"
+            arquivo.write_bytes(b'Joao\r\n1x0\r\n\r\nMaria\r\n2x2\r\n')
+            
+            blocos = dividir_blocos_palpites(ler_arquivo_palpite(arquivo), '\n\n')
+            
+            assert blocos == ['Joao\n1x0', 'Maria\n2x2']
+        finally:
+            shutil.rmtree(temp_dir)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
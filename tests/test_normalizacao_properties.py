@@ -5,9 +5,11 @@ Este módulo contém property-based tests usando hypothesis para validar
 as propriedades de normalização definidas no design document.
 """
 
+import unicodedata
 import pytest
 from hypothesis import given, settings, strategies as st
 from src.utils.normalizacao import (
+    remover_acentos,
     normalizar_nome_time,
     normalizar_nome_participante,
     normalizar_nome_campeonato
@@ -235,6 +237,20 @@ class TestNormalizationProperties:
         if "  " in championship_name:  # Se havia espaços múltiplos
             assert "  " not in normalized, "Espaços múltiplos devem ser normalizados"
 
+    @given(st.text(max_size=30) | st.text(alphabet="áàãâäéèêëíìîïóòõôöúùûüçñÁÀÃÂÉÊÍÓÔÕÚÇÑ /-_aZ\u0301\u0327", max_size=30))
+    @settings(max_examples=200)
+    def test_remover_acentos_equivale_a_decomposicao(self, texto):
+        """
+        Para qualquer texto, remover_acentos deve produzir o mesmo resultado
+        que decompor o texto (NFD) e descartar as marcas de acentuação.
+        """
+        esperado = ''.join(
+            char for char in unicodedata.normalize('NFD', texto)
+            if unicodedata.category(char) != 'Mn'
+        )
+        
+        assert remover_acentos(texto) == esperado
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
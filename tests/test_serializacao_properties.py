@@ -0,0 +1,127 @@
+"""
+Testes de propriedade para o módulo de serialização JSON.
+
+Verifica que os arquivos gravados mantêm o formato de json.dump com
+indent=2 e ensure_ascii=False, independentemente do backend utilizado.
+"""
+
+import json
+import shutil
+import pytest
+import tempfile
+from pathlib import Path
+from hypothesis import given, settings, strategies as st
+import src.utils.serializacao
+from src.utils.serializacao import (
+    serializar_json,
+    desserializar_json,
+    carregar_json,
+    iterar_itens_json,
+    salvar_json
+)
+
+
+# Valores JSON sem floats: a representação textual de floats pode variar entre backends
+valores_json = st.recursive(
+    st.none() | st.booleans() | st.integers(min_value=-2**53, max_value=2**53) | st.text(max_size=20),
+    lambda filhos: st.lists(filhos, max_size=5) | st.dictionaries(st.text(max_size=10), filhos, max_size=5),
+    max_leaves=20
+)
+
+
+class TestSerializacaoProperties:
+    """Testes de propriedade para leitura e escrita de JSON."""
+
+    @given(valores_json)
+    @settings(max_examples=100)
+    def test_formato_compativel_com_json_dump(self, dados):
+        """
+        Para qualquer estrutura JSON, o conteúdo serializado deve ser idêntico
+        ao produzido por json.dumps com indent=2 e ensure_ascii=False.
+        """
+        esperado = json.dumps(dados, indent=2, ensure_ascii=False).encode('utf-8')
+
+        assert serializar_json(dados) == esperado
+
+    @given(valores_json)
+    @settings(max_examples=100)
+    def test_formato_compacto(self, dados):
+        """
+        Para qualquer estrutura JSON, o conteúdo compacto deve ser idêntico ao
+        produzido por json.dumps sem espaços entre os elementos.
+        """
+        esperado = json.dumps(dados, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        assert serializar_json(dados, compacto=True) == esperado
+
+    @given(valores_json)
+    @settings(max_examples=100)
+    def test_ida_e_volta(self, dados):
+        """
+        Para qualquer estrutura JSON, desserializar o conteúdo serializado
+        deve devolver a estrutura original.
+        """
+        assert desserializar_json(serializar_json(dados)) == dados
+
+    @given(valores_json)
+    @settings(max_examples=20, deadline=None)
+    def test_salvar_e_carregar_arquivo(self, dados):
+        """
+        Para qualquer estrutura JSON, o arquivo gravado deve ser legível pelo
+        módulo json da biblioteca padrão e por carregar_json.
+        """
+        temp_dir = tempfile.mkdtemp()
+        try:
+            caminho = Path(temp_dir) / "dados.json"
+            salvar_json(caminho, dados)
+
+            with open(caminho, 'r', encoding='utf-8') as f:
+                assert json.load(f) == dados
+
+            assert carregar_json(caminho) == dados
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @given(valores_json, valores_json)
+    @settings(max_examples=20, deadline=None)
+    def test_salvar_atomico_substitui_arquivo(self, anterior, dados):
+        """
+        Para quaisquer estruturas JSON, a gravação atômica deve substituir o
+        conteúdo anterior sem deixar o arquivo temporário no diretório.
+        """
+        temp_dir = tempfile.mkdtemp()
+        try:
+            caminho = Path(temp_dir) / "dados.json"
+            salvar_json(caminho, anterior)
+            salvar_json(caminho, dados, atomico=True)
+
+            assert carregar_json(caminho) == dados
+            assert serializar_json(dados) == caminho.read_bytes()
+            assert [p.name for p in Path(temp_dir).iterdir()] == ["dados.json"]
+        finally:
+            shutil.rmtree(temp_dir)
+
+    @pytest.mark.parametrize("usar_ijson", [True, False])
+    @given(st.lists(st.dictionaries(st.text(max_size=10), valores_json, max_size=3), max_size=5))
+    @settings(max_examples=20, deadline=None)
+    def test_iterar_itens_json(self, usar_ijson, itens):
+        """
+        Para qualquer lista em "palpites", iterar_itens_json deve devolver os
+        mesmos itens com ou sem ijson disponível.
+        """
+        if usar_ijson and src.utils.serializacao.ijson is None:
+            pytest.skip("ijson não instalado")
+
+        ijson_original = src.utils.serializacao.ijson
+        if not usar_ijson:
+            src.utils.serializacao.ijson = None
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            caminho = Path(temp_dir) / "palpites.json"
+            salvar_json(caminho, {"apostador": "Teste", "palpites": itens})
+
+            assert list(iterar_itens_json(caminho, "palpites.item")) == itens
+        finally:
+            src.utils.serializacao.ijson = ijson_original
+            shutil.rmtree(temp_dir)
@@ -18,8 +18,11 @@ from src.utils.validacao import (
     validar_placar,
     validar_data,
     validar_id_jogo,
-    validar_participante
+    validar_participante,
+    interpretar_data
 )
+import src.utils.validacao
+from src.config import FORMATOS_DATA
 
 
 # Generators para property-based testing
@@ -114,6 +117,33 @@ def valid_regras_structure(draw):
     }
 
 
+@st.composite
+def mixed_regras_structure(draw):
+    """
+    Gera estruturas de regras.json válidas e inválidas, com campos ausentes
+    ou de tipo errado no nível raiz e em cada regra.
+    """
+    valores = st.sampled_from(["", "AR", "2025-01-01", "31/12/2024", 0, 12, 1.5, True, None, ["obs"], {}])
+    estrutura = {}
+    for campo in ["campeonato", "temporada", "versao", "data_criacao", "observacoes"]:
+        if draw(st.booleans()):
+            estrutura[campo] = draw(valores)
+    
+    if draw(st.integers(min_value=0, max_value=9)) > 0:
+        regras = {}
+        for i in range(draw(st.integers(min_value=0, max_value=3))):
+            regras[f"regra_{i}"] = {
+                campo: draw(valores)
+                for campo in ["descricao", "codigo", "pontos", "pontos_base", "bonus_divisor"]
+                if draw(st.booleans())
+            }
+        estrutura["regras"] = regras
+    else:
+        estrutura["regras"] = draw(valores)
+    
+    return estrutura
+
+
 @st.composite
 def invalid_regras_structure(draw):
     """
@@ -366,6 +396,27 @@ class TestValidationProperties:
         error_text = " ".join(errors).lower()
         assert missing_field.lower() in error_text, f"Erro deve mencionar campo ausente '{missing_field}': {errors}"
     
+    @given(mixed_regras_structure())
+    @settings(max_examples=200)
+    def test_validacao_msgspec_equivale_a_manual(self, dados):
+        """
+        Para qualquer estrutura de regras, o resultado de validar_estrutura_regras
+        deve ser o mesmo com ou sem o msgspec disponível.
+        """
+        if src.utils.validacao.msgspec is None:
+            pytest.skip("msgspec não instalado")
+        
+        resultado_msgspec = validar_estrutura_regras(dados)
+        
+        msgspec_original = src.utils.validacao.msgspec
+        src.utils.validacao.msgspec = None
+        try:
+            resultado_manual = validar_estrutura_regras(dados)
+        finally:
+            src.utils.validacao.msgspec = msgspec_original
+        
+        assert resultado_msgspec == resultado_manual
+    
     @given(valid_date_strings())
     @settings(max_examples=100)
     def test_property_41_date_format_validation_valid_dates(self, valid_date):
@@ -403,6 +454,34 @@ class TestValidationProperties:
         assert len(error_msg) > 0, f"Data inválida deve gerar mensagem de erro: '{invalid_date}'"
         assert invalid_date in error_msg or "formato" in error_msg.lower(), f"Mensagem deve mencionar formato ou data: {error_msg}"
     
+    @given(
+        st.datetimes(min_value=datetime(1000, 1, 1)) | st.datetimes().map(lambda dt: dt.replace(microsecond=0)),
+        st.sampled_from(FORMATOS_DATA),
+        st.text(alphabet="0123456789-/:TZ. ", max_size=26)
+    )
+    @settings(max_examples=200)
+    def test_interpretar_data_equivale_a_strptime(self, data, formato, texto):
+        """
+        Para datas formatadas em qualquer formato aceito, e para textos
+        arbitrários, interpretar_data deve concordar com a tentativa de
+        datetime.strptime formato a formato.
+        """
+        def referencia(data_str):
+            for fmt in FORMATOS_DATA:
+                try:
+                    return datetime.strptime(data_str, fmt)
+                except ValueError:
+                    continue
+            return None
+        
+        for data_str in (data.strftime(formato), texto):
+            esperado = referencia(data_str)
+            if esperado is None:
+                with pytest.raises(ValueError):
+                    interpretar_data(data_str)
+            else:
+                assert interpretar_data(data_str) == esperado
+    
     @given(st.integers())
     @settings(max_examples=100)
     def test_property_41_date_format_validation_non_strings(self, non_string_input):